@@ -2,6 +2,7 @@ from pathlib import Path
 from datetime import datetime
 import shutil
 from core.logger import app_logger
+from core.map_store import journal_path
 
 
 class BackupManager:
@@ -41,6 +42,10 @@ class BackupManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_dir / f"{map_path.stem}_{timestamp}.json"
         shutil.copy2(map_path, backup_file)
+        # changes not yet compacted into the file live in its journal
+        journal = journal_path(map_path)
+        if journal.exists():
+            shutil.copy2(journal, journal_path(backup_file))
 
         self._prune_old_backups(map_path.stem)
 
@@ -59,3 +64,6 @@ class BackupManager:
         )
         for old_backup in backups[self.max_backups:]:
             old_backup.unlink()
+            journal = journal_path(old_backup)
+            if journal.exists():
+                journal.unlink()
@@ -15,8 +15,10 @@ CLASS_TO_SPELL_ABILITY = {
 
 
 class CharacterCreationWindow(QWidget):
-    def __init__(self, api=None, base_path="core/data_/rulebook_json"):
+    def __init__(self, api=None, base_path="core/data_/rulebook_json", preloader=None):
         super().__init__()
+        if api is None and preloader is not None:
+            api = preloader.api
         if api is not None:
             self.api_handler = api
         else:
@@ -26,9 +28,19 @@ class CharacterCreationWindow(QWidget):
         self.speed_values = []
         self.races_names = []
         self.initUI()
+        if preloader is None:
+            self.load_classes()
+            self.load_languages()
+            self.load_races()
+            self.update_spells()
+        else:
+            # the window shows right away; each list fills in when its data arrives
+            preloader.when_loaded(("classes", "subclasses", "levels"), self._load_class_data)
+            preloader.when_loaded(("languages",), self.load_languages)
+            preloader.when_loaded(("races",), self.load_races)
+
+    def _load_class_data(self):
         self.load_classes()
-        self.load_languages()
-        self.load_races()
         self.update_spells()
 
     def initUI(self):
@@ -1,8 +1,10 @@
 import json
+import os
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from core.logger import app_logger
+from utils.string.slugify import slugify
 
 
 class APIError(Exception):
@@ -10,22 +12,125 @@ class APIError(Exception):
     pass
 
 
+class CategoryIndex:
+    """
+    Hash index over the entries of one SRD category.
+
+    Entries are found by their ``index`` slug, and through aliases by
+    name, slugified name and case-insensitive slug.
+
+    :param items: The category's entries, as loaded from its JSON file.
+    :type items: list
+    """
+
+    def __init__(self, items: Any):
+        self.items = items
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+        self.aliases: Dict[str, str] = {}
+        if not isinstance(items, list):
+            return
+        for entry in items:
+            if not isinstance(entry, dict):
+                continue
+            slug = entry.get("index")
+            name = entry.get("name")
+            if slug is None:
+                if not name:
+                    continue
+                slug = slugify(name)
+            self.by_slug.setdefault(slug, entry)
+            self.aliases.setdefault(slug.lower(), slug)
+            if name:
+                self.aliases.setdefault(name.lower(), slug)
+                self.aliases.setdefault(slugify(name), slug)
+
+    def resolve(self, key: str) -> Optional[str]:
+        """
+        Resolve a slug, name or alias to the entry's slug.
+
+        :param key: Slug or display name, in any case.
+        :type key: str
+        :return: The slug, or None if nothing matches.
+        :rtype: str or None
+        """
+        if key in self.by_slug:
+            return key
+        lowered = key.strip().lower()
+        return self.aliases.get(lowered) or self.aliases.get(slugify(key))
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry for a slug, name or alias.
+
+        :param key: Slug or display name, in any case.
+        :type key: str
+        :return: The entry, or None if nothing matches.
+        :rtype: dict or None
+        """
+        entry = self.by_slug.get(key)
+        if entry is None:
+            slug = self.resolve(key)
+            entry = self.by_slug.get(slug) if slug else None
+        return entry
+
+
 class LocalAPIHandler:
     """
     Loads 5e SRD JSON files from disk and provides a local API-like interface.
 
     Automatically maps file names like '5e-SRD-Classes.json' to categories such as 'classes'.
 
+    With a compiled cache (see :mod:`core.srd_cache`), categories are read
+    from it instead of being decoded from JSON, and single-entry lookups
+    read only that entry until the category is loaded in full.
+
+    In streaming mode (see :mod:`core.srd_stream`), list categories are
+    parsed incrementally and only summary records (slug, name, type, CR,
+    level, school, classes...) stay resident; :meth:`get` returns those
+    summaries, while :meth:`get_raw`, :meth:`get_many` and
+    :meth:`iter_entries` read full entries from disk through a size-bounded
+    LRU whose statistics are available from :meth:`entry_cache_stats`.
+    Streaming takes precedence over the compiled cache.
+
     :param base_path: Path to the directory containing 5e-SRD JSON files.
     :type base_path: str
+    :param cache_path: Path of the compiled SRD cache; defaults to :attr:`default_cache_path`.
+    :type cache_path: str, optional
+    :param streaming: Keep only summaries resident and load full entries on demand.
+    :type streaming: bool
+    :param entry_cache_bytes: Budget of the full-entry LRU in streaming mode, in bytes of JSON.
+    :type entry_cache_bytes: int, optional
     """
 
-    def __init__(self, base_path: str = "core/data_/rulebook_json"):
+    #: Cache used when no cache_path is given; None disables the compiled cache.
+    default_cache_path: Optional[str] = None
+
+    def __init__(self, base_path: str = "core/data_/rulebook_json", cache_path: Optional[str] = None,
+                 streaming: bool = False, entry_cache_bytes: Optional[int] = None):
         self.base_path = Path(base_path).resolve()
         app_logger.debug(f"[LocalAPI] Base path: {self.base_path}")
 
+        self.streaming = streaming
+        self.streams: Dict[str, Any] = {}
+        self.entry_cache = None
+        if streaming:
+            from core.srd_stream import DEFAULT_ENTRY_CACHE_BYTES, EntryLRU
+            self.entry_cache = EntryLRU(entry_cache_bytes or DEFAULT_ENTRY_CACHE_BYTES)
+
+        self.store = None
+        cache_path = cache_path or self.default_cache_path
+        if cache_path:
+            from core.srd_cache import open_cache
+            try:
+                self.store = open_cache(cache_path)
+            except Exception as e:
+                app_logger.warning(f"[LocalAPI] SRD cache unavailable at {cache_path}: {e}")
+
         self.cache: Dict[str, Any] = {}
+        self.indexes: Dict[str, CategoryIndex] = {}
         self.filenames: Dict[str, str] = {}
+        self._paths: Dict[str, str] = {}    # category -> file path, for data_version
+        self._spell_damage = None           # (data_version, SpellDamageTable)
 
         # More robust matching
         for file in self.base_path.iterdir():
@@ -41,12 +146,48 @@ class LocalAPIHandler:
         if not self.filenames:
             app_logger.error(f"[LocalAPI] No valid SRD files detected in {self.base_path}")
 
+    def _stream(self, category: str):
+        """
+        Get the streamed view of a category, scanning its file on first use.
+
+        :return: The StreamedCategory, or None if the file is not a JSON array.
+        """
+        if category in self.streams:
+            return self.streams[category]
+        from core.srd_stream import NotAnArrayError, StreamedCategory
+        filename = self.filenames.get(category)
+        if not filename:
+            raise APIError(f"[LocalAPI] Unknown category: '{category}', filename : '{filename}'")
+        path = self.base_path / filename
+        try:
+            stream = StreamedCategory(path, self.entry_cache)
+        except FileNotFoundError:
+            raise APIError(f"[LocalAPI] File not found: {path}")
+        except NotAnArrayError:
+            stream = None
+        except json.JSONDecodeError as e:
+            raise APIError(f"[LocalAPI] JSON decode error in {filename}: {e}")
+        self.streams[category] = stream
+        return stream
+
     def _load_file(self, category: str) -> Any:
+        if self.streaming and category not in self.cache:
+            stream = self._stream(category)
+            if stream is not None:
+                return stream.summaries
         if category not in self.cache:
             filename = self.filenames.get(category)
             if not filename:
                 raise APIError(f"[LocalAPI] Unknown category: '{category}', filename : '{filename}'")
             path = self.base_path / filename
+            if self.store is not None:
+                try:
+                    self.cache[category] = self.store.load_category(category, path)
+                    return self.cache[category]
+                except APIError:
+                    raise
+                except Exception as e:
+                    app_logger.warning(f"[LocalAPI] SRD cache read failed for '{category}', using JSON: {e}")
             try:
                 with open(path, "r", encoding="utf-8") as f:
                     self.cache[category] = json.load(f)
@@ -59,16 +200,106 @@ class LocalAPIHandler:
     def get(self, category: str, params: Optional[Dict[str, Any]] = None) -> Any:
         return self._load_file(category)
 
+    def index(self, category: str) -> CategoryIndex:
+        """
+        Get the slug index of a category, building it on first use.
+
+        The index is rebuilt if the category's loaded data is replaced.
+
+        :param category: Category name, e.g. "monsters".
+        :type category: str
+        :return: The category index.
+        :rtype: CategoryIndex
+        """
+        items = self._load_file(category)
+        stream = self.streams.get(category)
+        if stream is not None:
+            return stream.index
+        index = self.indexes.get(category)
+        if index is None or index.items is not items:
+            index = CategoryIndex(items)
+            self.indexes[category] = index
+        return index
+
     def get_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         parts = endpoint.strip("/").split("/")
         if len(parts) < 3:
             raise APIError(f"[LocalAPI] Invalid endpoint path: {endpoint}")
         category, slug = parts[-2], parts[-1]
-        items = self._load_file(category)
-        for entry in items:
-            if entry.get("index") == slug:
-                return entry
-        return None
+        if self.streaming and category in self.filenames:
+            stream = self._stream(category)
+            if stream is not None:
+                return stream.lookup(slug)
+        if self.store is not None and category not in self.cache and category in self.filenames:
+            try:
+                return self.store.lookup(category, self.base_path / self.filenames[category], slug)
+            except APIError:
+                raise
+            except Exception as e:
+                app_logger.warning(f"[LocalAPI] SRD cache lookup failed for '{category}': {e}")
+        return self.index(category).lookup(slug)
+
+    def get_many(self, category: str, keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up several entries of one category at once.
+
+        :param category: Category name, e.g. "monsters".
+        :type category: str
+        :param keys: Slugs or display names.
+        :type keys: list[str]
+        :return: Mapping of each requested key to its entry, or None if not found.
+        :rtype: dict
+        """
+        if self.streaming and category in self.filenames:
+            stream = self._stream(category)
+            if stream is not None:
+                return {key: stream.lookup(key) for key in keys}
+        index = self.index(category)
+        return {key: index.lookup(key) for key in keys}
+
+    def iter_entries(self, category: str) -> Iterator[Any]:
+        """
+        Iterate over the full entries of a category.
+
+        In streaming mode entries are parsed from disk one at a time and not
+        kept; otherwise the loaded category is iterated.
+
+        :param category: Category name, e.g. "monsters".
+        :type category: str
+        :rtype: Iterator
+        """
+        if self.streaming:
+            stream = self._stream(category)
+            if stream is not None:
+                return stream.iter_entries()
+        data = self._load_file(category)
+        return iter(data if isinstance(data, list) else [data])
+
+    def entry_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the usage statistics of the streaming mode's entry LRU.
+
+        :return: See :meth:`core.srd_stream.EntryLRU.stats`, or None when not streaming.
+        :rtype: dict or None
+        """
+        return self.entry_cache.stats() if self.entry_cache is not None else None
+
+    def spell_damage(self):
+        """
+        Get the precomputed damage profiles of the spells, building them on first use.
+
+        The table is rebuilt if the spell file changes.
+
+        :return: Damage profiles by spell.
+        :rtype: core.rulebook.spell_damage.SpellDamageTable
+        """
+        version = self.data_version("spells")
+        if self._spell_damage is None or self._spell_damage[0] != version:
+            from core.rulebook.spell_damage import SpellDamageTable
+            table = SpellDamageTable(self.iter_entries("spells"))
+            app_logger.debug(f"[LocalAPI] Precomputed damage of {len(table)} spells")
+            self._spell_damage = (version, table)
+        return self._spell_damage[1]
 
     def get_monster(self, name: str) -> Optional[Dict[str, Any]]:
         slug = name.lower().replace(" ", "-")
@@ -81,5 +312,26 @@ class LocalAPIHandler:
     def list_available(self, category: str) -> Any:
         return self._load_file(category)
 
+    def data_version(self, category: str) -> Optional[tuple]:
+        """
+        Get a token that changes whenever a category's source file changes.
+
+        :param category: Category name, e.g. "monsters".
+        :type category: str
+        :return: ``(mtime_ns, size)`` of the file, or None for an unknown category.
+        :rtype: tuple or None
+        """
+        path = self._paths.get(category)
+        if path is None:
+            filename = self.filenames.get(category)
+            if not filename:
+                return None
+            path = self._paths[category] = str(self.base_path / filename)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def list_categories(self) -> List[str]:
         return list(self.filenames.keys())
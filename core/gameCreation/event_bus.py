@@ -60,7 +60,8 @@ class EventBus:
         Emit an event to all relevant subscribers.
 
         If 'position' and 'world' are present in data, notifies entities at the position
-        and those within line-of-sight. Otherwise, performs a global broadcast.
+        and those within line-of-sight, looked up through the world's spatial index.
+        Otherwise, performs a global broadcast.
 
         :param event_type: The type of event to emit.
         :type event_type: str
@@ -72,19 +73,38 @@ class EventBus:
         world = data.get("world")
 
         if pos is not None and world is not None:
+            from registries.trigger_registry import global_trigger_registry
+            interested = global_trigger_registry.interested_entities(event_type)
+
+            def listens(ent):
+                # entities without a dispatch table are always offered the event
+                return not hasattr(ent, "has_trigger_for") or id(ent) in interested
+
             # 1) the entity (trap) on that tile
             for ent in world.get_entities_at(*pos):
-                ent.handle_event(event_type, data)
-
-            # 2) proximity: anyone with no range, or anyone within line-of-sight, gets notified
-            for (x, y), ents in world.tile_manager.entities.items():
-                if (x, y) == pos:
-                    continue
-                for ent in ents:
-                    vr = getattr(ent, "vision_range", None)
-                    # if no vision_range is set, or if they can see the source tile, notify
-                    if vr is None or world.can_see(pos, ent.position, vr):
-                        ent.handle_event(event_type, data)
+                if listens(ent):
+                    ent.handle_event(event_type, data)
+
+            # 2) proximity: anyone with no range, or anyone within line-of-sight, gets notified.
+            #    The spatial index narrows the candidates to observers whose range
+            #    could cover the source tile, entities without a trigger for this
+            #    event are dropped, and line-of-sight is checked for the rest in
+            #    one batch.
+            observers = [
+                ent for (x, y), ent in world.tile_manager.get_observers_near(*pos)
+                if (x, y) != pos and listens(ent)
+            ]
+            ranged = [ent for ent in observers if getattr(ent, "vision_range", None) is not None]
+            seen = set()
+            if ranged:
+                visible = world.can_see_many(
+                    pos, [ent.position for ent in ranged], [ent.vision_range for ent in ranged]
+                )
+                seen = {id(ent) for ent, ok in zip(ranged, visible) if ok}
+            for ent in observers:
+                # if no vision_range is set, or if they can see the source tile, notify
+                if getattr(ent, "vision_range", None) is None or id(ent) in seen:
+                    ent.handle_event(event_type, data)
         else:
             # global broadcast
             for cb in inst._subscribers.get(event_type, []):
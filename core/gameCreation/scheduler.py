@@ -0,0 +1,162 @@
+import heapq
+import itertools
+
+
+class ScheduledCallback:
+    """
+    Handle for a callback registered with a :class:`TurnScheduler`.
+
+    Keep it to cancel the callback later. Recurring callbacks keep the same
+    handle across repetitions.
+    """
+    __slots__ = ("fire_turn", "callback", "data", "interval", "cancelled", "_scheduler")
+
+    def __init__(self, fire_turn, callback, data, interval, scheduler):
+        self.fire_turn = fire_turn
+        self.callback = callback
+        self.data = data
+        self.interval = interval
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    @property
+    def active(self):
+        """
+        Whether the callback will still fire.
+
+        :rtype: bool
+        """
+        return not self.cancelled and self._scheduler is not None
+
+    def cancel(self):
+        """
+        Cancel the callback. Cancelling twice, or after a one-shot callback fired, is a no-op.
+        """
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+        else:
+            # already popped: stops a dispatch loop that has not reached it yet
+            self.cancelled = True
+
+    def __repr__(self):
+        every = f", every={self.interval}" if self.interval else ""
+        return f"<ScheduledCallback turn={self.fire_turn}{every} {getattr(self.callback, '__name__', self.callback)}>"
+
+
+class TurnScheduler:
+    """
+    Priority queue of turn-based callbacks.
+
+    Insertion and popping are O(log n). Callbacks due on the same turn fire
+    in the order they were scheduled. Cancelled entries are skipped lazily
+    and purged once they make up half of the heap.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty TurnScheduler.
+        """
+        self._heap = []                 # (fire_turn, seq, ScheduledCallback)
+        self._seq = itertools.count()
+        self._active = 0
+        self._cancelled = 0
+
+    def __len__(self):
+        return self._active
+
+    def schedule_at(self, turn, callback, data=None, every=None):
+        """
+        Schedule a callback for an absolute turn.
+
+        :param turn: Turn on which the callback fires.
+        :type turn: int
+        :param callback: Called as ``callback(data)``.
+        :type callback: callable
+        :param data: Optional data passed to the callback.
+        :type data: any, optional
+        :param every: If given, the callback repeats every `every` turns after the first.
+        :type every: int, optional
+        :return: Handle that can cancel the callback.
+        :rtype: ScheduledCallback
+        :raises ValueError: If `every` is not a positive number of turns.
+        """
+        if every is not None and every < 1:
+            raise ValueError(f"Recurring interval must be at least 1 turn, got {every}")
+        entry = ScheduledCallback(turn, callback, data, every, self)
+        heapq.heappush(self._heap, (turn, next(self._seq), entry))
+        self._active += 1
+        return entry
+
+    def cancel(self, entry):
+        """
+        Cancel a scheduled callback.
+
+        :param entry: Handle returned by :meth:`schedule_at`.
+        :type entry: ScheduledCallback
+        """
+        if entry._scheduler is not self or entry.cancelled:
+            return
+        entry.cancelled = True
+        entry._scheduler = None
+        self._active -= 1
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [item for item in self._heap if not item[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def next_turn_due(self):
+        """
+        Get the earliest turn with a pending callback.
+
+        :return: Turn number, or None if nothing is scheduled.
+        :rtype: int or None
+        """
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def pop_due(self, turn):
+        """
+        Remove and return every callback due on or before `turn`.
+
+        Recurring callbacks are re-queued for their next repetition before
+        being returned, so a callback may cancel its own handle to stop.
+
+        :param turn: The current turn.
+        :type turn: int
+        :return: Due handles in firing order.
+        :rtype: list
+        """
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= turn:
+            _, _, entry = heapq.heappop(heap)
+            if entry.cancelled:
+                self._cancelled -= 1
+                continue
+            due.append(entry)
+        for entry in due:
+            if entry.interval:
+                entry.fire_turn += entry.interval
+                if entry.fire_turn <= turn:
+                    # catch up without replaying skipped repetitions
+                    skipped = (turn - entry.fire_turn) // entry.interval + 1
+                    entry.fire_turn += skipped * entry.interval
+                heapq.heappush(heap, (entry.fire_turn, next(self._seq), entry))
+            else:
+                entry._scheduler = None
+                self._active -= 1
+        return due
+
+    def clear(self):
+        """
+        Drop every scheduled callback.
+        """
+        for _, _, entry in self._heap:
+            entry._scheduler = None
+        self._heap.clear()
+        self._active = 0
+        self._cancelled = 0
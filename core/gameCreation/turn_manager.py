@@ -1,3 +1,6 @@
+from core.gameCreation.scheduler import TurnScheduler
+
+
 class TurnManager:
     """
     Manages turn-based scheduling and execution of callbacks.
@@ -11,12 +14,12 @@ class TurnManager:
 
         Attributes:
             current_turn (int): The current turn number.
-            _queue (list): Internal queue of scheduled callbacks.
+            _scheduler (TurnScheduler): Priority queue of scheduled callbacks.
         """
         self.current_turn = 0
-        self._queue = []
+        self._scheduler = TurnScheduler()
 
-    def schedule_in(self, turns: int, callback, data=None):
+    def schedule_in(self, turns: int, callback, data=None, every=None):
         """
         Schedule a callback to be executed after a given number of turns.
 
@@ -26,20 +29,56 @@ class TurnManager:
         :type callback: callable
         :param data: Optional data to pass to the callback.
         :type data: any, optional
+        :param every: If given, repeat the callback every `every` turns after it first fires.
+        :type every: int, optional
+        :return: Handle whose ``cancel()`` unschedules the callback.
+        :rtype: ScheduledCallback
+        """
+        return self._scheduler.schedule_at(self.current_turn + turns, callback, data, every)
+
+    def schedule_every(self, interval: int, callback, data=None):
+        """
+        Schedule a callback to run every `interval` turns, starting `interval` turns from now.
+
+        :param interval: Number of turns between calls.
+        :type interval: int
+        :param callback: The function to call.
+        :type callback: callable
+        :param data: Optional data to pass to the callback.
+        :type data: any, optional
+        :return: Handle whose ``cancel()`` stops the repetition.
+        :rtype: ScheduledCallback
+        """
+        return self.schedule_in(interval, callback, data, every=interval)
+
+    def cancel(self, handle):
+        """
+        Cancel a scheduled callback.
+
+        :param handle: Handle returned by :meth:`schedule_in` or :meth:`schedule_every`.
+        :type handle: ScheduledCallback
+        """
+        self._scheduler.cancel(handle)
+
+    @property
+    def pending(self):
+        """
+        Number of callbacks still scheduled.
+
+        :rtype: int
         """
-        fire_turn = self.current_turn + turns
-        self._queue.append((fire_turn, callback, data))
+        return len(self._scheduler)
 
     def _dispatch_due(self):
         """
         Dispatches all callbacks scheduled for the current turn.
 
-        This method is called internally to execute all callbacks whose scheduled turn matches the current turn.
+        This method is called internally to execute all callbacks whose scheduled turn has been reached.
+        Callbacks scheduled while dispatching fire on a later turn at the earliest.
         """
-        due = [(cb, d) for (t, cb, d) in self._queue if t == self.current_turn]
-        self._queue = [(t, cb, d) for (t, cb, d) in self._queue if t != self.current_turn]
-        for cb, data in due:
-            cb(data)
+        for entry in self._scheduler.pop_due(self.current_turn):
+            if not entry.cancelled:
+                entry.callback(entry.data)
 
     def next_turn(self):
         """
@@ -1,3 +1,6 @@
+from core.gameCreation.scheduler import TurnScheduler
+
+
 class TurnManager:
     """
     Manages turn-based scheduling and execution of callbacks.
@@ -6,8 +9,8 @@ class TurnManager:
     ----------
     current_turn : int
         The current turn number.
-    _scheduled : list
-        List of scheduled callbacks as tuples (target_turn, callback, data).
+    _scheduler : TurnScheduler
+        Priority queue of scheduled callbacks.
     """
 
     def __init__(self):
@@ -15,9 +18,9 @@ class TurnManager:
         Initialize the TurnManager with turn counter and scheduled callbacks.
         """
         self.current_turn = 0
-        self._scheduled = []  # list of (target_turn, callback, data)
+        self._scheduler = TurnScheduler()
 
-    def schedule_in(self, turns: int, callback, data):
+    def schedule_in(self, turns: int, callback, data, every=None):
         """
         Schedule a callback to be executed after a given number of turns.
 
@@ -29,19 +32,65 @@ class TurnManager:
             The function to call when the scheduled turn is reached.
         data : any
             Data to pass to the callback function.
+        every : int, optional
+            If given, repeat the callback every `every` turns after it first fires.
+
+        Returns
+        -------
+        ScheduledCallback
+            Handle whose ``cancel()`` unschedules the callback.
+        """
+        return self._scheduler.schedule_at(self.current_turn + turns, callback, data, every)
+
+    def schedule_every(self, interval: int, callback, data=None):
+        """
+        Schedule a callback to run every `interval` turns, starting `interval` turns from now.
+
+        Parameters
+        ----------
+        interval : int
+            Number of turns between calls.
+        callback : callable
+            The function to call.
+        data : any, optional
+            Data to pass to the callback function.
+
+        Returns
+        -------
+        ScheduledCallback
+            Handle whose ``cancel()`` stops the repetition.
+        """
+        return self.schedule_in(interval, callback, data, every=interval)
+
+    def cancel(self, handle):
+        """
+        Cancel a scheduled callback.
+
+        Parameters
+        ----------
+        handle : ScheduledCallback
+            Handle returned by :meth:`schedule_in` or :meth:`schedule_every`.
+        """
+        self._scheduler.cancel(handle)
+
+    @property
+    def pending(self):
+        """
+        Number of callbacks still scheduled.
+
+        Returns
+        -------
+        int
         """
-        target = self.current_turn + turns
-        self._scheduled.append((target, callback, data))
+        return len(self._scheduler)
 
     def _dispatch_scheduled(self):
         """
         Dispatch and execute all callbacks scheduled for the current turn.
         """
-        # fire any callbacks scheduled for this turn
-        to_run = [s for s in self._scheduled if s[0] == self.current_turn]
-        for target, cb, data in to_run:
-            cb(data)
-            self._scheduled.remove((target, cb, data))
+        for entry in self._scheduler.pop_due(self.current_turn):
+            if not entry.cancelled:
+                entry.callback(entry.data)
 
     def next_turn(self):
         """
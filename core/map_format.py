@@ -0,0 +1,285 @@
+"""
+Chunked sparse map format (version 2).
+
+The grid is cut into square chunks of ``chunk_size`` tiles. A map stores
+one ``default_tile`` template and, per chunk, only the tiles that differ
+from it, each reduced to its position plus the fields that differ::
+
+    {
+        "version": 2,
+        "meta": {"rows": 25, "cols": 25, "grid_type": "square", ...},
+        "chunk_size": 16,
+        "default_tile": {"terrain": "FLOOR", "tags": [], ...},
+        "chunks": {"0,1": [{"position": [3, 20], "terrain": "WALL"}]}
+    }
+
+Tiles come back out as the full dicts of ``TileData.to_dict``, chunk by
+chunk, so a loader can build one region at a time. Version 1 files (a flat
+``tiles`` list) are converted by ``versioning.migrations.map_data``.
+"""
+import copy
+import itertools
+
+#: Current map file version.
+MAP_VERSION = 2
+#: Side of a chunk, in tiles.
+DEFAULT_CHUNK_SIZE = 16
+#: Serialized form of a fresh tile, minus its id and position.
+DEFAULT_TILE = {
+    "triggers": [],
+    "terrain": "FLOOR",
+    "tags": [],
+    "user_label": None,
+    "note": None,
+    "overlay_color": None,
+    "last_updated": None,
+    "entities": [],
+}
+
+_MISSING = object()
+
+
+def map_version(data):
+    """
+    Get the format version of map data.
+
+    Version 1 files store ``"1.0"``; files without a version are treated as version 0.
+
+    :param data: Map data.
+    :type data: dict
+    :rtype: int
+    """
+    version = data.get("version", 0)
+    try:
+        return int(float(version))
+    except (TypeError, ValueError):
+        return 0
+
+
+def chunk_key(row, col, chunk_size):
+    """
+    Key of the chunk holding a tile, as used in ``chunks``.
+
+    :rtype: str
+    """
+    return f"{row // chunk_size},{col // chunk_size}"
+
+
+def _fresh(template):
+    # containers must not be shared between tiles; empty ones are the common case
+    return {
+        k: (copy.deepcopy(v) if v else type(v)()) if isinstance(v, (list, dict)) else v
+        for k, v in template.items()
+    }
+
+
+def encode_tile(tile, template=DEFAULT_TILE):
+    """
+    Reduce a serialized tile to the fields that differ from the template.
+
+    :param tile: Tile as from ``TileData.to_dict``.
+    :type tile: dict
+    :param template: Default tile.
+    :type template: dict
+    :return: Sparse entry; only ``position`` for a default tile.
+    :rtype: dict
+    """
+    row, col = tile["position"]
+    entry = {"position": [row, col]}
+    for key, value in tile.items():
+        if key == "position":
+            continue
+        if key == "tile_id":
+            if value != f"{row}_{col}":
+                entry[key] = value
+        elif template.get(key, _MISSING) != value:
+            entry[key] = value
+    return entry
+
+
+def decode_tile(entry, template=DEFAULT_TILE):
+    """
+    Expand a sparse entry back to a full serialized tile.
+
+    :param entry: Sparse entry with at least ``position``.
+    :type entry: dict
+    :param template: Default tile.
+    :type template: dict
+    :rtype: dict
+    """
+    row, col = entry["position"]
+    tile = _fresh(template)
+    tile["tile_id"] = f"{row}_{col}"
+    tile.update(entry)
+    tile["position"] = [row, col]
+    return tile
+
+
+def build_map(tiles, meta=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Build version 2 map data from serialized tiles.
+
+    ``meta["rows"]`` and ``meta["cols"]`` are grown to cover every tile.
+
+    :param tiles: Tiles as from ``TileData.to_dict``.
+    :type tiles: iterable of dict
+    :param meta: Map metadata (author, created, grid_type...).
+    :type meta: dict, optional
+    :param chunk_size: Side of a chunk, in tiles.
+    :type chunk_size: int
+    :rtype: dict
+    """
+    data = {
+        "version": MAP_VERSION,
+        "meta": dict(meta or {}),
+        "chunk_size": chunk_size,
+        "default_tile": _fresh(DEFAULT_TILE),
+        "chunks": {},
+    }
+    meta = data["meta"]
+    template = data["default_tile"]
+    chunks = {}
+    for tile in tiles:
+        row, col = tile["position"]
+        _grow(meta, row, col)
+        entry = encode_tile(tile, template)
+        slots = chunks.setdefault(chunk_key(row, col, chunk_size), {})
+        if len(entry) > 1:
+            slots[(row, col)] = entry
+        else:
+            slots.pop((row, col), None)
+    data["chunks"] = {key: list(slots.values()) for key, slots in chunks.items() if slots}
+    return data
+
+
+def _grow(meta, row, col):
+    meta["rows"] = max(meta.get("rows") or 0, row + 1)
+    meta["cols"] = max(meta.get("cols") or 0, col + 1)
+
+
+def put_tile(data, tile):
+    """
+    Store a serialized tile in version 2 map data, replacing the one at its position.
+
+    :param data: Version 2 map data, changed in place.
+    :type data: dict
+    :param tile: Tile as from ``TileData.to_dict``.
+    :type tile: dict
+    """
+    row, col = tile["position"]
+    _grow(data["meta"], row, col)
+    entry = encode_tile(tile, data["default_tile"])
+    key = chunk_key(row, col, data["chunk_size"])
+    chunk = data["chunks"].get(key, [])
+    position = [row, col]
+    chunk = [e for e in chunk if list(e["position"]) != position]
+    if len(entry) > 1:
+        chunk.append(entry)
+    if chunk:
+        data["chunks"][key] = chunk
+    else:
+        data["chunks"].pop(key, None)
+
+
+def dimensions(data):
+    """
+    Grid size of version 2 map data.
+
+    :return: ``(rows, cols)``.
+    :rtype: tuple
+    """
+    meta = data.get("meta", {})
+    return meta.get("rows") or 0, meta.get("cols") or 0
+
+
+def tile_count(data):
+    """
+    Number of tiles in the grid, stored or default.
+
+    :rtype: int
+    """
+    rows, cols = dimensions(data)
+    return rows * cols
+
+
+def stored_tiles(data):
+    """
+    Iterate over the sparse entries of every non-default tile.
+
+    :rtype: Iterator[dict]
+    """
+    return itertools.chain.from_iterable(data.get("chunks", {}).values())
+
+
+def chunk_keys(data):
+    """
+    Keys of every chunk covering the grid, row by row.
+
+    :rtype: list[str]
+    """
+    rows, cols = dimensions(data)
+    size = data["chunk_size"]
+    return [f"{r},{c}" for r in range(-(-rows // size)) for c in range(-(-cols // size))]
+
+
+def chunk_tiles(data, key):
+    """
+    Full serialized tiles of one chunk, defaults included, row by row.
+
+    :param data: Version 2 map data.
+    :type data: dict
+    :param key: Chunk key, e.g. "0,1".
+    :type key: str
+    :rtype: list[dict]
+    """
+    rows, cols = dimensions(data)
+    size = data["chunk_size"]
+    template = data["default_tile"]
+    chunk_row, chunk_col = (int(part) for part in key.split(","))
+    stored = {tuple(e["position"]): e for e in data["chunks"].get(key, ())}
+    tiles = []
+    for row in range(chunk_row * size, min((chunk_row + 1) * size, rows)):
+        for col in range(chunk_col * size, min((chunk_col + 1) * size, cols)):
+            tiles.append(decode_tile(stored.get((row, col), {"position": [row, col]}), template))
+    return tiles
+
+
+def iter_tiles(data):
+    """
+    Iterate over the full serialized tiles of the whole grid, chunk by chunk.
+
+    :param data: Version 2 map data.
+    :type data: dict
+    :rtype: Iterator[dict]
+    """
+    for key in chunk_keys(data):
+        yield from chunk_tiles(data, key)
+
+
+def summarize(data):
+    """
+    Count the tiles, triggers and entities of map data of any version, without migrating it.
+
+    Entities count both those placed on tiles and those listed at the top
+    level of the file.
+
+    :param data: Map data as read from a file.
+    :type data: dict
+    :return: Dict with ``tiles``, ``triggers`` and ``entities``.
+    :rtype: dict
+    """
+    summary = {"entities": len(data.get("entities") or ())}
+    if map_version(data) < MAP_VERSION:
+        tiles = data.get("tiles", [])
+        summary["tiles"] = len(tiles)
+        for field in ("triggers", "entities"):
+            summary[field] = summary.get(field, 0) + sum(len(t.get(field) or ()) for t in tiles)
+        return summary
+    stored = list(stored_tiles(data))
+    defaults = tile_count(data) - len(stored)
+    summary["tiles"] = tile_count(data)
+    for field in ("triggers", "entities"):
+        default = len(data.get("default_tile", {}).get(field) or ())
+        count = sum(len(e[field] or ()) if field in e else default for e in stored)
+        summary[field] = summary.get(field, 0) + count + default * defaults
+    return summary
@@ -0,0 +1,286 @@
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+
+from core import map_format
+from core.logger import app_logger
+from versioning.update_registry import update_registry
+from versioning.updater import Updater
+
+updater = Updater(update_registry)
+
+#: Journal records allowed before compaction, at least.
+MIN_COMPACT_RECORDS = 64
+#: Journal records allowed before compaction, as a fraction of the tiles in the base file.
+COMPACT_RATIO = 0.25
+
+
+def journal_path(map_path):
+    """
+    Path of the change journal kept next to a map file.
+
+    :param map_path: Path of the map file.
+    :type map_path: Path or str
+    :rtype: Path
+    """
+    map_path = Path(map_path)
+    return map_path.with_name(map_path.name + ".journal")
+
+
+def _write_atomic(path, text):
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(folder):
+    # makes the rename itself durable; directories cannot be opened for this on Windows
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class MapStore:
+    """
+    A map file with an append-only journal of changed tiles.
+
+    A full save writes the whole map and stamps it with a new generation
+    token. Later saves append only the changed tiles, one JSON line each,
+    to ``<map>.journal``, whose first line names the generation it applies
+    to. :meth:`load` returns the base map with the journal replayed over it
+    (later records win, tiles are matched by position). Once the journal
+    grows past :data:`COMPACT_RATIO` of the map, :meth:`compact_async`
+    folds it back into the base file on a background thread.
+
+    Older map files are migrated to the current format as they are read
+    (see ``update_registry["Map"]``) and rewritten in it on the next full
+    save or compaction. A journal whose generation does not match the base file (for instance
+    after the map was replaced by hand) is ignored, and a torn last line
+    left by a crash is skipped. A compacted base file also accepts the
+    journal it was folded from (``meta["previous_generation"]``): if the
+    journal could not be rewritten after the base was replaced, replaying
+    it again over the merged map gives the same result.
+
+    :param map_path: Path of the map file.
+    :type map_path: Path or str
+    """
+
+    def __init__(self, map_path):
+        self.path = Path(map_path)
+        self.journal = journal_path(self.path)
+        self.generation = None      # of the base file, once written or loaded
+        self.base_tiles = 0
+        self.journal_records = 0
+        self._lock = threading.Lock()
+        self._compactor = None
+
+    def _read(self):
+        """
+        Read the base file, migrated to the current format, and the records of its journal.
+
+        :return: ``(map_data, records, journal_bytes_read, journal_generation)``.
+        :rtype: tuple
+        """
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        version = map_format.map_version(data)
+        if version < map_format.MAP_VERSION:
+            data, _ = updater.update("Map", data, version)
+        meta = data.get("meta", {})
+        generation = meta.get("generation")
+        accepted = {generation, meta.get("previous_generation")} - {None}
+        records = []
+        consumed = 0
+        try:
+            with open(self.journal, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return data, records, consumed, None
+        lines = raw.split(b"\n")
+        # a partial last line is a write that did not finish
+        complete = lines[:-1]
+        try:
+            header = json.loads(complete[0]) if complete else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("generation") not in accepted:
+            app_logger.warning(f"[MapStore] Ignoring journal of another map version: {self.journal}")
+            return data, records, len(raw), None
+        consumed = len(complete[0]) + 1
+        for line in complete[1:]:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                app_logger.warning(f"[MapStore] Skipping corrupt journal record in {self.journal}")
+            consumed += len(line) + 1
+        return data, records, consumed, header["generation"]
+
+    @staticmethod
+    def _merge(data, records):
+        for tile in records:
+            map_format.put_tile(data, tile)
+        return data
+
+    def load(self):
+        """
+        Read the map with every journaled change applied.
+
+        :return: The map data, in the current format (see :mod:`core.map_format`).
+        :rtype: dict
+        :raises OSError: If the map file cannot be read.
+        :raises json.JSONDecodeError: If the map file is not valid JSON.
+        """
+        with self._lock:
+            data, records, _, _ = self._read()
+        self.generation = data.get("meta", {}).get("generation")
+        self.base_tiles = map_format.tile_count(data)
+        self.journal_records = len(records)
+        return self._merge(data, records)
+
+    def write_full(self, map_data):
+        """
+        Replace the map file with `map_data` and drop the journal.
+
+        :param map_data: Map data in the current format; its ``meta`` gets a new generation token.
+        :type map_data: dict
+        """
+        generation = uuid.uuid4().hex
+        meta = map_data.setdefault("meta", {})
+        meta["generation"] = generation
+        meta.pop("previous_generation", None)
+        text = json.dumps(map_data, indent=2)
+        with self._lock:
+            _write_atomic(self.path, text)
+            if self.journal.exists():
+                self.journal.unlink()
+            self.generation = generation
+            self.base_tiles = map_format.tile_count(map_data)
+            self.journal_records = 0
+
+    @property
+    def can_append(self):
+        """
+        Whether changes can be journaled, i.e. the base file is known and still exists.
+
+        :rtype: bool
+        """
+        return self.generation is not None and self.path.exists()
+
+    def append(self, tiles):
+        """
+        Journal changed tiles and flush them to disk.
+
+        :param tiles: Serialized tiles (``TileData.to_dict()``).
+        :type tiles: list[dict]
+        :raises RuntimeError: If :attr:`can_append` is false.
+        """
+        if not self.can_append:
+            raise RuntimeError(f"No base map to journal against: {self.path}")
+        if not tiles:
+            return
+        lines = "".join(json.dumps(tile) + "\n" for tile in tiles)
+        with self._lock:
+            new = not self.journal.exists()
+            with open(self.journal, "a", encoding="utf-8") as f:
+                if new:
+                    f.write(json.dumps({"generation": self.generation}) + "\n")
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self.journal_records += len(tiles)
+
+    def needs_compaction(self):
+        """
+        Whether the journal has grown enough to be folded into the map file.
+
+        :rtype: bool
+        """
+        return self.journal_records > max(MIN_COMPACT_RECORDS, COMPACT_RATIO * self.base_tiles)
+
+    def compact(self):
+        """
+        Fold the journal into the map file.
+
+        The merged map is serialized without holding the lock; records
+        appended meanwhile are carried over into the new journal. The new
+        base file keeps accepting the old journal, so a crash between
+        replacing the base and rewriting the journal loses nothing.
+        """
+        with self._lock:
+            data, records, consumed, journal_generation = self._read()
+        if not records:
+            return
+        base_generation = data["meta"]["generation"]
+        generation = uuid.uuid4().hex
+        data = self._merge(data, records)
+        data["meta"]["generation"] = generation
+        data["meta"]["previous_generation"] = journal_generation
+        text = json.dumps(data, indent=2)
+        with self._lock:
+            if self.generation not in (None, base_generation):
+                return      # fully saved meanwhile; the merge is stale
+            try:
+                with open(self.journal, "rb") as f:
+                    f.seek(consumed)
+                    tail = f.read()
+            except FileNotFoundError:
+                tail = b""
+            tail = tail[:tail.rfind(b"\n") + 1]
+            _write_atomic(self.path, text)
+            if tail:
+                header = json.dumps({"generation": generation}) + "\n"
+                _write_atomic(self.journal, header + tail.decode("utf-8"))
+            elif self.journal.exists():
+                self.journal.unlink()
+            self.generation = generation
+            self.base_tiles = map_format.tile_count(data)
+            self.journal_records = tail.count(b"\n")
+        app_logger.info(f"[MapStore] Compacted {len(records)} journal records into {self.path}")
+
+    def compact_async(self):
+        """
+        Start :meth:`compact` on a background thread unless one is already running.
+
+        :return: The compaction thread.
+        :rtype: threading.Thread
+        """
+        if self._compactor is not None and self._compactor.is_alive():
+            return self._compactor
+
+        def run():
+            try:
+                self.compact()
+            except Exception as e:
+                app_logger.error(f"[MapStore] Compaction of {self.path} failed: {e}")
+
+        self._compactor = threading.Thread(target=run, name="map-compactor", daemon=True)
+        self._compactor.start()
+        return self._compactor
+
+
+def load_map(map_path):
+    """
+    Read a map file with its journal applied.
+
+    :param map_path: Path of the map file.
+    :type map_path: Path or str
+    :rtype: dict
+    """
+    return MapStore(map_path).load()
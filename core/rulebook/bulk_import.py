@@ -0,0 +1,123 @@
+import re
+
+#: Largest number of copies of one monster a single spec entry may ask for.
+MAX_COUNT = 100
+
+_SEPARATORS = re.compile(r"\s*(?:[,;\n]|\band\b)\s*", re.IGNORECASE)
+_LEADING_COUNT = re.compile(r"^(?:(\d+)\s*[x×]?\s+|(an?|one)\s+)", re.IGNORECASE)
+_TRAILING_COUNT = re.compile(r"\s*(?:[x×]\s*(\d+)|\((\d+)\))$", re.IGNORECASE)
+
+
+def parse_encounter_spec(spec):
+    """
+    Split an encounter description into counts and monster names.
+
+    Entries are separated by commas, semicolons, new lines or "and", and
+    each is read with :func:`parse_count`. Names that contain a separator
+    themselves ("Wereboar, Human Form") cannot be written this way; pass
+    such entries to ``RulebookImporter.import_many`` instead.
+
+    :param spec: E.g. "4 goblins, 1 hobgoblin captain".
+    :type spec: str
+    :return: List of ``(count, name)`` in the order given.
+    :rtype: list[tuple]
+    """
+    entries = []
+    for part in _SEPARATORS.split(spec or ""):
+        count, name = parse_count(part)
+        if name:
+            entries.append((count, name))
+    return entries
+
+
+def parse_count(entry):
+    """
+    Split one monster entry into its count and name.
+
+    The count may come before ("4 goblins", "2x orc", "an owlbear") or
+    after the name ("goblin x4", "orc (2)"); without one it is 1. The name
+    is never split further.
+
+    :param entry: E.g. "2 Wereboar, Human Form".
+    :type entry: str
+    :return: ``(count, name)``; the name is empty if the entry only held a count.
+    :rtype: tuple
+    """
+    part = (entry or "").strip()
+    count = 1
+    match = _LEADING_COUNT.match(part)
+    if match:
+        count = int(match.group(1)) if match.group(1) else 1
+        part = part[match.end():]
+    else:
+        match = _TRAILING_COUNT.search(part)
+        if match:
+            count = int(match.group(1) or match.group(2))
+            part = part[:match.start()]
+    return count, part.strip()
+
+
+def singular_forms(name):
+    """
+    Candidate singular spellings of a monster name, most likely first.
+
+    Only the last word is changed, so
+    "goblins" → "goblin", "wolves" → "wolf" and "giant spiders" →
+    "giant spider".
+
+    :param name: Name as written by the user.
+    :type name: str
+    :return: Candidates, not including `name` itself.
+    :rtype: list[str]
+    """
+    words = name.split()
+    if not words:
+        return []
+    last = words[-1]
+    lowered = last.lower()
+    stems = []
+    if lowered.endswith("ves"):
+        stems += [last[:-3] + "f", last[:-3] + "fe"]
+    if lowered.endswith("ies"):
+        stems.append(last[:-3] + "y")
+    if lowered.endswith(("ches", "shes", "sses", "xes", "zes")):
+        stems.append(last[:-2])
+    if lowered.endswith("s") and not lowered.endswith("ss"):
+        stems.append(last[:-1])
+    if lowered.endswith("men"):
+        stems.append(last[:-3] + "man")
+    head = " ".join(words[:-1])
+    return [f"{head} {stem}".strip() for stem in dict.fromkeys(stems)]
+
+
+class ImportBatch:
+    """
+    Result of a bulk import.
+
+    :ivar entities: Every imported entity, in request order, ready to place.
+    :ivar groups: Mapping of each requested name to its entities.
+    :ivar errors: Mapping of each requested name that failed to the reason.
+    """
+
+    def __init__(self):
+        self.entities = []
+        self.groups = {}
+        self.errors = {}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __repr__(self):
+        return f"<ImportBatch {len(self.entities)} entities, {len(self.errors)} errors>"
+
+    @property
+    def ok(self):
+        """
+        Whether every requested name was imported.
+
+        :rtype: bool
+        """
+        return not self.errors
@@ -44,11 +44,12 @@ class EntityImporter(BaseImporter):
         """
         Retrieve a monster by name and parse it into a RulebookEntity.
 
+        Parsed monsters are memoized (see :meth:`BaseImporter.get_parsed`);
+        the returned object is shared and should not be modified.
+
         :param name: The monster's name (e.g., "Goblin").
         :type name: str
         :return: A RulebookEntity instance if found, otherwise None.
         :rtype: RulebookEntity or None
         """
-        slug = slugify(name)
-        raw = self.api.get_raw(f"/api/{self.endpoint}/{slug}")
-        return RulebookEntity.from_monster(raw) if raw else None
+        return self.get_parsed(name)
@@ -1,5 +1,9 @@
 from .entity_importer import EntityImporter
 from .spell_importer import SpellImporter
+from .search import RulebookSearch, SearchPage
+from .stat_table import MonsterStatTable
+from .bulk_import import MAX_COUNT, ImportBatch, parse_count, parse_encounter_spec, singular_forms
+from concurrent.futures import ThreadPoolExecutor
 from models.entities.game_entity import GameEntity
 from models.spell import Spell
 from core.db_api_handler import LocalAPIHandler
@@ -11,16 +15,93 @@ class RulebookImporter:
     Handles importing monsters and spells from local SRD JSON files.
     """
 
-    def __init__(self, base_path="core/data_/rulebook_json"):
+    def __init__(self, base_path="core/data_/rulebook_json", api=None):
         """
         Initializes the RulebookImporter using local rulebook data.
 
         :param base_path: Path to the directory containing SRD JSON files.
         :type base_path: str
+        :param api: Existing handler to share (e.g. one warmed by a RulebookPreloader).
+        :type api: LocalAPIHandler, optional
         """
-        shared_api = LocalAPIHandler(base_path)
+        shared_api = api if api is not None else LocalAPIHandler(base_path)
+        self.api = shared_api
         self.monsters = EntityImporter(api=shared_api)
         self.spells = SpellImporter(api=shared_api)
+        self._search_engine = None
+        self._stat_table = None
+
+    @property
+    def search_engine(self) -> RulebookSearch:
+        """
+        The full-text search index over this importer's rulebook, built on first use.
+
+        :rtype: RulebookSearch
+        """
+        if self._search_engine is None:
+            self._search_engine = RulebookSearch(self.api)
+        return self._search_engine
+
+    def search(self, query: str, kind: str = None, limit: int = 20, offset: int = 0) -> SearchPage:
+        """
+        Run a ranked full-text search with optional structured filters.
+
+        :param query: Free text, e.g. "fire breath", "CR <= 2 undead" or "evocation level 3 wizard".
+        :type query: str
+        :param kind: Restrict results to "monster" or "spell".
+        :type kind: str, optional
+        :param limit: Page size.
+        :type limit: int
+        :param offset: Index of the first result.
+        :type offset: int
+        :return: One page of ranked results.
+        :rtype: SearchPage
+        """
+        return self.search_engine.search(query, kind=kind, limit=limit, offset=offset)
+
+    @property
+    def stat_table(self) -> MonsterStatTable:
+        """
+        Columnar monster stats for vectorized filtering, built on first use.
+
+        :rtype: MonsterStatTable
+        """
+        if self._stat_table is None:
+            self._stat_table = MonsterStatTable.from_api(self.api)
+        return self._stat_table
+
+    def filter_monsters(self, sort_by: str = None, descending: bool = False, **criteria) -> list:
+        """
+        Get the names of monsters matching stat criteria.
+
+        :param sort_by: Column to order by, e.g. "cr" or "hp"; table order by default.
+        :type sort_by: str, optional
+        :param descending: Largest values first.
+        :type descending: bool
+        :param criteria: Criteria of :meth:`MonsterStatTable.filter`, e.g. ``min_ac=15, immune="fire"``.
+        :return: Matching monster names.
+        :rtype: list[str]
+        """
+        table = self.stat_table
+        rows = table.filter(**criteria)
+        if sort_by:
+            rows = table.sort(sort_by, rows, descending=descending)
+        return table.names(rows)
+
+    def spells_by_damage(self, slot_level: int = None, character_level: int = 1, **criteria) -> list:
+        """
+        Get the names of damaging spells, highest expected damage first.
+
+        :param slot_level: Slot used; each spell's own level by default.
+        :type slot_level: int, optional
+        :param character_level: Caster level, for cantrips.
+        :type character_level: int
+        :param criteria: Filters of :meth:`SpellDamageTable.rank`, e.g. ``damage_type="fire", min_mean=20``.
+        :return: Matching spell names.
+        :rtype: list[str]
+        """
+        ranked = self.api.spell_damage().rank(slot_level, character_level, **criteria)
+        return [spell.name for spell, _ in ranked]
 
     def search_monsters(self):
         """
@@ -77,3 +158,115 @@ class RulebookImporter:
         except Exception as e:
             app_logger.error(f"[Importer] Failed to import spell '{name}': {e}")
             return None
+
+    def _resolve_monsters(self, names):
+        """
+        Resolve requested monster names to slugs in one pass over the index.
+
+        :return: Mapping of each name to its slug, or None if unknown.
+        :rtype: dict
+        """
+        index = self.api.index(self.monsters.endpoint)
+        resolved = {}
+        for name in names:
+            slug = index.resolve(name)
+            for candidate in singular_forms(name) if slug is None else ():
+                slug = index.resolve(candidate)
+                if slug is not None:
+                    break
+            resolved[name] = slug
+        return resolved
+
+    def import_many(self, names_or_queries, workers=None) -> ImportBatch:
+        """
+        Imports several monsters at once.
+
+        Names are resolved against the monster index in one pass, each
+        distinct monster is parsed once, and every copy is a copy-on-write
+        GameEntity. Failures are collected per name instead of aborting.
+
+        :param names_or_queries: Monster names, each optionally with a count
+            ("Goblin", "4 goblins", "orc x2", "Wereboar, Human Form"), or
+            ``(count, name)`` pairs such as ``Encounter.entries()``. Items
+            are one monster each and are not split on commas.
+        :type names_or_queries: list[str or tuple]
+        :param workers: Convert the distinct monsters on a thread pool of this
+            size; None or 1 converts them in the calling thread.
+        :type workers: int, optional
+        :return: The imported entities and a per-name error report.
+        :rtype: ImportBatch
+        """
+        requests = []
+        for item in names_or_queries:
+            if isinstance(item, str):
+                count, name = parse_count(item)
+                item = (count, name or item)
+            requests.append(item)
+        batch = ImportBatch()
+        try:
+            slugs = self._resolve_monsters(dict.fromkeys(name for _, name in requests))
+        except Exception as e:
+            for _, name in requests:
+                batch.errors[name] = str(e)
+            app_logger.error(f"[Importer] Bulk import failed: {e}")
+            return batch
+
+        def convert(slug):
+            rbe = self.monsters.get_by_name(slug)
+            if rbe is None:
+                raise LookupError(f"No SRD data for '{slug}'")
+            return rbe
+
+        unique = [slug for slug in dict.fromkeys(slugs.values()) if slug is not None]
+        parsed = {}
+        if workers and workers > 1 and len(unique) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {slug: pool.submit(convert, slug) for slug in unique}
+            for slug, future in futures.items():
+                try:
+                    parsed[slug] = future.result()
+                except Exception as e:
+                    parsed[slug] = e
+        else:
+            for slug in unique:
+                try:
+                    parsed[slug] = convert(slug)
+                except Exception as e:
+                    parsed[slug] = e
+
+        for count, name in requests:
+            slug = slugs[name]
+            if slug is None:
+                batch.errors[name] = "Unknown monster"
+                continue
+            if not 1 <= count <= MAX_COUNT:
+                batch.errors[name] = f"Count must be between 1 and {MAX_COUNT}, got {count}"
+                continue
+            rbe = parsed[slug]
+            if isinstance(rbe, Exception):
+                batch.errors[name] = str(rbe)
+                continue
+            try:
+                entities = [rbe.to_game_entity() for _ in range(count)]
+            except Exception as e:
+                batch.errors[name] = str(e)
+                continue
+            batch.groups.setdefault(name, []).extend(entities)
+            batch.entities.extend(entities)
+        if batch.errors:
+            app_logger.warning(f"[Importer] Could not import: {batch.errors}")
+        return batch
+
+    def import_encounter(self, spec: str, workers=None) -> ImportBatch:
+        """
+        Imports the monsters of an encounter description.
+
+        :param spec: E.g. "4 goblins, 1 hobgoblin captain"; see
+            :func:`core.rulebook.bulk_import.parse_encounter_spec`.
+        :type spec: str
+        :param workers: Thread pool size, see :meth:`import_many`.
+        :type workers: int, optional
+        :return: The imported entities and a per-name error report.
+        :rtype: ImportBatch
+        """
+        return self.import_many(parse_encounter_spec(spec), workers=workers)
@@ -1,5 +1,11 @@
 import re
+import threading
+from collections import OrderedDict
 from core.db_api_handler import LocalAPIHandler  # Make sure this import is correct
+from utils.string.slugify import slugify
+
+#: Number of parsed entries each importer keeps.
+PARSED_CACHE_SIZE = 256
 
 class BaseImporter:
     """
@@ -9,8 +15,15 @@ class BaseImporter:
     ----------
     api : LocalAPIHandler
         An instance used to access SRD data from disk.
+    parse_hits, parse_misses : int
+        Statistics of the parsed-entry cache used by :meth:`get_parsed`.
     """
 
+    _parsed = None                      # (slug, data_version) -> parsed entry, created on first use
+    _parsed_lock = threading.Lock()     # shared by all importers; held only briefly
+    parse_hits = 0
+    parse_misses = 0
+
     def __init__(self, api=None, base_path="core/data_/rulebook_json"):
         if api is not None:
             self.api = api
@@ -45,3 +58,51 @@ class BaseImporter:
         slug = self.slugify(name)
         endpoint = f"/api/{category}/{slug}"
         return self.api.get_raw(endpoint)
+
+    def get_parsed(self, name: str):
+        """
+        Retrieves an entry by name and parses it, reusing earlier results.
+
+        Parsed entries are memoized per slug and data version (see
+        ``LocalAPIHandler.data_version``), so editing the SRD file on disk
+        invalidates them. Subclasses provide ``endpoint`` and ``parse``.
+
+        Parameters
+        ----------
+        name : str
+            Display name or slug (e.g. "Goblin").
+
+        Returns
+        -------
+        object
+            The parsed entry, or None if not found. Treat it as read-only:
+            it is shared with later callers.
+        """
+        slug = slugify(name)
+        version_of = getattr(self.api, "data_version", None)
+        key = (slug, version_of(self.endpoint) if callable(version_of) else None)
+        with self._parsed_lock:
+            if self._parsed is None:
+                self._parsed = OrderedDict()
+            parsed = self._parsed.get(key)
+            if parsed is not None:
+                self._parsed.move_to_end(key)
+                self.parse_hits += 1
+                return parsed
+            self.parse_misses += 1
+        raw = self.api.get_raw(f"/api/{self.endpoint}/{slug}")
+        if not raw:
+            return None
+        parsed = self.parse(raw)
+        with self._parsed_lock:
+            self._parsed[key] = parsed
+            while len(self._parsed) > PARSED_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+        return parsed
+
+    def clear_parsed(self):
+        """
+        Drops every memoized parsed entry.
+        """
+        with self._parsed_lock:
+            self._parsed = None
@@ -0,0 +1,181 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.logger import app_logger
+
+#: Categories warmed for each part of the application.
+PREFETCH_PROFILES = {
+    "character": ("classes", "subclasses", "levels", "languages", "races"),
+    "game": ("monsters", "spells"),
+}
+
+#: Handler methods that precompute derived tables, run right after their category loads.
+DERIVED_TABLES = {
+    "spells": "spell_damage",
+}
+
+
+class RulebookPreloader(QObject):
+    """
+    Loads rulebook categories on background threads.
+
+    Categories are read through the handler's normal ``get`` so they land
+    in its cache; widgets sharing the same handler then read them
+    instantly. Tables derived from a category (see :data:`DERIVED_TABLES`)
+    are built on the same thread before it counts as loaded. Completion is
+    reported with Qt signals, which are delivered on the GUI thread, and
+    :meth:`when_loaded` runs a callback there once every category it needs
+    has arrived.
+
+    Signals:
+        ``loaded(str)`` is emitted when a category finished loading.
+        ``failed(str, str)`` is emitted with the category and error message when loading failed.
+
+    :param api: Handler to warm; a new LocalAPIHandler by default.
+    :type api: LocalAPIHandler, optional
+    :param max_workers: Number of loader threads.
+    :type max_workers: int
+    :param parent: Optional Qt parent.
+    :type parent: QObject, optional
+    """
+
+    loaded = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+    #: Preloader used by dialogs that are not given one; set by the application at startup.
+    default = None
+
+    def __init__(self, api=None, max_workers=2, parent=None):
+        super().__init__(parent)
+        if api is None:
+            from core.db_api_handler import LocalAPIHandler
+            api = LocalAPIHandler()
+        self.api = api
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rulebook-preload")
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._done = set()
+        self._waiting = []      # (categories still missing, callback)
+        self.loaded.connect(self._on_finished)
+        self.failed.connect(lambda category, _message: self._on_finished(category))
+
+    def prefetch(self, categories):
+        """
+        Start loading categories that are not loaded or loading yet.
+
+        :param categories: Category names, e.g. ("monsters", "spells").
+        :type categories: iterable of str
+        :return: Mapping of each category to its Future.
+        :rtype: dict
+        """
+        futures = {}
+        with self._lock:
+            started = []
+            for category in categories:
+                future = self._futures.get(category)
+                if future is None:
+                    future = self._futures[category] = self._executor.submit(self._load, category)
+                    started.append((category, future))
+                futures[category] = future
+        for category, future in started:
+            future.add_done_callback(lambda f, c=category: self._report(c, f))
+        return futures
+
+    def prefetch_for(self, purpose):
+        """
+        Start loading the categories a part of the application needs.
+
+        :param purpose: A key of :data:`PREFETCH_PROFILES`, e.g. "character" or "game".
+        :type purpose: str
+        :return: Mapping of each category to its Future.
+        :rtype: dict
+        """
+        return self.prefetch(PREFETCH_PROFILES.get(purpose, ()))
+
+    def is_loaded(self, category):
+        """
+        Whether a category finished loading (successfully or not).
+
+        :param category: Category name.
+        :type category: str
+        :rtype: bool
+        """
+        with self._lock:
+            return category in self._done
+
+    def when_loaded(self, categories, callback):
+        """
+        Call `callback()` on the GUI thread once every category has finished loading.
+
+        Missing categories are prefetched. If all of them are already
+        loaded, the callback runs immediately. Failed categories count as
+        finished; the callback will then hit the error itself when reading them.
+
+        :param categories: Category names.
+        :type categories: iterable of str
+        :param callback: Function called without arguments.
+        :type callback: callable
+        """
+        categories = tuple(categories)
+        self.prefetch(categories)
+        with self._lock:
+            missing = {c for c in categories if c not in self._done}
+            if missing:
+                self._waiting.append((missing, callback))
+                return
+        self._call(callback)
+
+    def shutdown(self, wait=False):
+        """
+        Stop the loader threads, abandoning categories not started yet.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _load(self, category):
+        """
+        Runs on the loader thread; reads a category and builds its derived tables.
+        """
+        data = self.api.get(category)
+        derive = getattr(self.api, DERIVED_TABLES.get(category, ""), None)
+        if callable(derive):
+            derive()
+        return data
+
+    def _report(self, category, future):
+        """
+        Runs on the loader thread; turns the finished Future into a signal.
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            app_logger.debug(f"[RulebookPreloader] Loaded '{category}'")
+            self.loaded.emit(category)
+        else:
+            app_logger.error(f"[RulebookPreloader] Failed to load '{category}': {error}")
+            self.failed.emit(category, str(error))
+
+    def _on_finished(self, category):
+        """
+        Runs on the GUI thread; fires the callbacks that were waiting for `category`.
+        """
+        ready = []
+        with self._lock:
+            self._done.add(category)
+            still_waiting = []
+            for missing, callback in self._waiting:
+                missing.discard(category)
+                (still_waiting if missing else ready).append((missing, callback))
+            self._waiting = still_waiting
+        for _, callback in ready:
+            self._call(callback)
+
+    @staticmethod
+    def _call(callback):
+        # an exception escaping a Qt slot would abort the application
+        try:
+            callback()
+        except Exception as e:
+            app_logger.error(f"[RulebookPreloader] Callback {callback!r} failed: {e}")
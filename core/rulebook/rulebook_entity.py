@@ -111,16 +111,20 @@ class RulebookEntity:
         """
         Converts this RulebookEntity into a GameEntity for use in the game system.
 
+        The entity borrows this object's stats and abilities copy-on-write,
+        so converting the same monster many times is cheap; both read back
+        as read-only views until replaced or taken with
+        :func:`utils.copy_on_write.own`.
+
         :return: A GameEntity instance.
         :rtype: GameEntity
         """
         from models.entities.game_entity import GameEntity  # adjust if needed
-        return GameEntity(
-            name=self.name,
-            entity_type=self.entity_type,
-            stats=self.stats,
-            inventory=self.abilities  # temporary: treat abilities like inventory
-        )
+        from utils.copy_on_write import borrow
+        entity = GameEntity(name=self.name, entity_type=self.entity_type)
+        borrow(entity, "stats", self.stats)
+        borrow(entity, "inventory", self.abilities)  # temporary: treat abilities like inventory
+        return entity
 
     @classmethod
     def from_api(cls, data: dict):
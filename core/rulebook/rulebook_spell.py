@@ -97,10 +97,13 @@ class RulebookSpell:
         """
         Convert this RulebookSpell to a Spell instance from the models module.
 
+        The spell borrows this object's component list copy-on-write.
+
         :return: Spell instance with mapped properties.
         :rtype: Spell
         """
         from models.spell import Spell
+        from utils.copy_on_write import borrow
         # Build payloads
         damage_payload = (
             {"type": self.dc["ability"].lower(), "amount": self.damage.get(self.level)}
@@ -111,7 +114,7 @@ class RulebookSpell:
             if not self.damage else None
         )
         # Construct Spell with correct signature:
-        return Spell(
+        spell = Spell(
             self.name,
             interrupt_difficulty=0,
             cast_priority="normal",
@@ -119,10 +122,11 @@ class RulebookSpell:
             school=self.school,
             casting_time=self.casting_time,
             range=self.range,            # <— use `range=`, not `range_=`
-            components=self.components,
             duration=self.duration,
             description=self.description,
             damage=damage_payload,
             effect=effect_payload,
             reaction_mode="after"
         )
+        borrow(spell, "components", self.components)
+        return spell
@@ -0,0 +1,327 @@
+import bisect
+import difflib
+import re
+import sqlite3
+import threading
+from fractions import Fraction
+
+from core.logger import app_logger
+
+#: SRD category searched for each kind of record.
+CATEGORIES = {"monster": "monsters", "spell": "spells"}
+
+_SCHEMA = """
+CREATE TABLE records (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    cr REAL,
+    level INTEGER,
+    type TEXT,
+    school TEXT,
+    classes TEXT
+);
+CREATE INDEX records_kind ON records (kind, name);
+CREATE VIRTUAL TABLE search USING fts5(
+    name, category, classes, abilities, body,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE VIRTUAL TABLE vocab USING fts5vocab(search, 'row');
+"""
+
+# bm25 column weights, in the column order of the search table
+_WEIGHTS = (10.0, 4.0, 2.0, 1.5, 1.0)
+
+_COMPARISON = r"(<=|≤|>=|≥|<|>|=|:)?\s*"
+_CR_FILTER = re.compile(r"\bcr\s*" + _COMPARISON + r"(\d+(?:/\d+|\.\d+)?)", re.IGNORECASE)
+_LEVEL_FILTER = re.compile(
+    r"\b(?:level|lvl)\s*" + _COMPARISON + r"(\d)\b|\b(\d)(?:st|nd|rd|th)[- ]level\b|\bcantrips?\b",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[\w']+", re.UNICODE)
+_OPERATORS = {"<=": "<=", "≤": "<=", ">=": ">=", "≥": ">=", "<": "<", ">": ">", "=": "=", ":": "=", None: "="}
+
+
+class SearchHit:
+    """
+    One ranked search result.
+
+    :ivar kind: "monster" or "spell".
+    :ivar slug: The entry's SRD index.
+    :ivar name: Display name.
+    :ivar score: bm25 rank; lower is better, 0 when no text was searched.
+    """
+
+    __slots__ = ("kind", "slug", "name", "score")
+
+    def __init__(self, kind, slug, name, score):
+        self.kind = kind
+        self.slug = slug
+        self.name = name
+        self.score = score
+
+    def __repr__(self):
+        return f"<SearchHit {self.kind}:{self.slug} {self.score:.2f}>"
+
+
+class SearchPage:
+    """
+    One page of search results.
+
+    :ivar hits: The hits on this page, best first.
+    :ivar total: Number of matches across all pages.
+    :ivar offset: Index of the first hit on this page.
+    :ivar limit: Page size.
+    :ivar filters: Structured filters recognised in the query.
+    """
+
+    def __init__(self, hits, total, offset, limit, filters):
+        self.hits = hits
+        self.total = total
+        self.offset = offset
+        self.limit = limit
+        self.filters = filters
+
+    @property
+    def has_more(self):
+        """
+        Whether further pages exist.
+
+        :rtype: bool
+        """
+        return self.offset + len(self.hits) < self.total
+
+    def names(self):
+        """
+        Names of the hits on this page.
+
+        :rtype: list[str]
+        """
+        return [hit.name for hit in self.hits]
+
+
+def _type_keyword(monster_type):
+    """Normalise an SRD monster type ("swarm of Tiny beasts" → "swarm")."""
+    monster_type = (monster_type or "").lower()
+    return "swarm" if monster_type.startswith("swarm") else monster_type
+
+
+def _singular(word):
+    return word[:-1] if len(word) > 3 and word.endswith("s") else word
+
+
+class RulebookSearch:
+    """
+    Full-text and structured search over the rulebook's monsters and spells.
+
+    Records are indexed in an in-memory SQLite FTS5 table the first time a
+    kind is searched. Free text is matched by prefix and ranked with bm25,
+    weighting names above descriptions; words that match nothing in the
+    index are replaced by their closest indexed spellings. Queries may also
+    contain structured filters: ``CR <= 2`` (also ``≤``, ``>=``, ``=``,
+    fractions like ``1/4``), ``level 3``/``3rd level``/``cantrip``, and
+    monster types, spell schools and class names as plain words, e.g.
+    ``"CR ≤ 2 undead"`` or ``"evocation level 3 wizard"``.
+
+    :param api: Handler providing ``iter_entries(category)`` or ``get(category)`` (e.g. LocalAPIHandler).
+    :type api: object
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._indexed = set()
+        self._vocab = []
+        self._types = set()
+        self._schools = set()
+        self._classes = set()
+
+    # -- indexing -------------------------------------------------------
+
+    def ensure_indexed(self, kind):
+        """
+        Index one kind of record if that has not happened yet.
+
+        :param kind: "monster" or "spell".
+        :type kind: str
+        :raises ValueError: For an unknown kind.
+        """
+        if kind not in CATEGORIES:
+            raise ValueError(f"Unknown search kind: {kind!r}")
+        with self._lock:
+            if kind in self._indexed:
+                return
+            if hasattr(self.api, "iter_entries"):
+                # a streaming handler only keeps summaries; index the full entries
+                entries = self.api.iter_entries(CATEGORIES[kind])
+            else:
+                entries = self.api.get(CATEGORIES[kind]) or []
+            rows = [self._monster_row(e) if kind == "monster" else self._spell_row(e)
+                    for e in entries if isinstance(e, dict) and e.get("name")]
+            with self._conn:
+                for record, document in rows:
+                    cur = self._conn.execute(
+                        "INSERT INTO records (kind, slug, name, cr, level, type, school, classes) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (kind,) + record,
+                    )
+                    self._conn.execute(
+                        "INSERT INTO search (rowid, name, category, classes, abilities, body) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (cur.lastrowid,) + document,
+                    )
+                # merge the index segments so prefix queries touch one b-tree
+                self._conn.execute("INSERT INTO search (search) VALUES ('optimize')")
+            self._indexed.add(kind)
+            self._vocab = sorted(t for (t,) in self._conn.execute("SELECT term FROM vocab"))
+            app_logger.debug(f"[RulebookSearch] Indexed {len(rows)} {kind} records")
+
+    def _monster_row(self, m):
+        abilities = [f"{a.get('name', '')} {a.get('desc', '')}"
+                     for key in ("special_abilities", "actions", "legendary_actions", "reactions")
+                     for a in (m.get(key) or []) if isinstance(a, dict)]
+        monster_type = _type_keyword(m.get("type"))
+        self._types.add(monster_type)
+        cr = m.get("challenge_rating")
+        record = (m.get("index") or m["name"], m["name"], cr, None, monster_type, None, None)
+        category = " ".join(filter(None, (m.get("type"), m.get("subtype"), m.get("size"), m.get("alignment"))))
+        document = (m["name"], category, "", "\n".join(abilities), f"CR {cr}")
+        return record, document
+
+    def _spell_row(self, s):
+        school = ((s.get("school") or {}).get("name") or "").lower()
+        classes = [c.get("name", "").lower() for c in s.get("classes") or []]
+        subclasses = [c.get("name", "").lower() for c in s.get("subclasses") or []]
+        self._schools.add(school)
+        self._classes.update(classes)
+        record = (s.get("index") or s["name"], s["name"], None, s.get("level"), None, school,
+                  "," + ",".join(classes) + ",")
+        body = "\n".join(list(s.get("desc") or []) + list(s.get("higher_level") or []))
+        document = (s["name"], school, " ".join(classes + subclasses), "", body)
+        return record, document
+
+    # -- querying -------------------------------------------------------
+
+    def _parse(self, query, kinds):
+        """
+        Split a query into structured filters and free-text words.
+
+        Monster types only become filters when monsters are searched, and
+        spell schools and classes only when spells are; otherwise they stay
+        free text.
+
+        :param query: The query.
+        :type query: str
+        :param kinds: Kinds being searched.
+        :type kinds: list
+        :return: ``(filters, words)`` where filters is a list of ``(column, op, value)``.
+        :rtype: tuple
+        """
+        filters = []
+
+        def take_cr(match):
+            value = float(Fraction(match.group(2)))
+            filters.append(("cr", _OPERATORS[match.group(1)], value))
+            return " "
+
+        def take_level(match):
+            if match.group(2) is not None:
+                filters.append(("level", _OPERATORS[match.group(1)], int(match.group(2))))
+            elif match.group(3) is not None:
+                filters.append(("level", "=", int(match.group(3))))
+            else:
+                filters.append(("level", "=", 0))
+            return " "
+
+        rest = _CR_FILTER.sub(take_cr, query)
+        rest = _LEVEL_FILTER.sub(take_level, rest)
+        types = self._types if "monster" in kinds else ()
+        schools = self._schools if "spell" in kinds else ()
+        classes = self._classes if "spell" in kinds else ()
+        words = []
+        for word in _WORD.findall(rest.lower()):
+            single = _singular(word)
+            if word in types or single in types:
+                filters.append(("type", "=", word if word in types else single))
+            elif word in schools:
+                filters.append(("school", "=", word))
+            elif word in classes or single in classes:
+                filters.append(("classes", "LIKE", f"%,{word if word in classes else single},%"))
+            else:
+                words.append(word)
+        return filters, words
+
+    def _match_expression(self, words):
+        """
+        Build an FTS5 MATCH expression, replacing unknown words by close spellings.
+
+        :return: The expression, or None if there are no words.
+        :rtype: str or None
+        """
+        groups = []
+        vocab = self._vocab
+        for word in words:
+            i = bisect.bisect_left(vocab, word)
+            if i < len(vocab) and vocab[i].startswith(word):
+                groups.append(f'"{word}"*')
+                continue
+            # typos rarely change the first letter; checking only those terms keeps this fast
+            lo = bisect.bisect_left(vocab, word[0])
+            hi = bisect.bisect_left(vocab, chr(ord(word[0]) + 1))
+            candidates = [t for t in vocab[lo:hi] if abs(len(t) - len(word)) <= 2]
+            close = difflib.get_close_matches(word, candidates, n=3, cutoff=0.75)
+            if close:
+                groups.append("(" + " OR ".join(f'"{c}"' for c in close) + ")")
+            else:
+                groups.append(f'"{word}"*')
+        return " AND ".join(groups) if groups else None
+
+    def search(self, query="", kind=None, limit=20, offset=0):
+        """
+        Run a ranked, paged search.
+
+        :param query: Free text with optional structured filters.
+        :type query: str
+        :param kind: Restrict to "monster" or "spell"; None searches both.
+        :type kind: str, optional
+        :param limit: Page size.
+        :type limit: int
+        :param offset: Index of the first hit to return.
+        :type offset: int
+        :return: The requested page.
+        :rtype: SearchPage
+        """
+        kinds = [kind] if kind else list(CATEGORIES)
+        for k in kinds:
+            self.ensure_indexed(k)
+        filters, words = self._parse(query or "", kinds)
+        match = self._match_expression(words)
+
+        where = ["r.kind IN (%s)" % ", ".join("?" * len(kinds))]
+        params = list(kinds)
+        for column, op, value in filters:
+            where.append(f"r.{column} {op} ?")
+            params.append(value)
+        if match:
+            # CROSS JOIN keeps the MATCH as the outer loop instead of re-running it per record
+            source = "search CROSS JOIN records r ON r.id = search.rowid"
+            where.insert(0, "search MATCH ?")
+            params.insert(0, match)
+            score = "bm25(search, %s)" % ", ".join(str(w) for w in _WEIGHTS)
+            order = "score, r.name"
+        else:
+            source = "records r"
+            score = "0.0"
+            order = "r.name"
+        clause = " AND ".join(where)
+        with self._lock:
+            total = self._conn.execute(f"SELECT count(*) FROM {source} WHERE {clause}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT r.kind, r.slug, r.name, {score} AS score FROM {source} "
+                f"WHERE {clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        return SearchPage([SearchHit(*row) for row in rows], total, offset, limit, filters)
@@ -0,0 +1,225 @@
+import bisect
+
+import numpy as np
+
+from core.logger import app_logger
+from models.flow.dice import DiceError, compile_dice
+
+
+class DamageProfile:
+    """
+    Precomputed statistics of one damage expression.
+
+    Named modifiers such as ``MOD`` count as 0, so the figures are those of
+    the dice alone plus any constant.
+
+    :ivar expression: The dice expression, e.g. "8d6".
+    :ivar min: Lowest total.
+    :ivar max: Highest total.
+    :ivar mean: Expected total.
+    :ivar probabilities: Probability of each total from :attr:`min` to :attr:`max`.
+    """
+
+    __slots__ = ("expression", "min", "max", "mean", "probabilities")
+
+    def __init__(self, expression):
+        plan = compile_dice(expression)
+        distribution = plan.distribution()
+        self.expression = expression
+        self.min, self.max = plan.bounds()
+        self.mean = float(plan.mean())
+        self.probabilities = np.zeros(self.max - self.min + 1)
+        for total, p in distribution.items():
+            self.probabilities[total - self.min] = float(p)
+
+    def __repr__(self):
+        return f"<DamageProfile {self.expression!r} {self.min}-{self.max}, mean {self.mean:g}>"
+
+    def distribution(self):
+        """
+        Probability of every possible total.
+
+        :return: Mapping of total to probability.
+        :rtype: dict
+        """
+        return {self.min + i: float(p) for i, p in enumerate(self.probabilities) if p}
+
+    def probability_at_least(self, target):
+        """
+        Probability that a roll reaches `target`.
+
+        :param target: Threshold total.
+        :type target: int
+        :rtype: float
+        """
+        start = max(int(target) - self.min, 0)
+        return float(self.probabilities[start:].sum())
+
+
+class SpellDamage:
+    """
+    Damage profiles of one spell at every slot level or, for cantrips, character level.
+
+    :ivar slug: SRD index.
+    :ivar name: Display name.
+    :ivar level: Spell level; 0 for cantrips.
+    :ivar damage_type: Damage type index, e.g. "fire", or None.
+    :ivar by_slot_level: Mapping of slot level to DamageProfile.
+    :ivar by_character_level: Mapping of the character level at which damage
+        increases to DamageProfile (cantrips).
+    """
+
+    def __init__(self, slug, name, level, damage_type, by_slot_level, by_character_level):
+        self.slug = slug
+        self.name = name
+        self.level = level
+        self.damage_type = damage_type
+        self.by_slot_level = by_slot_level
+        self.by_character_level = by_character_level
+        self._steps = sorted(by_character_level)
+
+    def __repr__(self):
+        return f"<SpellDamage {self.slug} level {self.level}>"
+
+    def at(self, slot_level=None, character_level=1):
+        """
+        Get the damage profile when cast at a slot level or by a character of a level.
+
+        :param slot_level: Slot used; the spell's lowest listed slot by default.
+            Slots above the highest listed one use the highest.
+        :type slot_level: int, optional
+        :param character_level: Caster level, for damage that scales with it.
+        :type character_level: int
+        :return: The profile, or None if the spell cannot be cast that way.
+        :rtype: DamageProfile or None
+        """
+        if self.by_slot_level:
+            slots = sorted(self.by_slot_level)
+            if slot_level is None:
+                return self.by_slot_level[slots[0]]
+            if slot_level < slots[0]:
+                return None
+            return self.by_slot_level[slots[bisect.bisect_right(slots, slot_level) - 1]]
+        if self._steps:
+            position = bisect.bisect_right(self._steps, character_level) - 1
+            return self.by_character_level[self._steps[max(position, 0)]]
+        return None
+
+
+def _profiles(table, slug, shared):
+    profiles = {}
+    for level, expression in (table or {}).items():
+        try:
+            if expression not in shared:
+                shared[expression] = DamageProfile(expression)
+            profiles[int(level)] = shared[expression]
+        except (DiceError, ValueError) as e:
+            app_logger.warning(f"[SpellDamage] Skipping {slug} level {level} '{expression}': {e}")
+    return profiles
+
+
+class SpellDamageTable:
+    """
+    Damage profiles of every damaging spell, computed once from the SRD.
+
+    Dice are parsed and their distributions computed up front, so pickers
+    can sort and filter by expected damage without touching dice strings::
+
+        table = api.spell_damage()
+        [s.name for s, p in table.rank(slot_level=3, min_mean=20)]
+
+    :param spells: Full SRD spell entries.
+    :type spells: list[dict]
+    """
+
+    def __init__(self, spells):
+        self.spells = {}
+        self.aliases = {}
+        shared = {}     # the SRD reuses few expressions; profile each once
+        for entry in spells or ():
+            damage = entry.get("damage") if isinstance(entry, dict) else None
+            if not damage:
+                continue
+            slug = entry.get("index") or entry.get("name")
+            by_slot = _profiles(damage.get("damage_at_slot_level"), slug, shared)
+            by_character = _profiles(damage.get("damage_at_character_level"), slug, shared)
+            if not by_slot and not by_character:
+                continue
+            damage_type = (damage.get("damage_type") or {}).get("index")
+            spell = SpellDamage(slug, entry.get("name", slug), entry.get("level", 0),
+                                damage_type, by_slot, by_character)
+            self.spells[slug] = spell
+            self.aliases[spell.name.lower()] = slug
+
+    def __len__(self):
+        return len(self.spells)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key):
+        """
+        Get a spell's damage by slug or name.
+
+        :param key: Slug or display name, in any case.
+        :type key: str
+        :rtype: SpellDamage or None
+        """
+        spell = self.spells.get(key)
+        if spell is None:
+            slug = self.aliases.get(key.lower())
+            spell = self.spells.get(slug) if slug else None
+        return spell
+
+    def expected(self, key, slot_level=None, character_level=1):
+        """
+        Expected damage of a spell, see :meth:`SpellDamage.at`.
+
+        :return: The mean, or None if the spell deals no damage that way.
+        :rtype: float or None
+        """
+        spell = self.get(key)
+        profile = spell.at(slot_level, character_level) if spell else None
+        return profile.mean if profile else None
+
+    def rank(self, slot_level=None, character_level=1, damage_type=None,
+             min_mean=None, max_mean=None, max_spell_level=None, descending=True):
+        """
+        List spells with their damage at a slot or character level, ordered by expected damage.
+
+        With a `slot_level`, spells of a higher level than the slot are left
+        out and cantrips use `character_level`.
+
+        :param slot_level: Slot used; each spell's own level by default.
+        :type slot_level: int, optional
+        :param character_level: Caster level, for cantrips.
+        :type character_level: int
+        :param damage_type: Keep only spells of this damage type.
+        :type damage_type: str, optional
+        :param min_mean: Lowest expected damage.
+        :type min_mean: float, optional
+        :param max_mean: Highest expected damage.
+        :type max_mean: float, optional
+        :param max_spell_level: Highest spell level.
+        :type max_spell_level: int, optional
+        :param descending: Highest expected damage first.
+        :type descending: bool
+        :return: List of ``(SpellDamage, DamageProfile)``.
+        :rtype: list[tuple]
+        """
+        ranked = []
+        for spell in self.spells.values():
+            if max_spell_level is not None and spell.level > max_spell_level:
+                continue
+            if damage_type is not None and spell.damage_type != damage_type:
+                continue
+            profile = spell.at(slot_level, character_level)
+            if profile is None:
+                continue
+            if min_mean is not None and profile.mean < min_mean:
+                continue
+            if max_mean is not None and profile.mean > max_mean:
+                continue
+            ranked.append((spell, profile))
+        ranked.sort(key=lambda item: (-item[1].mean if descending else item[1].mean, item[0].name))
+        return ranked
@@ -44,12 +44,13 @@ class SpellImporter(BaseImporter):
         """
         Retrieves a spell by its name.
 
+        Parsed spells are memoized (see :meth:`BaseImporter.get_parsed`);
+        the returned object is shared and should not be modified.
+
         :param name: The name of the spell to retrieve.
         :type name: str
         :return: A RulebookSpell instance if found, otherwise None.
         :rtype: RulebookSpell or None
         """
-        slug = slugify(name)
-        raw = self.api.get_raw(f"/api/{self.endpoint}/{slug}")
-        return RulebookSpell.from_api(raw) if raw else None
+        return self.get_parsed(name)
     
\ No newline at end of file
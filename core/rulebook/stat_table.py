@@ -0,0 +1,292 @@
+import re
+
+import numpy as np
+
+from core.logger import app_logger
+
+#: Damage types with one bit each in the immunity, resistance and vulnerability masks.
+DAMAGE_TYPES = (
+    "acid", "bludgeoning", "cold", "fire", "force", "lightning", "necrotic",
+    "piercing", "poison", "psychic", "radiant", "slashing", "thunder",
+)
+#: Extra damage bit for qualified entries such as "bludgeoning, piercing, and
+#: slashing from nonmagical weapons"; the plain type bits are not set for those.
+NONMAGICAL = "nonmagical"
+
+#: Conditions with one bit each in the condition immunity mask.
+CONDITIONS = (
+    "blinded", "charmed", "deafened", "exhaustion", "frightened", "grappled",
+    "incapacitated", "invisible", "paralyzed", "petrified", "poisoned", "prone",
+    "restrained", "stunned", "unconscious",
+)
+
+_DAMAGE_BITS = {name: 1 << i for i, name in enumerate(DAMAGE_TYPES + (NONMAGICAL,))}
+_CONDITION_BITS = {name: 1 << i for i, name in enumerate(CONDITIONS)}
+
+_ABILITIES = {
+    "str": "strength", "dex": "dexterity", "con": "constitution",
+    "int": "intelligence", "wis": "wisdom", "cha": "charisma",
+}
+_SPEEDS = ("walk", "fly", "swim", "climb", "burrow")
+
+#: Numeric columns and their dtypes.
+COLUMNS = dict(
+    [("hp", np.int32), ("ac", np.int16), ("cr", np.float32), ("xp", np.int32),
+     ("proficiency_bonus", np.int8), ("passive_perception", np.int16)]
+    + [(ability, np.int16) for ability in _ABILITIES]
+    + [(f"speed_{mode}", np.int16) for mode in _SPEEDS]
+)
+
+_FEET = re.compile(r"(\d+)")
+_OPERATORS = {
+    "min": np.greater_equal, "max": np.less_equal,
+    "gt": np.greater, "lt": np.less, "eq": np.equal,
+}
+
+
+def _feet(value):
+    match = _FEET.search(value) if isinstance(value, str) else None
+    return int(match.group(1)) if match else 0
+
+
+def _damage_mask(entries):
+    bits = 0
+    for entry in entries or ():
+        text = entry.lower() if isinstance(entry, str) else ""
+        if " from " in text or text.startswith("damage from"):
+            bits |= _DAMAGE_BITS[NONMAGICAL] if "nonmagical" in text else 0
+            continue
+        for word in re.findall(r"[a-z]+", text):
+            bits |= _DAMAGE_BITS.get(word, 0)
+    return bits
+
+
+def _bits_for(names, table, kind):
+    bits = 0
+    for name in [names] if isinstance(names, str) else names:
+        try:
+            bits |= table[name.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown {kind}: {name!r}") from None
+    return bits
+
+
+class MonsterStatTable:
+    """
+    Column-oriented monster statistics for vectorized filtering and sorting.
+
+    Every stat in :data:`COLUMNS` is a NumPy array with one row per monster,
+    in the order of the source list. Damage immunities, resistances and
+    vulnerabilities are ``uint16`` bitsets over :data:`DAMAGE_TYPES` (plus
+    :data:`NONMAGICAL`) and condition immunities over :data:`CONDITIONS`,
+    so predicates like "AC at least 15 and immune to fire" are a handful of
+    array operations::
+
+        table = MonsterStatTable.from_api(api)
+        rows = table.filter(min_ac=15, immune="fire")
+        table.names(table.sort("cr", rows, descending=True))
+
+    :param monsters: SRD monster entries.
+    :type monsters: list[dict]
+    """
+
+    def __init__(self, monsters):
+        monsters = [m for m in monsters or () if isinstance(m, dict) and m.get("name")]
+        n = len(monsters)
+        self.slugs = [m.get("index") or m["name"] for m in monsters]
+        self.names_ = [m["name"] for m in monsters]
+        self.columns = {name: np.zeros(n, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.immunities = np.zeros(n, dtype=np.uint16)
+        self.resistances = np.zeros(n, dtype=np.uint16)
+        self.vulnerabilities = np.zeros(n, dtype=np.uint16)
+        self.condition_immunities = np.zeros(n, dtype=np.uint16)
+        self.types = sorted({(m.get("type") or "").lower() for m in monsters})
+        self.sizes = sorted({(m.get("size") or "").lower() for m in monsters})
+        self.type_codes = np.zeros(n, dtype=np.int16)
+        self.size_codes = np.zeros(n, dtype=np.int16)
+        self.row_of = {slug: i for i, slug in enumerate(self.slugs)}
+
+        type_code = {t: i for i, t in enumerate(self.types)}
+        size_code = {s: i for i, s in enumerate(self.sizes)}
+        cols = self.columns
+        for i, m in enumerate(monsters):
+            armor = m.get("armor_class")
+            if isinstance(armor, list) and armor:
+                cols["ac"][i] = armor[0].get("value") or 0
+            elif isinstance(armor, int):
+                cols["ac"][i] = armor
+            cols["hp"][i] = m.get("hit_points") or 0
+            cols["cr"][i] = m.get("challenge_rating") or 0
+            cols["xp"][i] = m.get("xp") or 0
+            cols["proficiency_bonus"][i] = m.get("proficiency_bonus") or 0
+            cols["passive_perception"][i] = (m.get("senses") or {}).get("passive_perception") or 0
+            for short, long in _ABILITIES.items():
+                cols[short][i] = m.get(long) or 0
+            speed = m.get("speed") or {}
+            for mode in _SPEEDS:
+                cols[f"speed_{mode}"][i] = _feet(speed.get(mode))
+            self.immunities[i] = _damage_mask(m.get("damage_immunities"))
+            self.resistances[i] = _damage_mask(m.get("damage_resistances"))
+            self.vulnerabilities[i] = _damage_mask(m.get("damage_vulnerabilities"))
+            self.condition_immunities[i] = sum(
+                _CONDITION_BITS.get(c.get("index"), 0) for c in m.get("condition_immunities") or ()
+                if isinstance(c, dict)
+            )
+            self.type_codes[i] = type_code[(m.get("type") or "").lower()]
+            self.size_codes[i] = size_code[(m.get("size") or "").lower()]
+
+    @classmethod
+    def from_api(cls, api):
+        """
+        Build the table from a handler's monster category.
+
+        In streaming mode the handler only keeps summaries, so full entries
+        are read through ``iter_entries``.
+
+        :param api: Handler such as LocalAPIHandler.
+        :type api: object
+        :rtype: MonsterStatTable
+        """
+        if getattr(api, "streaming", False):
+            monsters = list(api.iter_entries("monsters"))
+        else:
+            monsters = api.get("monsters")
+        table = cls(monsters)
+        app_logger.debug(f"[MonsterStatTable] Built {len(table)} rows")
+        return table
+
+    def __len__(self):
+        return len(self.slugs)
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def all(self):
+        """
+        Mask selecting every row.
+
+        :rtype: numpy.ndarray
+        """
+        return np.ones(len(self), dtype=bool)
+
+    def immune_to(self, damage_types):
+        """
+        Mask of monsters immune to every given damage type.
+
+        :param damage_types: Name or names from :data:`DAMAGE_TYPES` or "nonmagical".
+        :type damage_types: str or iterable of str
+        :rtype: numpy.ndarray
+        """
+        bits = _bits_for(damage_types, _DAMAGE_BITS, "damage type")
+        return (self.immunities & bits) == bits
+
+    def resistant_to(self, damage_types):
+        """
+        Mask of monsters resistant or immune to every given damage type.
+
+        :rtype: numpy.ndarray
+        """
+        bits = _bits_for(damage_types, _DAMAGE_BITS, "damage type")
+        return ((self.resistances | self.immunities) & bits) == bits
+
+    def vulnerable_to(self, damage_types):
+        """
+        Mask of monsters vulnerable to every given damage type.
+
+        :rtype: numpy.ndarray
+        """
+        bits = _bits_for(damage_types, _DAMAGE_BITS, "damage type")
+        return (self.vulnerabilities & bits) == bits
+
+    def condition_immune_to(self, conditions):
+        """
+        Mask of monsters immune to every given condition.
+
+        :param conditions: Name or names from :data:`CONDITIONS`.
+        :type conditions: str or iterable of str
+        :rtype: numpy.ndarray
+        """
+        bits = _bits_for(conditions, _CONDITION_BITS, "condition")
+        return (self.condition_immunities & bits) == bits
+
+    def of_type(self, types):
+        """
+        Mask of monsters of any of the given types.
+
+        :param types: Type name or names, e.g. "undead".
+        :type types: str or iterable of str
+        :rtype: numpy.ndarray
+        """
+        wanted = [types] if isinstance(types, str) else list(types)
+        codes = [self.types.index(t.lower()) for t in wanted if t.lower() in self.types]
+        return np.isin(self.type_codes, codes)
+
+    def filter(self, type=None, immune=None, resistant=None, vulnerable=None,
+               condition_immune=None, **bounds):
+        """
+        Select rows matching every criterion.
+
+        Numeric criteria are written ``<op>_<column>`` with op one of
+        ``min``, ``max``, ``gt``, ``lt`` or ``eq``, e.g. ``min_ac=15`` or
+        ``max_cr=2``.
+
+        :param type: Monster type(s).
+        :param immune: Damage type(s) the monster must be immune to.
+        :param resistant: Damage type(s) the monster must resist or be immune to.
+        :param vulnerable: Damage type(s) the monster must be vulnerable to.
+        :param condition_immune: Condition(s) the monster must be immune to.
+        :return: Indices of the matching rows, in table order.
+        :rtype: numpy.ndarray
+        :raises ValueError: For an unknown column, operator, damage type or condition.
+        """
+        mask = self.all()
+        for key, value in bounds.items():
+            op, _, column = key.partition("_")
+            if op not in _OPERATORS or column not in self.columns:
+                raise ValueError(f"Unknown filter: {key!r}")
+            mask &= _OPERATORS[op](self.columns[column], value)
+        if type is not None:
+            mask &= self.of_type(type)
+        if immune is not None:
+            mask &= self.immune_to(immune)
+        if resistant is not None:
+            mask &= self.resistant_to(resistant)
+        if vulnerable is not None:
+            mask &= self.vulnerable_to(vulnerable)
+        if condition_immune is not None:
+            mask &= self.condition_immune_to(condition_immune)
+        return np.flatnonzero(mask)
+
+    def sort(self, column, rows=None, descending=False):
+        """
+        Order rows by a column; ties keep their table order.
+
+        :param column: Column name.
+        :type column: str
+        :param rows: Row indices to sort; all rows by default.
+        :type rows: numpy.ndarray, optional
+        :param descending: Largest values first.
+        :type descending: bool
+        :return: The sorted row indices.
+        :rtype: numpy.ndarray
+        """
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+        values = self.columns[column][rows]
+        order = np.argsort(-values if descending else values, kind="stable")
+        return rows[order]
+
+    def names(self, rows):
+        """
+        Display names of rows.
+
+        :rtype: list[str]
+        """
+        return [self.names_[i] for i in rows]
+
+    def slugs_of(self, rows):
+        """
+        SRD indexes of rows.
+
+        :rtype: list[str]
+        """
+        return [self.slugs[i] for i in rows]
@@ -0,0 +1,220 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.logger import app_logger
+from core.map_format import build_map
+from core.scenario_catalog import ScenarioCatalog, make_thumbnail
+
+
+class MapSnapshot:
+    """
+    Everything needed to write a map, copied from the scene on the GUI thread.
+
+    :param path: Map file to write.
+    :type path: Path
+    :param store: MapStore of that file.
+    :type store: core.map_store.MapStore
+    :param tiles: Serialized tiles (``TileData.to_dict``); all of them for a
+        full save, the changed ones otherwise.
+    :type tiles: list[dict]
+    :param full: Rewrite the whole file; otherwise journal `tiles`.
+    :type full: bool
+    :param meta: Map metadata, for a full save.
+    :type meta: dict, optional
+    :param summary: Counts for the scenario catalog (see
+        :meth:`ScenarioCatalog.record`); None leaves the catalog alone.
+    :type summary: dict, optional
+    :param colors: Overlay color by ``(row, col)``, for the catalog thumbnail.
+    :type colors: dict, optional
+    """
+
+    def __init__(self, path, store, tiles, full=True, meta=None, summary=None, colors=None):
+        self.path = Path(path)
+        self.store = store
+        self.tiles = {tuple(tile["position"]): tile for tile in tiles}
+        self.full = full
+        self.meta = meta
+        self.summary = summary
+        self.colors = colors
+
+    def merge(self, newer):
+        """
+        Fold a later snapshot of the same file into this one.
+
+        A full snapshot replaces everything; changed tiles are applied over
+        the tiles already held, so nothing either snapshot carried is lost.
+
+        :param newer: The later snapshot.
+        :type newer: MapSnapshot
+        """
+        if newer.full:
+            self.tiles = newer.tiles
+            self.full = True
+            self.meta = newer.meta
+            self.store = newer.store
+        else:
+            self.tiles.update(newer.tiles)
+        if newer.summary is not None:
+            self.summary = newer.summary
+            self.colors = newer.colors
+
+
+class MapSaveWorker(QObject):
+    """
+    Writes map snapshots on a background thread.
+
+    Snapshots are written one at a time, in order: the previous file is
+    backed up, then the map is written through its MapStore (atomically for
+    full saves, as fsynced journal lines otherwise) and its catalog entry is
+    updated. A snapshot submitted while another one for the same file is
+    still waiting is merged into it, so a burst of saves costs one write.
+    Once a write of a file fails, journaled snapshots of that file are
+    refused until a full snapshot of it is written, so tiles of the failed
+    snapshot are never silently left out (see :meth:`needs_full_save`).
+
+    Signals:
+        ``saved(str)`` is emitted with the file path once a snapshot is written.
+        ``failed(str, str)`` is emitted with the file path and error message when writing failed.
+
+    :param backup_manager: Backs up a file before it is overwritten; None to skip backups.
+    :type backup_manager: BackupManager, optional
+    :param parent: Optional Qt parent.
+    :type parent: QObject, optional
+    """
+
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, backup_manager=None, parent=None):
+        super().__init__(parent)
+        self.backup_manager = backup_manager
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-save")
+        self._lock = threading.Lock()
+        self._waiting = {}      # path -> snapshot not started yet
+        self._futures = set()
+        self._broken = set()    # paths whose last write failed
+
+    def submit(self, snapshot):
+        """
+        Queue a snapshot for writing.
+
+        :param snapshot: The snapshot.
+        :type snapshot: MapSnapshot
+        :return: True if it was merged into a snapshot already waiting.
+        :rtype: bool
+        """
+        with self._lock:
+            waiting = self._waiting.get(snapshot.path)
+            if waiting is not None:
+                waiting.merge(snapshot)
+                return True
+            self._waiting[snapshot.path] = snapshot
+            future = self._executor.submit(self._run, snapshot.path)
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        return False
+
+    def needs_full_save(self, path):
+        """
+        Whether the next snapshot of a file must be a full one.
+
+        True from the moment a write of `path` fails until a full snapshot
+        of it is written; unlike the ``failed`` signal, this is up to date
+        before the GUI thread handles any queued events.
+
+        :param path: Map file.
+        :type path: str or Path
+        :rtype: bool
+        """
+        with self._lock:
+            return Path(path) in self._broken
+
+    @property
+    def busy(self):
+        """
+        Whether snapshots are being written or waiting.
+
+        :rtype: bool
+        """
+        with self._lock:
+            return bool(self._futures)
+
+    def flush(self, timeout=None):
+        """
+        Block until every snapshot queued so far is written.
+
+        :param timeout: Seconds to wait at most.
+        :type timeout: float, optional
+        :return: True if nothing is left to write.
+        :rtype: bool
+        """
+        with self._lock:
+            futures = set(self._futures)
+        done, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def shutdown(self, wait=True):
+        """
+        Stop the writer thread, by default after the queued snapshots are written.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _run(self, path):
+        """
+        Runs on the writer thread; writes the snapshot waiting for `path`.
+        """
+        with self._lock:
+            snapshot = self._waiting.pop(path)
+        try:
+            self._write(snapshot)
+        except Exception as e:
+            with self._lock:
+                self._broken.add(path)
+            app_logger.error(f"[MapSaveWorker] Saving {path} failed: {e}")
+            self.failed.emit(str(path), str(e))
+        else:
+            if snapshot.full:
+                with self._lock:
+                    self._broken.discard(path)
+            self.saved.emit(str(path))
+
+    def _write(self, snapshot):
+        path, store = snapshot.path, snapshot.store
+        if not snapshot.full and self.needs_full_save(path):
+            raise RuntimeError("An earlier save of this file failed; it needs a full save")
+        if self.backup_manager is not None and path.exists():
+            self.backup_manager.backup_map(path)
+
+        tiles = list(snapshot.tiles.values())
+        if snapshot.full:
+            store.write_full(build_map(tiles, meta=snapshot.meta))
+            app_logger.info(f"[Saved] Map written to {path}")
+        else:
+            store.append(tiles)
+            app_logger.info(f"[Saved] {len(tiles)} changed tiles journaled to {path}")
+            if store.needs_compaction():
+                store.compact()
+
+        if snapshot.summary is not None:
+            self._update_catalog(snapshot)
+
+    @staticmethod
+    def _update_catalog(snapshot):
+        catalog = ScenarioCatalog.for_map(snapshot.path)
+        if catalog is None:
+            return
+        try:
+            summary = snapshot.summary
+            thumbnail = make_thumbnail(snapshot.colors or {}, summary["rows"], summary["cols"])
+            catalog.record(snapshot.path, summary, snapshot.meta if snapshot.full else None, thumbnail)
+        except Exception as e:
+            app_logger.warning(f"[Catalog] Could not update entry for {snapshot.path}: {e}")
+        finally:
+            catalog.close()
@@ -0,0 +1,365 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QColor, QImage
+
+from core import map_format
+from core.logger import app_logger
+from core.map_store import journal_path, load_map
+
+#: Bumped whenever the table layout changes; older catalogs are rebuilt.
+CATALOG_FORMAT_VERSION = 1
+
+#: File name of the catalog, kept inside the workspace folder.
+CATALOG_NAME = ".catalog.sqlite"
+
+#: Name of the map file inside a scenario folder.
+MAP_NAME = "map.json"
+
+#: Longest side of a thumbnail, in pixels.
+THUMBNAIL_SIZE = 128
+
+#: Modification times this recent are not trusted to reveal the next change.
+RACY_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS scenarios (
+    name TEXT PRIMARY KEY,
+    author TEXT,
+    created TEXT,
+    grid_type TEXT,
+    rows INTEGER,
+    cols INTEGER,
+    tiles INTEGER NOT NULL,
+    triggers INTEGER NOT NULL,
+    entities INTEGER NOT NULL,
+    thumbnail BLOB,
+    sha256 TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+"""
+
+_FIELDS = ("name", "author", "created", "grid_type", "rows", "cols",
+           "tiles", "triggers", "entities", "thumbnail", "sha256")
+
+
+def _racy(mtime_ns):
+    # file systems stamp times at a coarse tick, so a write right after ours may not move them
+    return time.time_ns() - mtime_ns < RACY_NS
+
+
+def _signature(map_path):
+    """
+    Modification time and size of a map file and its journal, as a string.
+
+    Ends with "?" if either was modified too recently to be compared by time.
+
+    :raises FileNotFoundError: If the map file is missing.
+    """
+    parts = []
+    racy = False
+    for path in (map_path, journal_path(map_path)):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            if path == map_path:
+                raise
+            parts.append("-")
+        else:
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+            racy = racy or _racy(stat.st_mtime_ns)
+    return "/".join(parts) + ("?" if racy else "")
+
+
+def _sha256(map_path):
+    digest = hashlib.sha256()
+    for path in (map_path, journal_path(map_path)):
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            pass
+    return digest.hexdigest()
+
+
+def make_thumbnail(colors, rows, cols, default="#CCCCCC"):
+    """
+    Draw a map as one pixel per tile, sampled down to :data:`THUMBNAIL_SIZE`.
+
+    :param colors: Mapping of ``(row, col)`` to a tile's overlay color; tiles
+        not in it, or without a color, use `default`.
+    :type colors: dict
+    :param rows: Rows of the grid.
+    :type rows: int
+    :param cols: Columns of the grid.
+    :type cols: int
+    :param default: Color of a plain tile, as drawn by the tile items.
+    :type default: str
+    :return: PNG image, or None for an empty grid.
+    :rtype: bytes or None
+    """
+    if rows <= 0 or cols <= 0:
+        return None
+    scale = min(1.0, THUMBNAIL_SIZE / max(rows, cols))
+    height, width = max(1, round(rows * scale)), max(1, round(cols * scale))
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(default))
+    rgb = {}
+    for y in range(height):
+        row = y * rows // height
+        for x in range(width):
+            color = colors.get((row, x * cols // width))
+            if color:
+                if color not in rgb:
+                    rgb[color] = QColor(color).rgb()
+                image.setPixel(x, y, rgb[color])
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+class ScenarioCatalog:
+    """
+    SQLite index of the scenarios in a workspace folder.
+
+    For every ``<workspace>/<name>/map.json`` the catalog keeps the map's
+    author, creation date, grid size, tile/trigger/entity counts, a
+    thumbnail and a SHA-256 of the file and its journal, so the scenario
+    browser can list and describe scenarios without parsing any map.
+
+    Entries are checked against the modification time and size of the map
+    and its journal on every read; when those changed (or are too recent
+    to tell, see :data:`RACY_NS`) and the hash did too, the map is parsed
+    again. The folder list is rescanned only when the workspace folder
+    itself changed. A map that cannot be parsed is still listed, and
+    :meth:`get` raises its error. Editors update an entry directly
+    after saving with :meth:`record`.
+
+    :param workspace: Folder holding one sub-folder per scenario; created if missing.
+    :type workspace: Path or str
+    """
+
+    def __init__(self, workspace="workspace"):
+        self.workspace = Path(workspace)
+        self.workspace.mkdir(parents=True, exist_ok=True)
+        self.path = self.workspace / CATALOG_NAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # a rollback journal that is kept rather than deleted leaves the workspace's mtime alone
+        self._conn.execute("PRAGMA journal_mode=PERSIST")
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+            if row is None or row[0] != str(CATALOG_FORMAT_VERSION):
+                self._conn.execute("DROP TABLE scenarios")
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute("DELETE FROM meta")
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('format_version', ?)",
+                    (str(CATALOG_FORMAT_VERSION),),
+                )
+
+    @classmethod
+    def for_map(cls, map_path):
+        """
+        Open the catalog indexing a map file, if there is one.
+
+        :param map_path: Path of a map file.
+        :type map_path: Path or str
+        :return: The catalog of the workspace holding the map, or None if the
+            map is not a ``<workspace>/<name>/map.json`` with a catalog.
+        :rtype: ScenarioCatalog or None
+        """
+        map_path = Path(map_path)
+        workspace = map_path.parent.parent
+        if map_path.name != MAP_NAME or not (workspace / CATALOG_NAME).exists():
+            return None
+        return cls(workspace)
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def map_path(self, name):
+        """
+        Path of a scenario's map file.
+
+        :param name: Scenario folder name.
+        :type name: str
+        :rtype: Path
+        """
+        return self.workspace / name / MAP_NAME
+
+    def names(self):
+        """
+        Names of the scenarios in the workspace, sorted.
+
+        The workspace folder is scanned again only if it changed since the last scan.
+
+        :rtype: list[str]
+        """
+        mtime_ns = self.workspace.stat().st_mtime_ns
+        stamp = "" if _racy(mtime_ns) else str(mtime_ns)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'workspace_mtime_ns'").fetchone()
+            if row is None or not stamp or row[0] != stamp:
+                self._rescan(stamp)
+            return [name for (name,) in self._conn.execute("SELECT name FROM scenarios ORDER BY name")]
+
+    def _rescan(self, stamp):
+        found = {
+            folder.name for folder in self.workspace.iterdir()
+            if folder.is_dir() and (folder / MAP_NAME).exists()
+        }
+        known = {name for (name,) in self._conn.execute("SELECT name FROM scenarios")}
+        with self._conn:
+            self._conn.executemany("DELETE FROM scenarios WHERE name = ?", [(n,) for n in known - found])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('workspace_mtime_ns', ?)", (stamp,)
+            )
+        for name in sorted(found - known):
+            try:
+                self.index(name)
+            except (OSError, ValueError) as e:
+                app_logger.warning(f"[ScenarioCatalog] Could not index {name}: {e}")
+                # listed anyway; get() parses it again and reports the error
+                self._store({"name": name, "tiles": 0, "triggers": 0, "entities": 0, "sha256": ""}, "")
+
+    def get(self, name):
+        """
+        Describe a scenario, indexing its map again if it changed on disk.
+
+        :param name: Scenario folder name.
+        :type name: str
+        :return: Dict with name, author, created, grid_type, rows, cols,
+            tiles, triggers, entities, thumbnail (PNG bytes or None) and
+            sha256; None if the scenario has no map file.
+        :rtype: dict or None
+        :raises json.JSONDecodeError: If the map changed and is not valid JSON.
+        """
+        map_path = self.map_path(name)
+        try:
+            signature = _signature(map_path)
+        except FileNotFoundError:
+            self.remove(name)
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_FIELDS)}, signature FROM scenarios WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and row[-1] == signature and not signature.endswith("?"):
+                return dict(zip(_FIELDS, row[:-1]))
+        if row is not None and row[_FIELDS.index("sha256")] == _sha256(map_path):
+            # touched but not changed
+            with self._lock, self._conn:
+                self._conn.execute("UPDATE scenarios SET signature = ? WHERE name = ?", (signature, name))
+            return dict(zip(_FIELDS, row[:-1]))
+        return self.index(name)
+
+    def index(self, name):
+        """
+        Parse a scenario's map and store its description.
+
+        :param name: Scenario folder name.
+        :type name: str
+        :return: The stored description, see :meth:`get`; None if the map is missing.
+        :rtype: dict or None
+        :raises json.JSONDecodeError: If the map file is not valid JSON.
+        """
+        map_path = self.map_path(name)
+        try:
+            signature = _signature(map_path)
+            sha = _sha256(map_path)
+            if journal_path(map_path).exists():
+                data = load_map(map_path)
+            else:
+                with open(map_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+        except FileNotFoundError:
+            self.remove(name)
+            return None
+        meta = data.get("meta", {})
+        if map_format.map_version(data) < map_format.MAP_VERSION:
+            tiles = [t for t in data.get("tiles", []) if "position" in t]
+        else:
+            tiles = list(map_format.stored_tiles(data))
+        colors = {tuple(t["position"]): t.get("overlay_color") for t in tiles}
+        rows = meta.get("rows") or max((r + 1 for r, _ in colors), default=0)
+        cols = meta.get("cols") or max((c + 1 for _, c in colors), default=0)
+        entry = dict(map_format.summarize(data))
+        entry.update(
+            name=name,
+            author=meta.get("author"),
+            created=meta.get("created"),
+            grid_type=meta.get("grid_type"),
+            rows=rows or None,
+            cols=cols or None,
+            thumbnail=make_thumbnail(colors, rows, cols),
+            sha256=sha,
+        )
+        self._store(entry, signature)
+        app_logger.debug(f"[ScenarioCatalog] Indexed {map_path}")
+        return entry
+
+    def record(self, map_path, summary, meta=None, thumbnail=None):
+        """
+        Update a scenario's entry right after its map was saved.
+
+        :param map_path: Path of the saved map file.
+        :type map_path: Path or str
+        :param summary: ``tiles``, ``triggers`` and ``entities`` counts, and
+            ``rows`` and ``cols`` of the saved map.
+        :type summary: dict
+        :param meta: Map metadata (author, created, grid_type); kept from the
+            previous entry when None.
+        :type meta: dict, optional
+        :param thumbnail: PNG image of the map; kept from the previous entry when None.
+        :type thumbnail: bytes, optional
+        """
+        map_path = Path(map_path)
+        name = map_path.parent.name
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_FIELDS)} FROM scenarios WHERE name = ?", (name,)
+            ).fetchone()
+        entry = dict(zip(_FIELDS, row)) if row else {}
+        entry.update(name=name, sha256=_sha256(map_path))
+        for field in ("rows", "cols", "tiles", "triggers", "entities"):
+            entry[field] = summary.get(field)
+        if meta is not None:
+            for field in ("author", "created", "grid_type"):
+                entry[field] = meta.get(field)
+        if thumbnail is not None:
+            entry["thumbnail"] = thumbnail
+        self._store(entry, _signature(map_path))
+
+    def remove(self, name):
+        """
+        Drop a scenario's entry.
+
+        :param name: Scenario folder name.
+        :type name: str
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scenarios WHERE name = ?", (name,))
+
+    def _store(self, entry, signature):
+        values = [entry.get(field) for field in _FIELDS] + [signature]
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO scenarios ({', '.join(_FIELDS)}, signature) "
+                f"VALUES ({', '.join('?' * (len(_FIELDS) + 1))})",
+                values,
+            )
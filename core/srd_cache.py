@@ -0,0 +1,275 @@
+import argparse
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.db_api_handler import APIError, CategoryIndex, LocalAPIHandler
+from core.logger import app_logger
+from utils.string.slugify import slugify
+
+#: Bumped whenever the table layout or record encoding changes; older caches are rebuilt.
+CACHE_FORMAT_VERSION = 1
+
+#: Cache location used by the application (see ``entry_point.py``).
+DEFAULT_CACHE_PATH = "config/srd_cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    category TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    is_list INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    category TEXT NOT NULL,
+    pos INTEGER NOT NULL,
+    slug TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (category, pos)
+);
+CREATE INDEX IF NOT EXISTS entries_slug ON entries (category, slug);
+CREATE TABLE IF NOT EXISTS aliases (
+    category TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    pos INTEGER NOT NULL,
+    PRIMARY KEY (category, alias)
+);
+"""
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SRDCache:
+    """
+    Compiled on-disk cache of the SRD JSON files.
+
+    Each category is stored in SQLite as one pickled record per entry plus
+    its slug and alias index, so single entries can be read without
+    decoding the whole file. A category is recompiled when its source file
+    changes: files are compared by mtime and size first and by SHA-256 when
+    those differ. A cache written with another :data:`CACHE_FORMAT_VERSION`
+    is discarded.
+
+    :param cache_path: Path of the SQLite cache file; parent directories are created.
+    :type cache_path: str
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._fresh: set = set()    # (category, path) pairs checked in this process
+        self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+            if row is None or row[0] != str(CACHE_FORMAT_VERSION):
+                self._conn.execute("DELETE FROM files")
+                self._conn.execute("DELETE FROM entries")
+                self._conn.execute("DELETE FROM aliases")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('format_version', ?)",
+                    (str(CACHE_FORMAT_VERSION),),
+                )
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def ensure_fresh(self, category: str, path: Path) -> bool:
+        """
+        Make sure the cached copy of a category matches its source file, compiling it if not.
+
+        :param category: Category name, e.g. "monsters".
+        :type category: str
+        :param path: Source JSON file.
+        :type path: Path
+        :return: True if the category was (re)compiled.
+        :rtype: bool
+        :raises APIError: If the source file is missing or is not valid JSON.
+        """
+        if (category, path) in self._fresh:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise APIError(f"[SRDCache] File not found: {path}")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, sha256 FROM files WHERE category = ?", (category,)
+            ).fetchone()
+            compiled = False
+            if row is None or (row[0], row[1]) != (stat.st_mtime_ns, stat.st_size):
+                sha = _sha256(path)
+                if row is not None and row[2] == sha:
+                    with self._conn:
+                        self._conn.execute(
+                            "UPDATE files SET mtime_ns = ?, size = ? WHERE category = ?",
+                            (stat.st_mtime_ns, stat.st_size, category),
+                        )
+                else:
+                    self._compile(category, path, stat, sha)
+                    compiled = True
+            self._fresh.add((category, path))
+        return compiled
+
+    def _compile(self, category: str, path: Path, stat, sha: str):
+        """
+        Parse one JSON file and replace its cached records.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise APIError(f"[SRDCache] JSON decode error in {path.name}: {e}")
+        is_list = isinstance(data, list)
+        entries = data if is_list else [data]
+        rows = []
+        for pos, entry in enumerate(entries):
+            slug = entry.get("index") if isinstance(entry, dict) else None
+            rows.append((category, pos, slug, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)))
+        aliases = []
+        if is_list:
+            index = CategoryIndex(entries)
+            positions = {id(entry): pos for pos, entry in enumerate(entries)}
+            for alias, slug in index.aliases.items():
+                aliases.append((category, alias, positions[id(index.by_slug[slug])]))
+        with self._conn:
+            self._conn.execute("DELETE FROM entries WHERE category = ?", (category,))
+            self._conn.execute("DELETE FROM aliases WHERE category = ?", (category,))
+            self._conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", rows)
+            self._conn.executemany("INSERT OR IGNORE INTO aliases VALUES (?, ?, ?)", aliases)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (category, path.name, stat.st_mtime_ns, stat.st_size, sha, int(is_list)),
+            )
+        app_logger.debug(f"[SRDCache] Compiled '{category}' ({len(rows)} entries)")
+
+    def load_category(self, category: str, path: Path) -> Any:
+        """
+        Read a whole category from the cache.
+
+        :param category: Category name.
+        :type category: str
+        :param path: Source JSON file, used to check freshness.
+        :type path: Path
+        :return: The category's data, as ``json.load`` would return it.
+        :rtype: list or dict
+        """
+        self.ensure_fresh(category, path)
+        with self._lock:
+            is_list = self._conn.execute(
+                "SELECT is_list FROM files WHERE category = ?", (category,)
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT data FROM entries WHERE category = ? ORDER BY pos", (category,)
+            ).fetchall()
+        entries = [pickle.loads(data) for (data,) in rows]
+        return entries if is_list else entries[0]
+
+    def lookup(self, category: str, path: Path, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one entry by slug, name or alias without loading its category.
+
+        :param category: Category name.
+        :type category: str
+        :param path: Source JSON file, used to check freshness.
+        :type path: Path
+        :param key: Slug or display name, in any case.
+        :type key: str
+        :return: The entry, or None if nothing matches.
+        :rtype: dict or None
+        """
+        self.ensure_fresh(category, path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE category = ? AND slug = ?", (category, key)
+            ).fetchone()
+            if row is None:
+                for alias in dict.fromkeys((key.strip().lower(), slugify(key))):
+                    row = self._conn.execute(
+                        "SELECT e.data FROM aliases a JOIN entries e "
+                        "ON e.category = a.category AND e.pos = a.pos "
+                        "WHERE a.category = ? AND a.alias = ?",
+                        (category, alias),
+                    ).fetchone()
+                    if row is not None:
+                        break
+        return pickle.loads(row[0]) if row is not None else None
+
+    def categories(self) -> List[str]:
+        """
+        List the categories currently compiled into the cache.
+
+        :rtype: list[str]
+        """
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT category FROM files ORDER BY category")]
+
+
+_open_caches: Dict[str, SRDCache] = {}
+_open_lock = threading.Lock()
+
+
+def open_cache(cache_path: str) -> SRDCache:
+    """
+    Get the process-wide SRDCache for a path, opening it on first use.
+
+    :param cache_path: Path of the SQLite cache file.
+    :type cache_path: str
+    :return: The shared cache.
+    :rtype: SRDCache
+    """
+    key = str(Path(cache_path).resolve())
+    with _open_lock:
+        cache = _open_caches.get(key)
+        if cache is None:
+            cache = _open_caches[key] = SRDCache(cache_path)
+        return cache
+
+
+def build_cache(base_path: str = "core/data_/rulebook_json", cache_path: str = DEFAULT_CACHE_PATH) -> List[str]:
+    """
+    Compile every SRD file under `base_path` into the cache.
+
+    :param base_path: Directory containing the 5e-SRD JSON files.
+    :type base_path: str
+    :param cache_path: Path of the SQLite cache file.
+    :type cache_path: str
+    :return: Categories that had to be (re)compiled.
+    :rtype: list[str]
+    """
+    handler = LocalAPIHandler(base_path)
+    cache = SRDCache(cache_path)
+    try:
+        return [
+            category for category, filename in sorted(handler.filenames.items())
+            if cache.ensure_fresh(category, handler.base_path / filename)
+        ]
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the SRD JSON files into the binary cache.")
+    parser.add_argument("--base-path", default="core/data_/rulebook_json")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH)
+    args = parser.parse_args()
+    rebuilt = build_cache(args.base_path, args.cache_path)
+    print(f"Compiled {len(rebuilt)} categories into {args.cache_path}")
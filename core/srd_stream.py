@@ -0,0 +1,300 @@
+import codecs
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.logger import app_logger
+
+#: Fields copied into the resident summary of each entry; everything else is read on demand.
+SUMMARY_FIELDS = (
+    "index", "name", "url",
+    "type", "subtype", "size", "alignment", "challenge_rating", "xp",
+    "level", "school", "classes",
+)
+
+#: Default budget of the full-entry LRU, in bytes of source JSON.
+DEFAULT_ENTRY_CACHE_BYTES = 8 * 1024 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+class NotAnArrayError(ValueError):
+    """
+    Raised when a file streamed as a JSON array holds another kind of value.
+    """
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Parse a JSON array file one element at a time.
+
+    Only the element being decoded and the current read buffer are held in
+    memory, so arbitrarily large files can be scanned.
+
+    :param path: File containing a top-level JSON array.
+    :type path: Path
+    :param chunk_size: Bytes read per step.
+    :type chunk_size: int
+    :return: Iterator of ``(byte_offset, byte_length, element)``.
+    :rtype: Iterator[tuple]
+    :raises NotAnArrayError: If the file does not hold an array.
+    :raises json.JSONDecodeError: If the file is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    with open(path, "rb") as f:
+        head = f.read(3)
+        base = 3 if head == codecs.BOM_UTF8 else 0     # byte offset of buf[0]
+        f.seek(base)
+        buf, i, eof = "", 0, False
+
+        def fill(size):
+            nonlocal buf, eof
+            data = f.read(size)
+            eof = not data
+            buf += utf8.decode(data, final=eof)
+
+        def skip_whitespace():
+            nonlocal i
+            while True:
+                while i < len(buf) and buf[i] in _WHITESPACE:
+                    i += 1
+                if i < len(buf) or eof:
+                    return
+                fill(chunk_size)
+
+        def consume(n):
+            # advance past n characters, keeping the byte offset in step
+            nonlocal buf, i, base
+            base += len(buf[:i + n].encode("utf-8"))
+            buf, i = buf[i + n:], 0
+
+        skip_whitespace()
+        if i >= len(buf) or buf[i] != "[":
+            raise NotAnArrayError(f"{path.name} does not contain a JSON array")
+        consume(1)
+        skip_whitespace()
+        if i < len(buf) and buf[i] == "]":
+            return
+        read_size = chunk_size
+        while True:
+            skip_whitespace()
+            consume(0)
+            try:
+                element, end = decoder.raw_decode(buf, 0)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill(read_size)
+                read_size *= 2      # large elements: keep the number of retries logarithmic
+                continue
+            if end == len(buf) and not eof:
+                # a number may continue in the next chunk
+                fill(read_size)
+                continue
+            read_size = chunk_size
+            length = len(buf[:end].encode("utf-8"))
+            yield base, length, element
+            i = end
+            consume(0)
+            skip_whitespace()
+            if i >= len(buf):
+                raise json.JSONDecodeError("Unterminated array", buf, i)
+            if buf[i] == "]":
+                return
+            if buf[i] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, i)
+            consume(1)
+
+
+class EntryLRU:
+    """
+    Least-recently-used cache of full SRD entries, bounded by their JSON size.
+
+    :param max_bytes: Budget in bytes of source JSON; the most recently used
+        entry is always kept, even if it alone exceeds the budget.
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_ENTRY_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Any) -> Any:
+        """
+        Get a cached entry and mark it as recently used.
+
+        :param key: Cache key.
+        :return: The entry, or None on a miss.
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Any, entry: Any, size: int):
+        """
+        Store an entry, evicting the least recently used ones over budget.
+
+        :param key: Cache key.
+        :param entry: The entry.
+        :param size: Its size in bytes.
+        :type size: int
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (entry, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def discard(self, predicate):
+        """
+        Drop every entry whose key matches `predicate`.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self.bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """
+        Drop every entry. Statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the cache's usage.
+
+        :return: Entry count, bytes used and budget, hits, misses, evictions and hit rate.
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class StreamedCategory:
+    """
+    One SRD category held as summaries, with full entries read from disk on demand.
+
+    The file is scanned once with :func:`iter_json_array`; for every entry
+    only the :data:`SUMMARY_FIELDS` and its byte span are kept. Full entries
+    are re-parsed from their span and kept in a shared :class:`EntryLRU`.
+    If the file changes on disk it is scanned again.
+
+    :param path: Source JSON file.
+    :type path: Path
+    :param lru: Cache of full entries, usually shared by all categories.
+    :type lru: EntryLRU
+    :raises NotAnArrayError: If the file does not hold an array.
+    """
+
+    def __init__(self, path: Path, lru: EntryLRU):
+        self.path = path
+        self.lru = lru
+        self.summaries: List[Dict[str, Any]] = []
+        self.spans: List[Tuple[int, int]] = []
+        self.positions: Dict[str, int] = {}
+        self.index = None
+        self._stat = None
+        self._lock = threading.RLock()
+        self._scan()
+
+    def __len__(self):
+        return len(self.summaries)
+
+    def _scan(self):
+        from core.db_api_handler import CategoryIndex
+
+        stat = self.path.stat()
+        summaries, spans = [], []
+        for offset, length, entry in iter_json_array(self.path):
+            if isinstance(entry, dict):
+                summaries.append({k: entry[k] for k in SUMMARY_FIELDS if k in entry})
+            else:
+                summaries.append(entry)
+            spans.append((offset, length))
+        index = CategoryIndex(summaries)
+        by_id = {id(s): pos for pos, s in enumerate(summaries)}
+        self.lru.discard(lambda key: key[0] == self.path)
+        self.summaries, self.spans, self.index = summaries, spans, index
+        self.positions = {slug: by_id[id(s)] for slug, s in index.by_slug.items()}
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        app_logger.debug(f"[SRDStream] Scanned {self.path.name} ({len(summaries)} entries)")
+
+    def _changed(self) -> bool:
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size) != self._stat
+
+    def entry(self, pos: int) -> Any:
+        """
+        Get the full entry at a position, from the LRU or from disk.
+
+        :param pos: Position of the entry in the file.
+        :type pos: int
+        :return: The full entry.
+        """
+        key = (self.path, pos)
+        entry = self.lru.get(key)
+        if entry is None:
+            offset, length = self.spans[pos]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                entry = json.loads(f.read(length))
+            self.lru.put(key, entry, length)
+        return entry
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the full entry for a slug, name or alias.
+
+        :param key: Slug or display name, in any case.
+        :type key: str
+        :return: The entry, or None if nothing matches.
+        :rtype: dict or None
+        """
+        with self._lock:
+            if self._changed():
+                self._scan()
+            slug = self.index.resolve(key)
+            if slug is None:
+                return None
+            return self.entry(self.positions[slug])
+
+    def iter_entries(self) -> Iterator[Any]:
+        """
+        Stream every full entry from disk without caching them.
+
+        :rtype: Iterator
+        """
+        for _, _, entry in iter_json_array(self.path):
+            yield entry
@@ -3,6 +3,9 @@ from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QCo
 from core.gameCreation.main_controller import MainController
 from core.characterCreation.character_gui import CharacterCreationWindow
 from core.settings_manager import SettingsManager
+from core.db_api_handler import LocalAPIHandler
+from core.rulebook.preloader import RulebookPreloader
+from core.srd_cache import DEFAULT_CACHE_PATH
 from qt_material import apply_stylesheet, list_themes
 
 
@@ -83,12 +86,16 @@ class LaunchDialog(QWidget):
         apply_theme(QApplication.instance(), theme_file)
 
     def launch_game_creation(self):
+        # monsters and spells are read by the rulebook search dialog later on
+        RulebookPreloader.default.prefetch_for("game")
         self.main_controller = MainController()
         self.main_controller.show()
         self.close()
 
     def launch_character_creator(self):
-        self.char_window = CharacterCreationWindow()
+        preloader = RulebookPreloader.default
+        preloader.prefetch_for("character")
+        self.char_window = CharacterCreationWindow(preloader=preloader)
         self.char_window.show()
         self.close()
 
@@ -96,6 +103,11 @@ class LaunchDialog(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
+    # read the SRD from the compiled cache instead of re-decoding the JSON files
+    LocalAPIHandler.default_cache_path = DEFAULT_CACHE_PATH
+
+    RulebookPreloader.default = RulebookPreloader()
+
     settings = SettingsManager()
     theme_file = settings.get("theme", "dark_teal.xml")
     apply_theme(app, theme_file)
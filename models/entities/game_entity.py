@@ -3,6 +3,8 @@ from registries.trigger_registry import global_trigger_registry
 from enum import Enum
 from core.logger import app_logger
 from core.gameCreation.event_bus import EventBus
+from utils.copy_on_write import CopyOnWrite
+from utils.observable_list import DeltaList
 
 
 class GameEntity:
@@ -19,6 +21,10 @@ class GameEntity:
     :type inventory: list, optional
     """
 
+    # may be shared with a rulebook template until first used (see RulebookEntity.to_game_entity)
+    stats = CopyOnWrite()
+    inventory = CopyOnWrite()
+
     def __init__(self, name, entity_type, stats=None, inventory=None, image_path=None):
         """
         Initialize a GameEntity instance.
@@ -39,9 +45,109 @@ class GameEntity:
         self.entity_type = entity_type
         self.stats = stats or {}
         self.inventory = inventory or []
+        self._triggers_by_event = {}  # event_type → list of Trigger, kept in sync with triggers
+        self._trigger_ids = {}        # id(trigger) → number of times it is in triggers
         self.triggers = []
         self.image_path = image_path
 
+    @property
+    def triggers(self):
+        """
+        The entity's triggers.
+
+        In-place edits and reassignment both keep the per-event-type
+        dispatch table up to date.
+
+        :return: List of triggers.
+        :rtype: list
+        """
+        return self._triggers
+
+    @triggers.setter
+    def triggers(self, value):
+        self._triggers = DeltaList(value, self._on_triggers_changed)
+        self.reindex_triggers()
+
+    def _on_triggers_changed(self, removed, added):
+        """
+        Callback of the trigger list; updates the dispatch table from the change.
+
+        Appends and removals are applied incrementally; reorders rebuild it.
+
+        :param removed: Triggers taken out, or None after a reorder.
+        :type removed: tuple
+        :param added: Triggers appended, or None after a reorder.
+        :type added: tuple
+        """
+        if removed is None:
+            self.reindex_triggers()
+            return
+        table, ids = self._triggers_by_event, self._trigger_ids
+        for trigger in removed:
+            bucket = table[trigger.event_type]
+            for i, t in enumerate(bucket):
+                if t is trigger:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del table[trigger.event_type]
+                global_trigger_registry.remove_interest(trigger.event_type, self)
+            ids[id(trigger)] -= 1
+            if not ids[id(trigger)]:
+                del ids[id(trigger)]
+        for trigger in added:
+            bucket = table.get(trigger.event_type)
+            if bucket is None:
+                bucket = table[trigger.event_type] = []
+                global_trigger_registry.add_interest(trigger.event_type, self)
+            bucket.append(trigger)
+            ids[id(trigger)] = ids.get(id(trigger), 0) + 1
+
+    def reindex_triggers(self):
+        """
+        Rebuild the per-event-type dispatch table and the global interest index.
+
+        Called automatically when a whole new trigger list is assigned or the
+        list is reordered; call it by hand after changing the ``event_type``
+        of a trigger already attached.
+        """
+        table = {}
+        ids = {}
+        for trigger in self._triggers:
+            table.setdefault(trigger.event_type, []).append(trigger)
+            ids[id(trigger)] = ids.get(id(trigger), 0) + 1
+        old_types = self._triggers_by_event.keys() - table.keys()
+        new_types = table.keys() - self._triggers_by_event.keys()
+        self._triggers_by_event = table
+        self._trigger_ids = ids
+        for event_type in old_types:
+            global_trigger_registry.remove_interest(event_type, self)
+        for event_type in new_types:
+            global_trigger_registry.add_interest(event_type, self)
+
+    def has_trigger_for(self, event_type):
+        """
+        Check whether the entity has any trigger for an event type.
+
+        :param event_type: The event type.
+        :type event_type: str
+        :return: True if at least one trigger listens for it.
+        :rtype: bool
+        """
+        return event_type in self._triggers_by_event
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_triggers"] = list(self._triggers)
+        state["_triggers_by_event"] = {}
+        state["_trigger_ids"] = {}
+        return state
+
+    def __setstate__(self, state):
+        triggers = state.pop("_triggers", [])
+        self.__dict__.update(state)
+        self.triggers = triggers
+
     def register_trigger(self, trigger):
         """
         Register a trigger for this entity if not already registered.
@@ -56,9 +162,24 @@ class GameEntity:
             EventBus.subscribe(trigger.event_type, trigger.check_and_react)
             app_logger.info(f"[Entity] {self.name} registered trigger: {trigger.label}")
 
-        if all(trigger is not t for t in self.triggers):
+        if id(trigger) not in self._trigger_ids:
             self.triggers.append(trigger)
 
+    def unregister_trigger(self, trigger):
+        """
+        Remove a trigger from this entity and unsubscribe it from the EventBus.
+
+        :param trigger: The trigger to remove.
+        :type trigger: Trigger
+        """
+        for i, t in enumerate(self.triggers):
+            if t is trigger:
+                del self.triggers[i]
+                global_trigger_registry.remove_trigger(trigger)
+                EventBus.unsubscribe(trigger.event_type, trigger.check_and_react)
+                app_logger.info(f"[Entity] {self.name} removed trigger: {trigger.label}")
+                break
+
     def to_dict(self):
         """
         Serialize the entity to a dictionary.
@@ -69,8 +190,8 @@ class GameEntity:
         data = {
             "name": self.name,
             "entity_type": self.entity_type,
-            "stats": self.stats,
-            "inventory": self.inventory,
+            "stats": dict(self.stats),
+            "inventory": list(self.inventory),
             "triggers": [t.to_dict() for t in self.triggers],
         }
         if self.image_path:
@@ -81,14 +202,16 @@ class GameEntity:
         """
         Handle a tile-based event by running any triggers matching event_type.
 
+        Triggers are looked up in the per-event-type dispatch table, so
+        unrelated triggers cost nothing.
+
         :param event_type: The type of event to handle.
         :type event_type: str
         :param data: Data associated with the event.
         :type data: Any
         """
-        for trigger in self.triggers:
-            if trigger.event_type == event_type:
-                trigger.check_and_react(data)
+        for trigger in tuple(self._triggers_by_event.get(event_type, ())):
+            trigger.check_and_react(data)
 
     @classmethod
     def from_dict(cls, data):
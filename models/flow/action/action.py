@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-import random
-import re
+import logging
 from core.logger import app_logger
+from models.flow.dice import compile_dice
 
 class Action(ABC):
     """
@@ -62,24 +62,22 @@ class Action(ABC):
         """
         Parse and roll a dice expression (e.g., '2d6+3') and return the result.
 
+        Expressions are compiled once and cached by :func:`models.flow.dice.compile_dice`,
+        which also accepts several terms, keep-highest/lowest, advantage and
+        damage-type tags (e.g., '4d6kh3', 'd20adv+5', '1d6+2 slashing + 1d4 fire').
+
         :param expression: A string representing the dice roll (e.g., '2d6+3').
         :type expression: str
         :return: The total result of the dice roll.
         :rtype: int
         :raises ValueError: If the dice expression is invalid.
         """
-        match = re.match(r"(\d*)d(\d+)([+-]?\d*)", expression.replace(" ", ""))
-        if not match:
-            raise ValueError(f"Invalid dice expression: {expression}")
-
-        num_dice = int(match.group(1)) if match.group(1) else 1
-        dice_sides = int(match.group(2))
-        modifier = int(match.group(3)) if match.group(3) else 0
-
-        rolls = [random.randint(1, dice_sides) for _ in range(num_dice)]
-        total = sum(rolls) + modifier
-        app_logger.debug(f"Rolling {expression}: {rolls} + {modifier} = {total}")
-        return total
+        plan = compile_dice(expression)
+        if not app_logger.isEnabledFor(logging.DEBUG):
+            return plan.roll()
+        result = plan.roll_detailed()
+        app_logger.debug(f"Rolling {expression}: {result.rolls} + {result.modifier} = {result.total}")
+        return result.total
 
     @staticmethod
     def apply_effect(target, effect):
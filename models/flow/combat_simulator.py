@@ -0,0 +1,326 @@
+import os
+import random
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from models.flow.action.action import roll
+from models.flow.skill_check import SkillCheck
+
+_ATTACK_RE = re.compile(r"\+\s*(\d+)\s+to hit.*?Hit:\s*\d+\s*\((\d+d\d+(?:\s*[+-]\s*\d+)?)\)", re.IGNORECASE)
+_ABILITY_KEYS = {
+    "str": ("str", "strength", "Strength"),
+    "dex": ("dex", "dexterity", "Dexterity"),
+}
+
+
+def _ability_modifier(stats, ability):
+    """
+    Get an ability modifier from a stats dict that may use short or long keys.
+
+    :param stats: Entity stats.
+    :type stats: dict
+    :param ability: "str" or "dex".
+    :type ability: str
+    :return: The ability modifier, 0 if the score is missing.
+    :rtype: int
+    """
+    for key in _ABILITY_KEYS[ability]:
+        score = stats.get(key)
+        if isinstance(score, int):
+            return (score - 10) // 2
+    return 0
+
+
+class Combatant:
+    """
+    Plain, picklable combat stat block used by the simulator.
+
+    :param name: Display name.
+    :type name: str
+    :param hp: Hit points.
+    :type hp: int
+    :param ac: Armor class.
+    :type ac: int
+    :param attack_bonus: Bonus added to the d20 attack roll.
+    :type attack_bonus: int
+    :param damage: Dice expression rolled on a hit (e.g. "1d6+2").
+    :type damage: str
+    :param initiative_bonus: Bonus added to the initiative roll.
+    :type initiative_bonus: int
+    """
+
+    __slots__ = ("name", "hp", "ac", "attack_bonus", "damage", "initiative_bonus")
+
+    def __init__(self, name, hp, ac, attack_bonus=0, damage="1d4", initiative_bonus=0):
+        self.name = name
+        self.hp = hp
+        self.ac = ac
+        self.attack_bonus = attack_bonus
+        self.damage = damage
+        self.initiative_bonus = initiative_bonus
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return (f"<Combatant {self.name} hp={self.hp} ac={self.ac} "
+                f"+{self.attack_bonus} {self.damage}>")
+
+    @classmethod
+    def from_entity(cls, entity):
+        """
+        Build a stat block from a game entity.
+
+        Works with entities imported through ``RulebookImporter.import_monster``
+        (``stats["hp"]``/``stats["ac"]`` and SRD action text in ``inventory``)
+        as well as with Enemy and Character objects. The first attack found
+        in the entity's actions is used; without one, the entity attacks with
+        its proficiency bonus plus its best of STR/DEX for 1d4 + that modifier.
+
+        :param entity: The entity to convert; a Combatant is returned as is.
+        :type entity: GameEntity or Combatant
+        :return: The stat block.
+        :rtype: Combatant
+        :raises ValueError: If the entity has no hit points or armor class.
+        """
+        if isinstance(entity, Combatant):
+            return entity
+        stats = getattr(entity, "stats", None) or {}
+        hp = stats.get("hp") or getattr(entity, "hp", None)
+        ac = stats.get("ac") or getattr(entity, "armor_class", None)
+        if not hp or ac is None:
+            raise ValueError(f"Entity {getattr(entity, 'name', entity)!r} has no hit points or armor class")
+
+        dex = _ability_modifier(stats, "dex")
+        attack_bonus, damage = None, None
+        for attack in getattr(entity, "attacks", None) or ():
+            if isinstance(attack, dict) and attack.get("damage"):
+                attack_bonus = attack.get("to_hit", 0)
+                damage = attack["damage"].split()[0]
+                break
+        if damage is None:
+            for ability in getattr(entity, "inventory", None) or ():
+                match = _ATTACK_RE.search(ability) if isinstance(ability, str) else None
+                if match:
+                    attack_bonus = int(match.group(1))
+                    damage = match.group(2).replace(" ", "")
+                    break
+        if damage is None:
+            mod = max(_ability_modifier(stats, "str"), dex)
+            proficiency = stats.get("proficiency_bonus") or getattr(entity, "proficiency_bonus", 2) or 2
+            attack_bonus = proficiency + mod
+            damage = f"1d4{mod:+d}" if mod else "1d4"
+        return cls(getattr(entity, "name", "?"), int(hp), int(ac), attack_bonus, damage, dex)
+
+
+def simulate_encounter(party, monsters, max_rounds=100):
+    """
+    Run one encounter to the end.
+
+    Everyone rolls initiative, then acts in order, attacking the living
+    opponent with the fewest hit points. Hits are decided with a
+    :class:`SkillCheck` against the target's AC and damage is rolled with
+    :func:`Action.roll`.
+
+    :param party: The party's stat blocks.
+    :type party: list[Combatant]
+    :param monsters: The monsters' stat blocks.
+    :type monsters: list[Combatant]
+    :param max_rounds: Rounds after which the encounter is called a draw.
+    :type max_rounds: int
+    :return: Tuple ``(winner, rounds, damage_taken_by_party)`` where winner
+        is "party", "monsters" or "draw".
+    :rtype: tuple
+    """
+    hp = [[c.hp for c in party], [c.hp for c in monsters]]
+    sides = (party, monsters)
+    order = sorted(
+        ((roll("1d20") + c.initiative_bonus, random.random(), side, i)
+         for side, group in enumerate(sides) for i, c in enumerate(group)),
+        reverse=True,
+    )
+    checks = [[SkillCheck("attack", c.ac) for c in group] for group in sides]
+    bonuses = [[{"attack": c.attack_bonus} for c in group] for group in sides]
+    damage_taken = 0
+    for rnd in range(1, max_rounds + 1):
+        for _, _, side, i in order:
+            if hp[side][i] <= 0:
+                continue
+            foes = hp[1 - side]
+            target = min((j for j in range(len(foes)) if foes[j] > 0), key=foes.__getitem__, default=None)
+            if target is None:
+                break
+            if checks[1 - side][target].attempt(bonuses[side][i]):
+                dealt = min(max(roll(sides[side][i].damage), 0), foes[target])
+                foes[target] -= dealt
+                if side == 1:
+                    damage_taken += dealt
+        party_up = any(h > 0 for h in hp[0])
+        monsters_up = any(h > 0 for h in hp[1])
+        if not monsters_up:
+            return "party", rnd, damage_taken
+        if not party_up:
+            return "monsters", rnd, damage_taken
+    return "draw", max_rounds, damage_taken
+
+
+def _run_batch(party, monsters, count, seed, max_rounds):
+    """
+    Run `count` encounters and return their aggregated results.
+
+    Module-level so it can be shipped to worker processes.
+
+    :return: Tuple ``(outcomes, rounds, damage)`` of Counters.
+    :rtype: tuple
+    """
+    if seed is not None:
+        random.seed(seed)
+    outcomes, rounds, damage = Counter(), Counter(), Counter()
+    for _ in range(count):
+        winner, rnd, taken = simulate_encounter(party, monsters, max_rounds)
+        outcomes[winner] += 1
+        rounds[rnd] += 1
+        damage[taken] += 1
+    return outcomes, rounds, damage
+
+
+class SimulationReport:
+    """
+    Aggregated results of a batch of simulated encounters.
+
+    :ivar outcomes: Counter of "party", "monsters" and "draw".
+    :ivar rounds: Counter mapping encounter length in rounds to frequency.
+    :ivar damage_taken: Counter mapping total damage taken by the party to frequency.
+    """
+
+    def __init__(self, outcomes=None, rounds=None, damage_taken=None):
+        self.outcomes = outcomes or Counter()
+        self.rounds = rounds or Counter()
+        self.damage_taken = damage_taken or Counter()
+
+    @property
+    def encounters(self):
+        """
+        Number of simulated encounters.
+
+        :rtype: int
+        """
+        return sum(self.outcomes.values())
+
+    def merge(self, outcomes, rounds, damage_taken):
+        """
+        Add the Counters of one batch to the report.
+        """
+        self.outcomes.update(outcomes)
+        self.rounds.update(rounds)
+        self.damage_taken.update(damage_taken)
+
+    def win_rate(self, side="party"):
+        """
+        Get the share of encounters won by a side.
+
+        :param side: "party", "monsters" or "draw".
+        :type side: str
+        :return: Fraction between 0 and 1.
+        :rtype: float
+        """
+        total = self.encounters
+        return self.outcomes[side] / total if total else 0.0
+
+    @staticmethod
+    def _mean(counter):
+        total = sum(counter.values())
+        return sum(k * v for k, v in counter.items()) / total if total else 0.0
+
+    @property
+    def expected_rounds(self):
+        """
+        Mean encounter length in rounds.
+
+        :rtype: float
+        """
+        return self._mean(self.rounds)
+
+    @property
+    def expected_damage_taken(self):
+        """
+        Mean damage taken by the party per encounter.
+
+        :rtype: float
+        """
+        return self._mean(self.damage_taken)
+
+    def damage_distribution(self):
+        """
+        Get the probability of each total damage taken by the party.
+
+        :return: Mapping of damage to probability, sorted by damage.
+        :rtype: dict
+        """
+        total = self.encounters
+        return {dmg: n / total for dmg, n in sorted(self.damage_taken.items())} if total else {}
+
+    def summary(self):
+        """
+        Summarize the report as a plain dict.
+
+        :rtype: dict
+        """
+        return {
+            "encounters": self.encounters,
+            "party_win_rate": self.win_rate("party"),
+            "monster_win_rate": self.win_rate("monsters"),
+            "draw_rate": self.win_rate("draw"),
+            "expected_rounds": self.expected_rounds,
+            "expected_damage_taken": self.expected_damage_taken,
+        }
+
+
+def simulate_encounters(party, monsters, n=1000, workers=None, seed=None, max_rounds=100):
+    """
+    Simulate many encounters between a party and a group of monsters.
+
+    Encounters are split into one batch per worker and run in a process
+    pool; with ``workers=1`` they run in the calling process.
+
+    :param party: Party members as entities or Combatants.
+    :type party: list
+    :param monsters: Monsters as entities (e.g. from ``RulebookImporter.import_monster``) or Combatants.
+    :type monsters: list
+    :param n: Number of encounters to simulate.
+    :type n: int
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :type workers: int, optional
+    :param seed: Base seed for reproducible results; batch ``i`` uses ``seed + i``.
+    :type seed: int, optional
+    :param max_rounds: Rounds after which an encounter is called a draw.
+    :type max_rounds: int
+    :return: The aggregated report.
+    :rtype: SimulationReport
+    :raises ValueError: If either side is empty.
+    """
+    party = [Combatant.from_entity(e) for e in party]
+    monsters = [Combatant.from_entity(e) for e in monsters]
+    if not party or not monsters:
+        raise ValueError("Both the party and the monsters need at least one combatant")
+
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    sizes = [n // workers + (1 if i < n % workers else 0) for i in range(workers)]
+    seeds = [None if seed is None else seed + i for i in range(workers)]
+    report = SimulationReport()
+    if workers == 1:
+        report.merge(*_run_batch(party, monsters, n, seeds[0], max_rounds))
+        return report
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_batch, party, monsters, size, s, max_rounds)
+            for size, s in zip(sizes, seeds)
+        ]
+        for future in futures:
+            report.merge(*future.result())
+    return report
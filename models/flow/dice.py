@@ -0,0 +1,488 @@
+import itertools
+import math
+import random
+import re
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+#: Largest number of sorted outcomes enumerated for an exact keep-highest/lowest distribution.
+MAX_KEEP_ENUMERATION = 250_000
+#: Largest number of dice a single term may roll.
+MAX_DICE_PER_TERM = 1000
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<op>[+-])
+      | (?P<dice>(?P<count>\d*)[dD](?P<sides>\d+|%)
+            (?:(?P<keep>k[hl]?)(?P<keep_n>\d+)|(?P<adv>adv|dis))?)
+      | (?P<num>\d+)
+      | (?P<var>[A-Z][A-Z0-9_]*)
+      | (?P<tag>[a-z][a-z_]*)
+    )""",
+    re.VERBOSE,
+)
+
+_rng = np.random.default_rng()
+
+
+class DiceError(ValueError):
+    """
+    Raised for dice expressions that cannot be parsed or evaluated.
+    """
+
+
+class DiceTerm:
+    """
+    One signed term of a dice expression: a group of dice, a constant or a named modifier.
+
+    :param sign: +1 or -1.
+    :type sign: int
+    :param count: Number of dice (0 for constants and modifiers).
+    :type count: int
+    :param sides: Sides per die.
+    :type sides: int
+    :param keep: Number of dice kept, or None to keep all.
+    :type keep: int or None
+    :param keep_highest: Whether the highest (True) or lowest (False) dice are kept.
+    :type keep_highest: bool
+    :param constant: Flat value of a constant term.
+    :type constant: int
+    :param variable: Name of a modifier supplied at roll time (e.g. "MOD").
+    :type variable: str or None
+    :param damage_type: Damage-type tag such as "fire", or None.
+    :type damage_type: str or None
+    """
+
+    __slots__ = ("sign", "count", "sides", "keep", "keep_highest", "constant", "variable", "damage_type")
+
+    def __init__(self, sign=1, count=0, sides=0, keep=None, keep_highest=True,
+                 constant=0, variable=None, damage_type=None):
+        self.sign = sign
+        self.count = count
+        self.sides = sides
+        self.keep = keep
+        self.keep_highest = keep_highest
+        self.constant = constant
+        self.variable = variable
+        self.damage_type = damage_type
+
+    @property
+    def is_dice(self):
+        """
+        Whether the term rolls dice.
+
+        :rtype: bool
+        """
+        return self.count > 0
+
+    def __repr__(self):
+        if self.is_dice:
+            body = f"{self.count}d{self.sides}"
+            if self.keep is not None:
+                body += f"{'kh' if self.keep_highest else 'kl'}{self.keep}"
+        else:
+            body = self.variable or str(self.constant)
+        tag = f" {self.damage_type}" if self.damage_type else ""
+        return f"{'-' if self.sign < 0 else '+'}{body}{tag}"
+
+
+class DiceRoll:
+    """
+    Outcome of a single detailed roll.
+
+    :ivar total: Sum of all terms.
+    :ivar rolls: Every die rolled, including dropped ones, in term order.
+    :ivar modifier: Sum of the constant and modifier terms.
+    :ivar by_type: Mapping of damage-type tag (None if untagged) to subtotal.
+    """
+
+    __slots__ = ("total", "rolls", "modifier", "by_type")
+
+    def __init__(self, total, rolls, modifier, by_type):
+        self.total = total
+        self.rolls = rolls
+        self.modifier = modifier
+        self.by_type = by_type
+
+    def __repr__(self):
+        return f"<DiceRoll total={self.total} rolls={self.rolls} modifier={self.modifier}>"
+
+
+def _parse(expression):
+    """
+    Parse a dice expression into terms.
+
+    :param expression: Expression such as "2d6+3", "4d6kh3", "d20adv + 5" or "1d6+2 slashing + 1d4 fire".
+    :type expression: str
+    :return: Tuple of DiceTerm.
+    :rtype: tuple
+    :raises DiceError: If the expression is malformed.
+    """
+    def invalid(reason=""):
+        return DiceError(f"Invalid dice expression: {expression}" + (f" ({reason})" if reason else ""))
+
+    terms = []
+    untagged = 0        # index of the first term no tag has claimed yet
+    tag_start = 0
+    after_tag = False
+    sign = 1
+    expect_term = True
+    pos, end = 0, len(expression.rstrip())
+    while pos < end:
+        match = _TOKEN.match(expression, pos)
+        if match is None or match.end() == pos:
+            raise invalid()
+        pos = match.end()
+        kind = match.lastgroup if match.lastgroup in ("op", "num", "var", "tag") else "dice"
+        if kind == "op":
+            after_tag = False
+            if not expect_term:
+                expect_term = True
+                sign = 1
+            elif terms:
+                raise invalid("two operators in a row")
+            sign = -sign if match.group("op") == "-" else sign
+            continue
+        if kind == "tag":
+            if expect_term or not terms:
+                raise invalid(f"unexpected word {match.group('tag')!r}")
+            word = match.group("tag")
+            if after_tag:
+                # consecutive words extend the tag ("2d6 fire damage")
+                for term in terms[tag_start:]:
+                    term.damage_type = f"{term.damage_type} {word}"
+            else:
+                tag_start = untagged
+                for term in terms[untagged:]:
+                    term.damage_type = word
+                untagged = len(terms)
+            after_tag = True
+            continue
+        after_tag = False
+        if not expect_term:
+            raise invalid("missing operator")
+        if kind == "num":
+            terms.append(DiceTerm(sign, constant=int(match.group("num"))))
+        elif kind == "var":
+            terms.append(DiceTerm(sign, variable=match.group("var")))
+        else:
+            count = int(match.group("count")) if match.group("count") else 1
+            sides = 100 if match.group("sides") == "%" else int(match.group("sides"))
+            keep, highest = None, True
+            if match.group("adv"):
+                if count != 1:
+                    raise invalid("advantage applies to a single die")
+                count, keep, highest = 2, 1, match.group("adv") == "adv"
+            elif match.group("keep"):
+                keep = int(match.group("keep_n"))
+                highest = match.group("keep") != "kl"
+                if not 1 <= keep <= count:
+                    raise invalid("cannot keep more dice than are rolled")
+                if keep == count:
+                    keep = None
+            if not 1 <= count <= MAX_DICE_PER_TERM or sides < 1:
+                raise invalid("dice count or sides out of range")
+            terms.append(DiceTerm(sign, count, sides, keep, highest))
+        sign = 1
+        expect_term = False
+    if expect_term:
+        raise invalid()
+    return tuple(terms)
+
+
+def _add_ways(a, b):
+    """
+    Convolve two outcome-count tables ``(lowest_value, ways)``.
+    """
+    lo_a, ways_a = a
+    lo_b, ways_b = b
+    out = [0] * (len(ways_a) + len(ways_b) - 1)
+    for i, wa in enumerate(ways_a):
+        if wa:
+            for j, wb in enumerate(ways_b):
+                out[i + j] += wa * wb
+    return lo_a + lo_b, out
+
+
+def _dice_ways(count, sides):
+    """
+    Outcome counts of the sum of `count` dice with `sides` sides, via sliding-window sums.
+    """
+    ways = [1]
+    for _ in range(count):
+        prefix = [0]
+        for w in ways:
+            prefix.append(prefix[-1] + w)
+        size = len(ways) + sides - 1
+        ways = [prefix[min(t + 1, len(ways))] - prefix[max(t - sides + 1, 0)] for t in range(size)]
+    return count, ways
+
+
+def _keep_ways(count, sides, keep, highest):
+    """
+    Outcome counts of the kept dice of a keep-highest/lowest roll.
+
+    :raises DiceError: If there are too many outcomes to enumerate.
+    """
+    if keep == 1:
+        if highest:     # P(max == k) ∝ k^n - (k-1)^n
+            return 1, [k ** count - (k - 1) ** count for k in range(1, sides + 1)]
+        return 1, [(sides - k + 1) ** count - (sides - k) ** count for k in range(1, sides + 1)]
+    if math.comb(sides + count - 1, count) > MAX_KEEP_ENUMERATION:
+        raise DiceError(f"Too many outcomes to compute the distribution of {count}d{sides}k{keep} exactly")
+    lo = keep
+    ways = [0] * (keep * sides - keep + 1)
+    n_fact = math.factorial(count)
+    for combo in itertools.combinations_with_replacement(range(1, sides + 1), count):
+        kept = combo[-keep:] if highest else combo[:keep]
+        orderings = n_fact
+        for c in Counter(combo).values():
+            orderings //= math.factorial(c)
+        ways[sum(kept) - lo] += orderings
+    return lo, ways
+
+
+class DicePlan:
+    """
+    A parsed, reusable dice expression.
+
+    Get plans through :func:`compile_dice`, which caches them per expression.
+    Named modifiers such as ``MOD`` are passed as keyword arguments when
+    rolling and default to 0.
+
+    :param expression: The source expression.
+    :type expression: str
+    :param terms: Parsed terms.
+    :type terms: tuple
+    """
+
+    def __init__(self, expression, terms):
+        self.expression = expression
+        self.terms = terms
+
+    def __repr__(self):
+        return f"<DicePlan {self.expression!r}>"
+
+    @property
+    def damage_types(self):
+        """
+        Damage-type tags used in the expression, in order of appearance.
+
+        :rtype: list
+        """
+        return list(dict.fromkeys(t.damage_type for t in self.terms if t.damage_type))
+
+    @staticmethod
+    def _flat(term, variables):
+        return term.constant if term.variable is None else int(variables.get(term.variable, 0))
+
+    def roll(self, **variables):
+        """
+        Roll the expression once.
+
+        :return: The total.
+        :rtype: int
+        """
+        total = 0
+        randint = random.randint
+        for term in self.terms:
+            if term.count:
+                dice = [randint(1, term.sides) for _ in range(term.count)]
+                if term.keep is not None:
+                    dice.sort(reverse=term.keep_highest)
+                    dice = dice[:term.keep]
+                total += term.sign * sum(dice)
+            else:
+                total += term.sign * self._flat(term, variables)
+        return total
+
+    def roll_detailed(self, **variables):
+        """
+        Roll the expression once and keep the individual dice and per-type subtotals.
+
+        :return: The detailed outcome.
+        :rtype: DiceRoll
+        """
+        total = modifier = 0
+        rolls = []
+        by_type = {}
+        for term in self.terms:
+            if term.count:
+                dice = [random.randint(1, term.sides) for _ in range(term.count)]
+                rolls.extend(dice)
+                if term.keep is not None:
+                    dice = sorted(dice, reverse=term.keep_highest)[:term.keep]
+                value = term.sign * sum(dice)
+            else:
+                value = term.sign * self._flat(term, variables)
+                modifier += value
+            total += value
+            by_type[term.damage_type] = by_type.get(term.damage_type, 0) + value
+        return DiceRoll(total, rolls, modifier, by_type)
+
+    def roll_many(self, n, rng=None, **variables):
+        """
+        Roll the expression `n` times at once.
+
+        :param n: Number of rolls.
+        :type n: int
+        :param rng: NumPy random generator; defaults to a module-level one.
+        :type rng: numpy.random.Generator, optional
+        :return: Array of `n` totals.
+        :rtype: numpy.ndarray
+        """
+        rng = _rng if rng is None else rng
+        totals = np.zeros(n, dtype=np.int64)
+        for term in self.terms:
+            if not term.count:
+                totals += term.sign * self._flat(term, variables)
+                continue
+            if term.keep is None and term.count * n > 4_000_000:
+                for _ in range(term.count):     # bound memory for huge batches
+                    totals += term.sign * rng.integers(1, term.sides + 1, size=n)
+                continue
+            dice = rng.integers(1, term.sides + 1, size=(n, term.count))
+            if term.keep is not None:
+                dice.sort(axis=1)
+                dice = dice[:, -term.keep:] if term.keep_highest else dice[:, :term.keep]
+            totals += term.sign * dice.sum(axis=1)
+        return totals
+
+    def _ways(self, variables):
+        """
+        Exact outcome counts of the whole expression.
+
+        :return: ``(lowest_total, ways, number_of_outcomes)``.
+        :rtype: tuple
+        """
+        table = (0, [1])
+        outcomes = 1
+        for term in self.terms:
+            if term.count:
+                if term.keep is None:
+                    lo, ways = _dice_ways(term.count, term.sides)
+                else:
+                    lo, ways = _keep_ways(term.count, term.sides, term.keep, term.keep_highest)
+                outcomes *= term.sides ** term.count
+                if term.sign < 0:
+                    lo, ways = -(lo + len(ways) - 1), ways[::-1]
+                table = _add_ways(table, (lo, ways))
+            else:
+                table = (table[0] + term.sign * self._flat(term, variables), table[1])
+        return table[0], table[1], outcomes
+
+    def distribution(self, **variables):
+        """
+        Compute the exact probability of every total.
+
+        :return: Mapping of total to probability as a Fraction, sorted by total.
+        :rtype: dict
+        :raises DiceError: If a keep term has too many outcomes to enumerate.
+        """
+        lo, ways, outcomes = self._ways(variables)
+        return {lo + i: Fraction(w, outcomes) for i, w in enumerate(ways) if w}
+
+    def mean(self, **variables):
+        """
+        Exact expected total.
+
+        :rtype: Fraction
+        """
+        lo, ways, outcomes = self._ways(variables)
+        return Fraction(sum((lo + i) * w for i, w in enumerate(ways)), outcomes)
+
+    def bounds(self, **variables):
+        """
+        Lowest and highest possible totals.
+
+        :return: ``(min, max)``.
+        :rtype: tuple
+        """
+        lo = hi = 0
+        for term in self.terms:
+            if term.count:
+                n = term.keep or term.count
+                low, high = n, n * term.sides
+            else:
+                low = high = self._flat(term, variables)
+            if term.sign < 0:
+                low, high = -high, -low
+            lo += low
+            hi += high
+        return lo, hi
+
+    def probability_at_least(self, target, **variables):
+        """
+        Exact probability that a roll reaches `target`.
+
+        :param target: Threshold total.
+        :type target: int
+        :rtype: Fraction
+        """
+        return sum((p for total, p in self.distribution(**variables).items() if total >= target), Fraction(0))
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(expression):
+    """
+    Parse a dice expression into a cached :class:`DicePlan`.
+
+    Supported syntax: ``NdM`` (``N`` defaults to 1, ``d%`` is d100),
+    ``NdMkhK``/``NdMklK`` to keep the K highest/lowest dice (``kK`` means
+    ``khK``), ``d20adv``/``d20dis`` for advantage/disadvantage, integer
+    constants, upper-case named modifiers like ``MOD``, ``+``/``-`` between
+    terms, and lower-case damage-type words that tag every term since the
+    previous tag, e.g. ``"1d6+2 slashing + 1d4 fire"``.
+
+    :param expression: The expression.
+    :type expression: str
+    :return: The compiled plan.
+    :rtype: DicePlan
+    :raises DiceError: If the expression is malformed.
+    """
+    if not isinstance(expression, str):
+        raise DiceError(f"Invalid dice expression: {expression!r}")
+    return DicePlan(expression, _parse(expression))
+
+
+def roll(expression, **variables):
+    """
+    Roll a dice expression once.
+
+    :param expression: The expression, see :func:`compile_dice`.
+    :type expression: str
+    :return: The total.
+    :rtype: int
+    """
+    return compile_dice(expression).roll(**variables)
+
+
+def roll_many(expression, n, rng=None, **variables):
+    """
+    Roll a dice expression `n` times into a NumPy array.
+
+    :param expression: The expression, see :func:`compile_dice`.
+    :type expression: str
+    :param n: Number of rolls.
+    :type n: int
+    :param rng: NumPy random generator.
+    :type rng: numpy.random.Generator, optional
+    :return: Array of totals.
+    :rtype: numpy.ndarray
+    """
+    return compile_dice(expression).roll_many(n, rng=rng, **variables)
+
+
+def distribution(expression, **variables):
+    """
+    Exact probability distribution of a dice expression.
+
+    :param expression: The expression, see :func:`compile_dice`.
+    :type expression: str
+    :return: Mapping of total to Fraction probability.
+    :rtype: dict
+    """
+    return compile_dice(expression).distribution(**variables)
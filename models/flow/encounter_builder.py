@@ -0,0 +1,472 @@
+import bisect
+import math
+import random
+from fractions import Fraction
+
+#: Difficulty names, easiest first.
+DIFFICULTIES = ("easy", "medium", "hard", "deadly")
+
+#: XP thresholds per character level: (easy, medium, hard, deadly).
+XP_THRESHOLDS = {
+    1: (25, 50, 75, 100),
+    2: (50, 100, 150, 200),
+    3: (75, 150, 225, 400),
+    4: (125, 250, 375, 500),
+    5: (250, 500, 750, 1100),
+    6: (300, 600, 900, 1400),
+    7: (350, 750, 1100, 1700),
+    8: (450, 900, 1400, 2100),
+    9: (550, 1100, 1600, 2400),
+    10: (600, 1200, 1900, 2800),
+    11: (800, 1600, 2400, 3600),
+    12: (1000, 2000, 3000, 4500),
+    13: (1100, 2200, 3400, 5100),
+    14: (1250, 2500, 3800, 5700),
+    15: (1400, 2800, 4300, 6400),
+    16: (1600, 3200, 4800, 7200),
+    17: (2000, 3900, 5900, 8800),
+    18: (2100, 4200, 6300, 9500),
+    19: (2400, 4900, 7300, 10900),
+    20: (2800, 5700, 8500, 12700),
+}
+
+#: XP awarded per challenge rating.
+CR_XP = {
+    0: 10, 0.125: 25, 0.25: 50, 0.5: 100, 1: 200, 2: 450, 3: 700, 4: 1100, 5: 1800,
+    6: 2300, 7: 2900, 8: 3900, 9: 5000, 10: 5900, 11: 7200, 12: 8400, 13: 10000,
+    14: 11500, 15: 13000, 16: 15000, 17: 18000, 18: 20000, 19: 22000, 20: 25000,
+    21: 33000, 22: 41000, 23: 50000, 24: 62000, 25: 75000, 26: 90000, 27: 105000,
+    28: 120000, 29: 135000, 30: 155000,
+}
+
+# encounter multipliers, indexed by group size bracket; the ends are used
+# when a small or large party shifts the bracket
+_MULTIPLIERS = (0.5, 1, 1.5, 2, 2.5, 3, 4, 5)
+_GROUP_BRACKETS = (1, 2, 3, 7, 11, 15)   # smallest monster count of brackets 1..6
+
+# every XP value in the tables is a multiple of this, so sums are tracked in these units
+_XP_UNIT = 5
+
+
+def _cr_value(cr):
+    """
+    Parse a challenge rating given as a number or a string like "1/4".
+
+    :rtype: float or None
+    """
+    if cr is None:
+        return None
+    try:
+        return float(Fraction(str(cr)))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def xp_for_cr(cr):
+    """
+    Get the XP of a challenge rating.
+
+    :param cr: Challenge rating, e.g. 2, 0.25 or "1/4".
+    :type cr: float or str
+    :return: XP, 0 for an unknown rating.
+    :rtype: int
+    """
+    return CR_XP.get(_cr_value(cr), 0)
+
+
+def party_thresholds(levels):
+    """
+    Sum the party's XP thresholds.
+
+    :param levels: Character level of each party member.
+    :type levels: list[int]
+    :return: Mapping of difficulty to XP threshold.
+    :rtype: dict
+    :raises ValueError: If the party is empty or a level is outside 1-20.
+    """
+    if not levels:
+        raise ValueError("The party needs at least one character")
+    totals = [0, 0, 0, 0]
+    for level in levels:
+        if level not in XP_THRESHOLDS:
+            raise ValueError(f"Character level must be between 1 and 20, got {level}")
+        for i, xp in enumerate(XP_THRESHOLDS[level]):
+            totals[i] += xp
+    return dict(zip(DIFFICULTIES, totals))
+
+
+def encounter_multiplier(monster_count, party_size=4):
+    """
+    Get the XP multiplier for a number of monsters.
+
+    Parties of fewer than three characters use the next higher multiplier,
+    parties of six or more the next lower one.
+
+    :param monster_count: Number of monsters.
+    :type monster_count: int
+    :param party_size: Number of characters.
+    :type party_size: int
+    :rtype: float
+    """
+    if monster_count <= 0:
+        return 0
+    bracket = bisect.bisect_right(_GROUP_BRACKETS, monster_count)
+    if party_size < 3:
+        bracket += 1
+    elif party_size >= 6:
+        bracket -= 1
+    return _MULTIPLIERS[bracket]
+
+
+def adjusted_xp(monster_xps, party_size=4):
+    """
+    Get the multiplier-adjusted XP of a group of monsters.
+
+    :param monster_xps: XP of each monster.
+    :type monster_xps: list[int]
+    :param party_size: Number of characters.
+    :type party_size: int
+    :rtype: float
+    """
+    return sum(monster_xps) * encounter_multiplier(len(monster_xps), party_size)
+
+
+def rate_encounter(levels, monster_xps):
+    """
+    Rate the difficulty of an encounter.
+
+    :param levels: Character level of each party member.
+    :type levels: list[int]
+    :param monster_xps: XP of each monster.
+    :type monster_xps: list[int]
+    :return: "trivial", "easy", "medium", "hard" or "deadly".
+    :rtype: str
+    """
+    thresholds = party_thresholds(levels)
+    xp = adjusted_xp(monster_xps, len(levels))
+    rating = "trivial"
+    for difficulty in DIFFICULTIES:
+        if xp >= thresholds[difficulty]:
+            rating = difficulty
+    return rating
+
+
+def entity_xp(entity):
+    """
+    Get the XP of a game entity imported from the rulebook.
+
+    Uses ``stats["xp"]`` and falls back to ``stats["cr"]``.
+
+    :param entity: Entity with a ``stats`` dict.
+    :type entity: GameEntity
+    :rtype: int
+    """
+    stats = getattr(entity, "stats", None) or {}
+    return stats.get("xp") or xp_for_cr(stats.get("cr"))
+
+
+class MonsterRecord:
+    """
+    Encounter-building data of one monster.
+
+    :ivar slug: SRD index.
+    :ivar name: Display name.
+    :ivar cr: Challenge rating as a float.
+    :ivar xp: XP value.
+    :ivar type: Monster type keyword ("swarm" for swarms).
+    """
+
+    __slots__ = ("slug", "name", "cr", "xp", "type")
+
+    def __init__(self, slug, name, cr, xp, type):
+        self.slug = slug
+        self.name = name
+        self.cr = cr
+        self.xp = xp
+        self.type = type
+
+    def __repr__(self):
+        return f"<MonsterRecord {self.slug} CR {self.cr:g} {self.xp} XP>"
+
+
+class MonsterTable:
+    """
+    Monsters sorted by XP, with precomputed CR and type lookups.
+
+    :param monsters: SRD monster entries (dicts with index, name,
+        challenge_rating, xp and type); summaries are enough.
+    :type monsters: list[dict]
+    """
+
+    def __init__(self, monsters):
+        records = []
+        for m in monsters or ():
+            if not isinstance(m, dict) or not m.get("name"):
+                continue
+            cr = _cr_value(m.get("challenge_rating"))
+            xp = m.get("xp") or xp_for_cr(cr)
+            if cr is None or not xp:
+                continue
+            monster_type = (m.get("type") or "").lower()
+            if monster_type.startswith("swarm"):
+                monster_type = "swarm"
+            records.append(MonsterRecord(m.get("index") or m["name"], m["name"], cr, int(xp), monster_type))
+        records.sort(key=lambda r: (r.xp, r.name))
+        self.records = records
+        self.xps = [r.xp for r in records]
+        self.crs = sorted({r.cr for r in records})
+        self.types = sorted({r.type for r in records if r.type})
+
+    def __len__(self):
+        return len(self.records)
+
+    def select(self, types=None, min_cr=None, max_cr=None, max_xp=None, predicate=None, slugs=None):
+        """
+        Get the monsters matching filters, sorted by XP.
+
+        :param types: Allowed monster types, e.g. {"undead", "fiend"}.
+        :type types: iterable of str, optional
+        :param min_cr: Lowest challenge rating.
+        :type min_cr: float, optional
+        :param max_cr: Highest challenge rating.
+        :type max_cr: float, optional
+        :param max_xp: Highest XP value.
+        :type max_xp: int, optional
+        :param predicate: Extra test applied to each MonsterRecord.
+        :type predicate: callable, optional
+        :param slugs: Allowed SRD indexes, e.g. from ``MonsterStatTable.filter``.
+        :type slugs: iterable of str, optional
+        :rtype: list[MonsterRecord]
+        """
+        end = bisect.bisect_right(self.xps, max_xp) if max_xp is not None else len(self.records)
+        types = {t.lower() for t in types} if types else None
+        min_cr, max_cr = _cr_value(min_cr), _cr_value(max_cr)
+        slugs = set(slugs) if slugs is not None else None
+        return [
+            r for r in self.records[:end]
+            if (types is None or r.type in types)
+            and (min_cr is None or r.cr >= min_cr)
+            and (max_cr is None or r.cr <= max_cr)
+            and (slugs is None or r.slug in slugs)
+            and (predicate is None or predicate(r))
+        ]
+
+
+class Encounter:
+    """
+    A suggested group of monsters.
+
+    :ivar groups: List of ``(count, MonsterRecord)``.
+    :ivar xp: Total XP of the monsters.
+    :ivar adjusted_xp: XP after the encounter multiplier.
+    :ivar difficulty: Difficulty rating for the party.
+    """
+
+    def __init__(self, groups, party_size, levels):
+        self.groups = groups
+        xps = [record.xp for count, record in groups for _ in range(count)]
+        self.xp = sum(xps)
+        self.adjusted_xp = adjusted_xp(xps, party_size)
+        self.difficulty = rate_encounter(levels, xps)
+
+    def __repr__(self):
+        return f"<Encounter {self.spec()!r} {self.adjusted_xp:g} XP {self.difficulty}>"
+
+    @property
+    def monster_count(self):
+        """
+        Number of monsters.
+
+        :rtype: int
+        """
+        return sum(count for count, _ in self.groups)
+
+    def entries(self):
+        """
+        List the monsters as ``(count, slug)`` pairs.
+
+        ``RulebookImporter.import_many`` takes the list as is, including
+        monsters whose names contain commas ("Wereboar, Human Form").
+
+        :return: E.g. ``[(4, "goblin"), (1, "bugbear")]``.
+        :rtype: list[tuple]
+        """
+        return [(count, record.slug) for count, record in self.groups]
+
+    def spec(self):
+        """
+        Describe the encounter for display.
+
+        Names are joined with commas, so a name that contains one makes the
+        text ambiguous for ``RulebookImporter.import_encounter``; import
+        :meth:`entries` instead.
+
+        :return: E.g. "4 Goblin, 1 Bugbear".
+        :rtype: str
+        """
+        return ", ".join(f"{count} {record.name}" for count, record in self.groups)
+
+
+class EncounterBuilder:
+    """
+    Builds encounters that fit a party's XP budget.
+
+    The monster table is built once from the handler's monster category.
+    :meth:`build` searches every monster count up to a limit for the
+    combination of XP values whose multiplier-adjusted total lands closest
+    to the middle of the requested difficulty band. The search is an
+    unbounded knapsack over the distinct XP values of the allowed monsters,
+    with the reachable totals for each monster count kept as integer
+    bitsets, so a query over the whole SRD takes a few milliseconds.
+
+    :param api: Handler providing ``get("monsters")`` (e.g. LocalAPIHandler).
+    :type api: object
+    :param table: Prebuilt table, instead of reading it from `api`.
+    :type table: MonsterTable, optional
+    """
+
+    def __init__(self, api=None, table=None):
+        self.api = api
+        self._table = table
+
+    @property
+    def table(self):
+        """
+        The monster table, built on first use.
+
+        :rtype: MonsterTable
+        """
+        if self._table is None:
+            self._table = MonsterTable(self.api.get("monsters") if self.api is not None else [])
+        return self._table
+
+    def build(self, levels, difficulty="hard", types=None, min_cr=None, max_cr=None,
+              max_monsters=8, max_groups=3, predicate=None, slugs=None, rng=None):
+        """
+        Suggest an encounter of a given difficulty.
+
+        :param levels: Character level of each party member.
+        :type levels: list[int]
+        :param difficulty: "easy", "medium", "hard" or "deadly".
+        :type difficulty: str
+        :param types: Allowed monster types.
+        :type types: iterable of str, optional
+        :param min_cr: Lowest challenge rating.
+        :type min_cr: float, optional
+        :param max_cr: Highest challenge rating.
+        :type max_cr: float, optional
+        :param max_monsters: Largest number of monsters.
+        :type max_monsters: int
+        :param max_groups: Largest number of different monsters.
+        :type max_groups: int
+        :param predicate: Extra test applied to each MonsterRecord.
+        :type predicate: callable, optional
+        :param slugs: Allowed SRD indexes; use a ``MonsterStatTable`` query
+            to restrict by stats, e.g. ``table.slugs_of(table.filter(immune="fire"))``.
+        :type slugs: iterable of str, optional
+        :param rng: Random generator choosing among monsters of equal XP.
+        :type rng: random.Random, optional
+        :return: The best encounter found, or None if no allowed monsters fit the band.
+        :rtype: Encounter or None
+        :raises ValueError: For an unknown difficulty or an invalid party.
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty!r}")
+        thresholds = party_thresholds(levels)
+        party_size = len(levels)
+        position = DIFFICULTIES.index(difficulty)
+        low = thresholds[difficulty]
+        # the deadliest band is open-ended; cap it at twice its threshold
+        high = thresholds[DIFFICULTIES[position + 1]] if position + 1 < len(DIFFICULTIES) else 2 * low
+        target = (low + high) / 2
+
+        # no monster can be worth more than the band allows on its own
+        candidates = self.table.select(types, min_cr, max_cr, max_xp=high, predicate=predicate, slugs=slugs)
+        by_xp = {}
+        for record in candidates:
+            by_xp.setdefault(record.xp // _XP_UNIT, []).append(record)
+        if not by_xp:
+            return None
+        values = sorted(by_xp, reverse=True)
+
+        best = None     # (score, count, sum in units)
+        reach = [1]     # reach[c]: bit s set if c monsters can total s units
+        max_units = math.ceil(high / _XP_UNIT)
+        mask = (1 << (max_units + 1)) - 1
+        for count in range(1, max_monsters + 1):
+            reachable = 0
+            previous = reach[-1]
+            for v in values:
+                reachable |= previous << v
+            reachable &= mask
+            reach.append(reachable)
+            if not reachable:
+                break
+            multiplier = encounter_multiplier(count, party_size)
+            lo_units = math.ceil(low / multiplier / _XP_UNIT)
+            hi_units = math.ceil(high / multiplier / _XP_UNIT) - 1     # adjusted XP stays below `high`
+            for total in self._nearest_bits(reachable, lo_units, hi_units, target / multiplier / _XP_UNIT):
+                score = abs(total * _XP_UNIT * multiplier - target)
+                if best is not None and (score, count) >= best[:2]:
+                    break
+                groups = self._split(reach, values, count, total, max_groups)
+                if groups is not None:
+                    best = (score, count, groups)
+                    break
+        if best is None:
+            return None
+        rng = rng or random
+        groups = [(n, rng.choice(by_xp[v])) for v, n in best[2]]
+        return Encounter(groups, party_size, levels)
+
+    @staticmethod
+    def _nearest_bits(bits, lo, hi, target, limit=64):
+        """
+        Yield set bit positions of `bits` within ``[lo, hi]``, nearest to `target` first.
+
+        At most `limit` positions are produced.
+        """
+        lo = max(lo, 0)
+        if hi < lo:
+            return
+        bits = (bits >> lo) & ((1 << (hi - lo + 1)) - 1)
+        pivot = min(max(int(target) - lo, 0), hi - lo)
+        below = bits & ((1 << (pivot + 1)) - 1)     # positions <= pivot
+        above = bits >> (pivot + 1)                  # positions > pivot, shifted
+        for _ in range(limit):
+            down = lo + below.bit_length() - 1 if below else None
+            up = lo + pivot + 1 + ((above & -above).bit_length() - 1) if above else None
+            if down is None and up is None:
+                return
+            if up is None or (down is not None and target - down <= up - target):
+                yield down
+                below &= ~(1 << (down - lo))
+            else:
+                yield up
+                above &= above - 1
+
+    @staticmethod
+    def _split(reach, values, count, total, max_groups):
+        """
+        Recover a multiset of XP values with `count` items summing to `total`.
+
+        Larger values are tried first and each value is taken as often as
+        possible, which keeps the number of different monsters low.
+
+        :return: List of ``(value, times)``, or None if more than `max_groups` values are needed.
+        :rtype: list or None
+        """
+        picked = []
+        for v in values:
+            times = 0
+            while count and total >= v and (reach[count - 1] >> (total - v)) & 1:
+                count -= 1
+                total -= v
+                times += 1
+            if times:
+                picked.append((v, times))
+                if len(picked) > max_groups:
+                    return None
+            if not count:
+                break
+        return picked if not count and not total else None
@@ -1,16 +1,142 @@
+from collections import deque
+
 from core.logger import app_logger
 
+#: Resolution order of reaction modes: interrupts first, "after" reactions last.
+REACTION_MODES = ("interrupt", "parallel", "after")
+
+#: Resolution order of cast priorities; "medium" is an alias of "normal".
+CAST_PRIORITIES = {"high": 0, "normal": 1, "medium": 1, "low": 2}
+
+_DEFAULT_MODE = "after"
+_DEFAULT_PRIORITY = "normal"
+
+
+class _ReactionBuckets:
+    """
+    One FIFO deque per (reaction mode, cast priority) pair, in resolution order.
+
+    Adding and popping are O(1): the number of buckets is fixed.
+    """
+    __slots__ = ("_buckets", "_size")
+
+    def __init__(self):
+        self._buckets = [deque() for _ in range(len(REACTION_MODES) * 3)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, rank, reaction):
+        self._buckets[rank].append(reaction)
+        self._size += 1
+
+    def popleft(self):
+        for bucket in self._buckets:
+            if bucket:
+                self._size -= 1
+                return bucket.popleft()
+        raise IndexError("pop from an empty reaction queue")
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self._size = 0
+
+
+class _queue_method:
+    """
+    Method descriptor that binds to the process-wide default queue when
+    accessed on the class, so ``ReactionQueue.add(r)`` keeps working next to
+    per-encounter ``ReactionQueue()`` instances.
+    """
+
+    def __init__(self, func):
+        self.__func__ = func
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner.default()
+        return self.__func__.__get__(instance, owner)
+
+
 class ReactionQueue:
     """
     A queue to manage and resolve reaction objects.
 
-    Reactions are expected to have a `resolve()` method.
+    Reactions are expected to have a `resolve()` method. They are resolved
+    by reaction mode ("interrupt", then "parallel", then "after") and, within
+    a mode, by cast priority ("high", "normal"/"medium", "low"); equal
+    reactions resolve in the order they were added. Both are read from the
+    reaction itself or from its ``spell`` attribute, falling back to "after"
+    and "normal".
+
+    Create one instance per encounter to keep simultaneous encounters apart.
+    Calling the methods on the class itself uses a shared default queue.
     """
 
-    _queue = []
+    _queue = _ReactionBuckets()
+    _default = None
+
+    def __init__(self):
+        """
+        Initialize an empty reaction queue.
+        """
+        self._queue = _ReactionBuckets()
 
     @classmethod
-    def add(cls, reaction):
+    def default(cls):
+        """
+        Get the shared queue used when methods are called on the class.
+
+        Returns
+        -------
+        ReactionQueue
+            The process-wide default queue.
+        """
+        if cls.__dict__.get("_default") is None:
+            inst = cls.__new__(cls)
+            # the default queue keeps the class-level storage
+            inst._queue = cls._queue
+            cls._default = inst
+        return cls._default
+
+    @staticmethod
+    def rank_of(reaction, priority=None, mode=None):
+        """
+        Compute the resolution rank of a reaction.
+
+        Parameters
+        ----------
+        reaction : object
+            The reaction, optionally carrying ``cast_priority`` / ``reaction_mode``
+            directly or on a ``spell`` attribute.
+        priority : str, optional
+            Overrides the reaction's cast priority.
+        mode : str, optional
+            Overrides the reaction's reaction mode.
+
+        Returns
+        -------
+        int
+            Bucket index; lower ranks resolve first.
+        """
+        source = getattr(reaction, "spell", None)
+        if priority is None:
+            priority = getattr(reaction, "cast_priority", None) or getattr(source, "cast_priority", None)
+        if mode is None:
+            mode = getattr(reaction, "reaction_mode", None) or getattr(source, "reaction_mode", None)
+        prio_rank = CAST_PRIORITIES.get(priority or _DEFAULT_PRIORITY, CAST_PRIORITIES[_DEFAULT_PRIORITY])
+        try:
+            mode_rank = REACTION_MODES.index(mode or _DEFAULT_MODE)
+        except ValueError:
+            mode_rank = REACTION_MODES.index(_DEFAULT_MODE)
+        return mode_rank * 3 + prio_rank
+
+    @_queue_method
+    def add(self, reaction, priority=None, mode=None):
         """
         Add a reaction to the queue.
 
@@ -18,12 +144,34 @@ class ReactionQueue:
         ----------
         reaction : object
             An object with at least a `resolve()` method.
+        priority : str, optional
+            Cast priority overriding the reaction's own.
+        mode : str, optional
+            Reaction mode overriding the reaction's own.
         """
-        cls._queue.append(reaction)
+        self._queue.append(self.rank_of(reaction, priority, mode), reaction)
         app_logger.debug(f"[ReactionQueue] Added reaction: {reaction}")
 
-    @classmethod
-    def blocked(cls):
+    @_queue_method
+    def add_many(self, reactions):
+        """
+        Add several reactions at once.
+
+        Parameters
+        ----------
+        reactions : iterable
+            Objects with at least a `resolve()` method.
+        """
+        queue = self._queue
+        rank_of = self.rank_of
+        count = 0
+        for reaction in reactions:
+            queue.append(rank_of(reaction), reaction)
+            count += 1
+        app_logger.debug(f"[ReactionQueue] Added {count} reactions")
+
+    @_queue_method
+    def blocked(self):
         """
         Check if execution is currently blocked by pending reactions.
 
@@ -32,21 +180,50 @@ class ReactionQueue:
         bool
             True if there are pending reactions in the queue, False otherwise.
         """
-        return len(cls._queue) > 0
+        return len(self._queue) > 0
 
-    @classmethod
-    def resolve(cls):
+    @_queue_method
+    def clear(self):
+        """
+        Drop all pending reactions without resolving them.
+        """
+        self._queue.clear()
+
+    def __len__(self):
+        return len(self._queue)
+
+    @_queue_method
+    def resolve(self, limit=None):
         """
-        Resolve all queued reactions in order.
+        Resolve queued reactions in order.
 
         Each reaction's `resolve()` method is called. If an exception occurs,
-        it is caught and printed, and resolution continues with the next reaction.
+        it is caught and logged, and resolution continues with the next reaction.
+        Reactions queued while resolving are picked up in the same call, so an
+        "interrupt" added by a reaction resolves before the remaining ones.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Resolve at most this many reactions and leave the rest queued.
+
+        Returns
+        -------
+        int
+            Number of reactions resolved.
         """
         app_logger.info("[ReactionQueue] Resolving reactions...")
-        while cls._queue:
-            reaction = cls._queue.pop(0)
+        queue = self._queue
+        resolved = 0
+        while queue and (limit is None or resolved < limit):
+            reaction = queue.popleft()
+            resolved += 1
             try:
                 reaction.resolve()
             except Exception as e:
                 app_logger.error(f"[ReactionQueue] Error resolving {reaction}: {e}")
-        app_logger.info("[ReactionQueue] All reactions resolved.")
+        if queue:
+            app_logger.info(f"[ReactionQueue] {len(queue)} reactions left pending.")
+        else:
+            app_logger.info("[ReactionQueue] All reactions resolved.")
+        return resolved
@@ -18,11 +18,13 @@ class TurnSystem:
         The index of the entity whose turn it is.
     round_number : int
         The current round number.
+    reaction_queue : ReactionQueue
+        Queue whose reactions block and are resolved during turns.
     _scheduled : list
         Internal queue of scheduled callbacks.
     """
 
-    def __init__(self, entities):
+    def __init__(self, entities, reaction_queue=None):
         """
         Initialize the TurnSystem.
 
@@ -30,8 +32,11 @@ class TurnSystem:
         ----------
         entities : list
             The entities participating in the turn system.
+        reaction_queue : ReactionQueue, optional
+            Per-encounter reaction queue; defaults to the shared ReactionQueue.
         """
         self.entities = entities
+        self.reaction_queue = reaction_queue if reaction_queue is not None else ReactionQueue
         self.current_turn = 0
         self.round_number = 1
 
@@ -94,11 +99,11 @@ class TurnSystem:
         if ActionValidator.validate(proposed_action):
             EventBus.emit("ACTION_PROPOSED", proposed_action)
 
-        if not ReactionQueue.blocked():
+        if not self.reaction_queue.blocked():
             proposed_action.execute()
             EventBus.emit("ACTION_EXECUTED", proposed_action)
         else:
-            ReactionQueue.resolve()
+            self.reaction_queue.resolve()
 
         # End‐of‐turn: dispatch any events scheduled exactly for this round
         self._dispatch_scheduled()
@@ -1,4 +1,5 @@
 from models.flow.action.action import roll, apply_effect
+from utils.copy_on_write import CopyOnWrite
 
 class Spell:
     """
@@ -34,6 +35,9 @@ class Spell:
     :type reaction_mode: str
     """
 
+    # may be shared with a rulebook template until first used (see RulebookSpell.to_spell)
+    components = CopyOnWrite()
+
     def __init__(
         self,
         name,
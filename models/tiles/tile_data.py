@@ -3,6 +3,7 @@ from typing import List, Tuple, Optional
 from enum import Enum
 from models.entities.game_entity import GameEntity  # Ensure this has to_dict/from_dict implemented
 from core.gameCreation.trigger import Trigger  # Ensure this has to_dict/from_dict implemented
+from utils.observable_list import ObservableList
 
 class TerrainType(Enum):
     """
@@ -77,6 +78,15 @@ class TileData:
         Timestamp of the last update to the tile.
     triggers : List[Trigger]
         List of triggers associated with the tile.
+
+    Notes
+    -----
+    A tile owned by a grid (e.g. ``WorldTileManager``) carries a change
+    listener, called as ``listener(tile, field_name, old, new)`` whenever a
+    field is reassigned. Tag changes are reported with frozensets of the old
+    and new tags, including in-place edits such as ``tile.tags.append(...)``;
+    in-place edits of ``entities`` and ``triggers`` are reported with tuples.
+    Every such change after construction also marks the tile dirty.
     """
 
     tile_id: str = "new_tile"
@@ -92,6 +102,106 @@ class TileData:
     background_image: Optional[str] = None
     ambient_audio: Optional[str] = None
 
+    # not a dataclass field: set by the grid owning this tile
+    _listener = None
+    # not a dataclass field: the tile changed since it was last saved
+    _dirty = False
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        # the first assignment of a field happens in __init__ and is not an edit
+        edit = name in self.__dict__
+        if name == "tags":
+            old = frozenset(self.__dict__.get("tags", ()))
+            value = ObservableList(value, self._tags_changed)
+            object.__setattr__(self, name, value)
+            new = frozenset(value)
+            if edit and old != new:
+                self._notify_change("tags", old, new)
+            return
+        if name in ("entities", "triggers"):
+            old = tuple(self.__dict__.get(name, ()))
+            value = self._observed(name, value)
+            object.__setattr__(self, name, value)
+            if edit:
+                self._notify_change(name, old, tuple(value))
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        if edit and old is not value:
+            self._notify_change(name, old, value)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_listener", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__["tags"] = ObservableList(state.get("tags", ()), self._tags_changed)
+        for name in ("entities", "triggers"):
+            self.__dict__[name] = self._observed(name, state.get(name, ()))
+
+    def _observed(self, name, items):
+        """Wrap an entity or trigger list so in-place edits are reported as `name` changes."""
+        return ObservableList(
+            items,
+            lambda before, after: self._notify_change(name, before, after),
+            snapshot=tuple,
+        )
+
+    def _tags_changed(self, before, after):
+        """Callback of the observable tag list; reports real membership changes."""
+        if before != after:
+            self._notify_change("tags", before, after)
+
+    def _notify_change(self, name, old, new):
+        """
+        Mark the tile dirty and report a field change to the listener, if one is attached.
+
+        Parameters
+        ----------
+        name : str
+            Name of the changed field.
+        old : Any
+            Previous value.
+        new : Any
+            New value.
+        """
+        self._dirty = True
+        if self._listener is not None:
+            self._listener(self, name, old, new)
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether the tile was edited since it was last saved.
+
+        Returns
+        -------
+        bool
+            True if the next incremental save must write this tile.
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        """
+        Flag the tile for the next incremental save.
+
+        Field assignments and in-place edits of ``tags``, ``entities`` and
+        ``triggers`` set the flag themselves; call this after changes the
+        tile cannot see, such as edits inside an entity or trigger.
+        """
+        self._dirty = True
+
+    def mark_clean(self):
+        """
+        Clear the unsaved-change flag once the tile has been written.
+        """
+        self._dirty = False
+
     def is_occupied(self) -> bool:
         """
         Check if the tile is occupied by a player, NPC, or enemy entity.
@@ -129,6 +239,7 @@ class TileData:
             The entity to add.
         """
         self.entities.append(entity)
+        self.mark_dirty()
 
     def remove_entity(self, entity: GameEntity):
         """
@@ -141,6 +252,7 @@ class TileData:
         """
         if entity in self.entities:
             self.entities.remove(entity)
+            self.mark_dirty()
     
     def register_trigger(self, trigger):
         """
@@ -155,6 +267,7 @@ class TileData:
         if trigger not in self.triggers:
             self.triggers.append(trigger)
             EventBus.subscribe(trigger.event_type, trigger.check_and_react)
+            self.mark_dirty()
 
     def to_dict(self) -> dict:
         """
@@ -80,3 +80,5 @@ class TilePreset:
             from core.gameCreation.event_bus import EventBus
             for trig in tile_data.triggers:
                 EventBus.subscribe(trig.event_type, trig.check_and_react)
+
+        tile_data.mark_dirty()
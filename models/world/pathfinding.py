@@ -0,0 +1,321 @@
+import heapq
+from collections import OrderedDict
+
+from models.tiles.tile_data import TerrainType, TileTag
+
+# neighbour offsets, in the order WorldTileManager.get_adjacent_tiles uses
+_OFFSETS = {
+    "square": ((0, -1), (0, 1), (-1, 0), (1, 0)),
+    "hex": ((1, 0), (-1, 0), (0, -1), (0, 1), (-1, 1), (1, -1)),
+}
+
+#: Movement cost of entering a tile of each terrain; None means impassable.
+DEFAULT_TERRAIN_COSTS = {
+    TerrainType.FLOOR: 1,
+    TerrainType.GRASS: 1,
+    TerrainType.CUSTOM: 1,
+    TerrainType.WATER: 2,
+    TerrainType.MOUNTAIN: 3,
+    TerrainType.WALL: None,
+}
+
+#: Number of distance fields a PathFinder keeps.
+FIELD_CACHE_SIZE = 64
+
+
+class DistanceField:
+    """
+    Result of a Dijkstra search from one source tile.
+
+    :param source: (x, y) tuple the search started from.
+    :type source: tuple
+    :param max_cost: Cost limit of the search, or None if unbounded.
+    :type max_cost: int or None
+    """
+
+    def __init__(self, source, max_cost):
+        self.source = source
+        self.max_cost = max_cost
+        self.cost = {source: 0}     # maps (x, y) → cheapest cost from source
+        self.parent = {source: None}
+        self.touched = {source}     # reached tiles plus every neighbour looked at
+
+    def covers(self, max_cost):
+        """
+        Check whether this field already answers a search limited to `max_cost`.
+
+        :param max_cost: Requested cost limit, or None for unbounded.
+        :type max_cost: int or None
+        :return: True if the field can be reused.
+        :rtype: bool
+        """
+        if self.max_cost is None:
+            return True
+        return max_cost is not None and max_cost <= self.max_cost
+
+    def path_to(self, goal):
+        """
+        Reconstruct the cheapest path from the source to `goal`.
+
+        :param goal: (x, y) target tuple.
+        :type goal: tuple
+        :return: List of (x, y) tuples from source to goal, or None if unreached.
+        :rtype: list or None
+        """
+        if goal not in self.parent:
+            return None
+        path = []
+        node = goal
+        while node is not None:
+            path.append(node)
+            node = self.parent[node]
+        path.reverse()
+        return path
+
+
+class PathFinder:
+    """
+    Dijkstra/A* pathfinding over a WorldTileManager grid.
+
+    Tiles tagged TileTag.BLOCKS_MOVEMENT or with impassable terrain cannot be
+    entered; every other tile costs its terrain's movement cost to enter.
+    Distance fields are cached per source and reused across turns until a
+    tile they looked at changes terrain or movement blocking, or until they
+    are the least recently used once `max_fields` are cached.
+    """
+
+    def __init__(self, tile_manager, terrain_costs=None, max_fields=FIELD_CACHE_SIZE):
+        """
+        Initialize a PathFinder.
+
+        :param tile_manager: The grid to search.
+        :type tile_manager: WorldTileManager
+        :param terrain_costs: Optional mapping of TerrainType to entry cost (None = impassable).
+        :type terrain_costs: dict, optional
+        :param max_fields: Number of distance fields kept.
+        :type max_fields: int, optional
+        """
+        self.tile_manager = tile_manager
+        self.max_fields = max_fields
+        self.terrain_costs = dict(DEFAULT_TERRAIN_COSTS)
+        if terrain_costs:
+            self.terrain_costs.update(terrain_costs)
+        self._fields = OrderedDict()   # maps source (x, y) → DistanceField, oldest use first
+        self._costs = None  # flat (x * height + y) entry costs, built on first search
+
+    def __len__(self):
+        return len(self._fields)
+
+    def step_cost(self, x, y):
+        """
+        Get the cost of entering tile (x, y).
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: Entry cost, or None if the tile cannot be entered.
+        :rtype: int or None
+        """
+        return self._cost_table()[x * self.tile_manager.height + y]
+
+    def _cost_table(self):
+        """
+        Get the flat table of entry costs, building it from the grid arrays if needed.
+
+        :return: List of entry costs (None = impassable) in (x * height + y) order.
+        :rtype: list
+        """
+        if self._costs is None:
+            tiles = self.tile_manager.tiles
+            code_costs = [self.terrain_costs.get(t, 1) for t in tiles.TERRAINS]
+            block = tiles.tag_bit(TileTag.BLOCKS_MOVEMENT)
+            self._costs = [
+                None if bits & block else code_costs[code]
+                for code, bits in zip(tiles.terrain_codes, tiles.tag_bits)
+            ]
+        return self._costs
+
+    def distance_field(self, source, max_cost=None):
+        """
+        Get the (cached) distance field from `source`.
+
+        :param source: (x, y) tuple to search from.
+        :type source: tuple
+        :param max_cost: Stop expanding beyond this cost; None searches the whole grid.
+        :type max_cost: int, optional
+        :return: The distance field.
+        :rtype: DistanceField
+        """
+        source = tuple(source)
+        field = self._fields.get(source)
+        if field is not None and field.covers(max_cost):
+            self._fields.move_to_end(source)
+            return field
+
+        field = DistanceField(source, max_cost)
+        cost, parent, touched = field.cost, field.parent, field.touched
+        costs = self._cost_table()
+        width, height = self.tile_manager.width, self.tile_manager.height
+        offsets = _OFFSETS[self.tile_manager.tile_type]
+        frontier = [(0, source)]
+        while frontier:
+            dist, node = heapq.heappop(frontier)
+            if dist > cost[node]:
+                continue
+            x, y = node
+            for dx, dy in offsets:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                nxt = (nx, ny)
+                touched.add(nxt)
+                step = costs[nx * height + ny]
+                if step is None:
+                    continue
+                new_dist = dist + step
+                if max_cost is not None and new_dist > max_cost:
+                    continue
+                if new_dist < cost.get(nxt, new_dist + 1):
+                    cost[nxt] = new_dist
+                    parent[nxt] = node
+                    heapq.heappush(frontier, (new_dist, nxt))
+        self._fields[source] = field
+        self._fields.move_to_end(source)
+        while len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+    def _heuristic(self, a, b, cheapest):
+        """
+        Admissible distance estimate between two tiles.
+
+        :param a: (x, y) tuple.
+        :type a: tuple
+        :param b: (x, y) tuple.
+        :type b: tuple
+        :param cheapest: Lowest entry cost of any passable terrain.
+        :type cheapest: int
+        :return: Lower bound on the path cost from a to b.
+        :rtype: int
+        """
+        dx = b[0] - a[0]
+        dy = b[1] - a[1]
+        if self.tile_manager.tile_type == "hex":
+            steps = max(abs(dx), abs(dy), abs(dx + dy))
+        else:
+            steps = abs(dx) + abs(dy)
+        return steps * cheapest
+
+    def find_path(self, start, goal):
+        """
+        Find the cheapest path between two tiles.
+
+        A cached distance field from `start` is used when it already reaches
+        `goal`; otherwise an A* search is run.
+
+        :param start: (x, y) tuple to start from.
+        :type start: tuple
+        :param goal: (x, y) tuple to reach.
+        :type goal: tuple
+        :return: List of (x, y) tuples from start to goal inclusive, or None if unreachable.
+        :rtype: list or None
+        """
+        start, goal = tuple(start), tuple(goal)
+        tm = self.tile_manager
+        costs = self._cost_table()
+        height = tm.height
+        if not (tm.is_valid_tile(*start) and tm.is_valid_tile(*goal)):
+            return None
+        if start == goal:
+            return [start]
+
+        field = self._fields.get(start)
+        if field is not None and (goal in field.cost or field.max_cost is None):
+            self._fields.move_to_end(start)
+            return field.path_to(goal)
+
+        if self.step_cost(*goal) is None:
+            return None
+        passable = [c for c in self.terrain_costs.values() if c is not None]
+        cheapest = min(passable) if passable else 1
+        cost = {start: 0}
+        parent = {start: None}
+        frontier = [(self._heuristic(start, goal, cheapest), 0, start)]
+        while frontier:
+            _, dist, node = heapq.heappop(frontier)
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                path.reverse()
+                return path
+            if dist > cost[node]:
+                continue
+            for nxt in tm.get_adjacent_tiles(*node):
+                step = costs[nxt[0] * height + nxt[1]]
+                if step is None:
+                    continue
+                new_dist = dist + step
+                if new_dist < cost.get(nxt, new_dist + 1):
+                    cost[nxt] = new_dist
+                    parent[nxt] = node
+                    heapq.heappush(frontier, (new_dist + self._heuristic(nxt, goal, cheapest), new_dist, nxt))
+        return None
+
+    def movement_range(self, start, budget):
+        """
+        Get every tile reachable from `start` within a movement budget.
+
+        :param start: (x, y) tuple to start from.
+        :type start: tuple
+        :param budget: Maximum total movement cost.
+        :type budget: int
+        :return: Mapping of reachable (x, y) tuples to their cost.
+        :rtype: dict
+        """
+        field = self.distance_field(start, budget)
+        if field.max_cost == budget:
+            return dict(field.cost)
+        return {pos: c for pos, c in field.cost.items() if c <= budget}
+
+    def on_tile_changed(self, position, name, old, new):
+        """
+        Drop cached distance fields affected by a tile change.
+
+        Only terrain changes and changes to TileTag.BLOCKS_MOVEMENT matter,
+        and only fields that looked at the tile are dropped.
+
+        :param position: (x, y) tuple of the changed tile.
+        :type position: tuple
+        :param name: Name of the changed field.
+        :type name: str
+        :param old: Previous value.
+        :type old: Any
+        :param new: New value.
+        :type new: Any
+        """
+        if name == "tags":
+            if (TileTag.BLOCKS_MOVEMENT in old) == (TileTag.BLOCKS_MOVEMENT in new):
+                return
+        elif name != "terrain" or self.terrain_costs.get(old, 1) == self.terrain_costs.get(new, 1):
+            return
+        position = tuple(position)
+        if self._costs is not None:
+            tiles = self.tile_manager.tiles
+            x, y = position
+            self._costs[x * self.tile_manager.height + y] = (
+                None if tiles.has_tag(x, y, TileTag.BLOCKS_MOVEMENT)
+                else self.terrain_costs.get(tiles.terrain_at(x, y), 1)
+            )
+        stale = [src for src, field in self._fields.items() if position in field.touched]
+        for src in stale:
+            del self._fields[src]
+
+    def clear(self):
+        """
+        Drop every cached distance field and the cost table.
+        """
+        self._fields.clear()
+        self._costs = None
@@ -0,0 +1,150 @@
+class SpatialIndex:
+    """
+    Uniform grid of buckets answering "who could observe this tile?".
+
+    Each observer is registered in every bucket overlapped by the square
+    bounding its vision range, so a query only has to read the single bucket
+    containing the event tile. Observers without a ``vision_range`` have no
+    spatial bound and are kept in a separate set that every query returns.
+    """
+
+    def __init__(self, width, height, cell_size=8):
+        """
+        Initialize an empty SpatialIndex.
+
+        :param width: Width of the indexed grid in tiles.
+        :type width: int
+        :param height: Height of the indexed grid in tiles.
+        :type height: int
+        :param cell_size: Edge length of a bucket in tiles.
+        :type cell_size: int
+        """
+        self.width = width
+        self.height = height
+        self.cell_size = max(1, int(cell_size))
+        self._buckets = {}     # maps (cx, cy) → {id(entity): entity}
+        self._unbounded = {}   # id(entity) → entity, for observers with no vision_range
+        self._entries = {}     # id(entity) → (position, tuple of bucket keys)
+
+    def __contains__(self, entity):
+        return id(entity) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell_of(self, x, y):
+        """
+        Return the bucket key containing tile (x, y).
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: Bucket key.
+        :rtype: tuple
+        """
+        return (x // self.cell_size, y // self.cell_size)
+
+    def _cells_covering(self, position, vision_range):
+        """
+        Return the bucket keys overlapped by an observer's vision square.
+
+        The square is clamped to the grid, so huge ranges never register in
+        more buckets than the map has.
+
+        :param position: (x, y) position of the observer.
+        :type position: tuple
+        :param vision_range: Vision range of the observer.
+        :type vision_range: int
+        :return: Tuple of bucket keys.
+        :rtype: tuple
+        """
+        x, y = position
+        r = max(0, int(vision_range))
+        min_cx, min_cy = self._cell_of(max(0, x - r), max(0, y - r))
+        max_cx, max_cy = self._cell_of(
+            min(self.width - 1, x + r), min(self.height - 1, y + r)
+        )
+        return tuple(
+            (cx, cy)
+            for cx in range(min_cx, max_cx + 1)
+            for cy in range(min_cy, max_cy + 1)
+        )
+
+    def insert(self, entity, position):
+        """
+        Register an observer at the given position, replacing any earlier entry.
+
+        :param entity: The entity to index. Its ``vision_range`` is read now.
+        :type entity: GameEntity
+        :param position: (x, y) tile the entity is listed on.
+        :type position: tuple
+        """
+        self.remove(entity)
+        key = id(entity)
+        vision_range = getattr(entity, "vision_range", None)
+        if vision_range is None:
+            self._unbounded[key] = entity
+            cells = ()
+        else:
+            cells = self._cells_covering(position, vision_range)
+            for cell in cells:
+                self._buckets.setdefault(cell, {})[key] = entity
+        self._entries[key] = (tuple(position), cells)
+
+    def remove(self, entity):
+        """
+        Remove an observer from the index. Unknown entities are ignored.
+
+        :param entity: The entity to remove.
+        :type entity: GameEntity
+        """
+        key = id(entity)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._unbounded.pop(key, None)
+        for cell in entry[1]:
+            bucket = self._buckets.get(cell)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._buckets[cell]
+
+    def position_of(self, entity):
+        """
+        Return the position an entity was indexed at, or None.
+
+        :param entity: The entity to look up.
+        :type entity: GameEntity
+        :return: (x, y) tuple or None.
+        :rtype: tuple or None
+        """
+        entry = self._entries.get(id(entity))
+        return entry[0] if entry else None
+
+    def observers_near(self, position):
+        """
+        Return candidate observers whose vision range could cover a tile.
+
+        Candidates still need an exact range and line-of-sight check; the
+        index only guarantees that no observer able to see the tile is left
+        out.
+
+        :param position: (x, y) tuple of the event tile.
+        :type position: tuple
+        :return: List of (indexed position, entity) pairs.
+        :rtype: list
+        """
+        result = [(self._entries[k][0], e) for k, e in self._unbounded.items()]
+        bucket = self._buckets.get(self._cell_of(*position), {})
+        result.extend((self._entries[k][0], e) for k, e in bucket.items())
+        return result
+
+    def clear(self):
+        """
+        Remove every observer from the index.
+        """
+        self._buckets.clear()
+        self._unbounded.clear()
+        self._entries.clear()
@@ -0,0 +1,326 @@
+import weakref
+from array import array
+from collections.abc import Mapping
+
+from models.tiles.tile_data import TileData, TerrainType, TileTag
+
+_TERRAINS = list(TerrainType)
+_TERRAIN_INDEX = {t: i for i, t in enumerate(_TERRAINS)}
+_TAGS = list(TileTag)
+_TAG_BITS = {t: 1 << i for i, t in enumerate(_TAGS)}
+_DEFAULT_TILE_ID = TileData.tile_id
+
+
+class TileGrid(Mapping):
+    """
+    Compact tile storage with a read-only ``dict``-like facade.
+
+    Terrain, tags and overlay colour of every tile live in typed arrays
+    indexed by (x, y). ``grid[(x, y)]`` builds a :class:`TileData` on
+    demand; its terrain, tag and overlay changes are mirrored back into the
+    arrays. The grid only keeps tiles that hold more than the arrays store
+    (notes, entities, triggers, media, ...). Other tiles are held weakly:
+    the same object is returned while someone references it, and it is
+    released afterwards, so iterating the whole grid does not grow it.
+    """
+
+    def __init__(self, width, height, listener=None):
+        """
+        Initialize a grid of default FLOOR tiles.
+
+        :param width: Width of the grid.
+        :type width: int
+        :param height: Height of the grid.
+        :type height: int
+        :param listener: Optional callable ``listener(tile, name, old, new)``
+            forwarded every field change of a materialized tile.
+        :type listener: callable, optional
+        """
+        self.width = width
+        self.height = height
+        self.listener = listener
+        size = width * height
+        floor = _TERRAIN_INDEX[TerrainType.FLOOR]
+        self._terrain = array("B", [floor]) * size
+        self._tag_bits = array("H", [0]) * size
+        self._overlay = array("H", [0]) * size
+        self._palette = [None]             # overlay colour strings; 0 means no overlay
+        self._palette_index = {None: 0}
+        self._tiles = {}                   # kept (x, y) → TileData with content
+        self._views = weakref.WeakValueDictionary()  # (x, y) → plain TileData in use
+
+    # -- Mapping facade ------------------------------------------------
+
+    def _index(self, pos):
+        """
+        Return the flat array index of `pos`, or raise KeyError.
+
+        :param pos: (x, y) tuple.
+        :type pos: tuple
+        :return: Flat array index.
+        :rtype: int
+        :raises KeyError: If the position is outside the grid.
+        """
+        try:
+            x, y = pos
+        except (TypeError, ValueError):
+            raise KeyError(pos) from None
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError(pos)
+        return x * self.height + y
+
+    def __getitem__(self, pos):
+        tile = self._tiles.get(pos) or self._views.get(pos)
+        if tile is not None:
+            return tile
+        i = self._index(pos)
+        bits = self._tag_bits[i]
+        tile = TileData(
+            position=(pos[0], pos[1]),
+            terrain=_TERRAINS[self._terrain[i]],
+            tags=[t for t in _TAGS if bits & _TAG_BITS[t]],
+            overlay_color=self._palette[self._overlay[i]],
+        )
+        tile._listener = self._on_tile_changed
+        self._views[(pos[0], pos[1])] = tile
+        return tile
+
+    def __setitem__(self, pos, tile):
+        i = self._index(pos)
+        before = (
+            _TERRAINS[self._terrain[i]],
+            frozenset(self.tags_at(*pos)),
+            self._palette[self._overlay[i]],
+        )
+        old_tile = self._tiles.get(pos) or self._views.get(pos)
+        if old_tile is not None and old_tile is not tile:
+            old_tile._listener = None
+        self._keep((pos[0], pos[1]), tile)
+        self._store(i, tile)
+        tile._listener = self._on_tile_changed
+        if self.listener is None:
+            return
+        # report the array-backed fields the replacement changed, as an edit would
+        after = (tile.terrain, frozenset(tile.tags), tile.overlay_color)
+        for name, old, new in zip(("terrain", "tags", "overlay_color"), before, after):
+            if old != new:
+                self.listener(tile, name, old, new)
+
+    def __contains__(self, pos):
+        try:
+            self._index(pos)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for x in range(self.width):
+            for y in range(self.height):
+                yield (x, y)
+
+    def __len__(self):
+        return self.width * self.height
+
+    # -- array access --------------------------------------------------
+
+    def _store(self, i, tile):
+        """
+        Copy the array-backed fields of `tile` into slot `i`.
+
+        :param i: Flat array index.
+        :type i: int
+        :param tile: Tile to copy from.
+        :type tile: TileData
+        """
+        self._terrain[i] = _TERRAIN_INDEX[tile.terrain]
+        bits = 0
+        for tag in tile.tags:
+            bits |= _TAG_BITS[tag]
+        self._tag_bits[i] = bits
+        self._overlay[i] = self._color_index(tile.overlay_color)
+
+    def _color_index(self, color):
+        """
+        Return the palette index of an overlay colour, adding it if new.
+
+        :param color: Colour string or None.
+        :type color: str or None
+        :return: Palette index.
+        :rtype: int
+        """
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = idx
+        return idx
+
+    def terrain_at(self, x, y):
+        """
+        Get the terrain of a tile without materializing it.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: The tile's terrain.
+        :rtype: TerrainType
+        """
+        return _TERRAINS[self._terrain[self._index((x, y))]]
+
+    def has_tag(self, x, y, tag):
+        """
+        Check a tile tag without materializing the tile.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :param tag: Tag to test.
+        :type tag: TileTag
+        :return: True if the tile has the tag.
+        :rtype: bool
+        """
+        return bool(self._tag_bits[self._index((x, y))] & _TAG_BITS[tag])
+
+    def tags_at(self, x, y):
+        """
+        Get the tags of a tile without materializing it.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: List of tags, in TileTag declaration order.
+        :rtype: list
+        """
+        bits = self._tag_bits[self._index((x, y))]
+        return [t for t in _TAGS if bits & _TAG_BITS[t]]
+
+    def overlay_at(self, x, y):
+        """
+        Get the overlay colour of a tile without materializing it.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: Overlay colour string or None.
+        :rtype: str or None
+        """
+        return self._palette[self._overlay[self._index((x, y))]]
+
+    #: Terrain order used by :attr:`terrain_codes`.
+    TERRAINS = tuple(_TERRAINS)
+
+    @property
+    def terrain_codes(self):
+        """
+        Raw per-tile terrain codes in flat (x * height + y) order.
+
+        Code ``i`` stands for ``TileGrid.TERRAINS[i]``. The array is live
+        storage and must not be modified.
+
+        :rtype: array.array
+        """
+        return self._terrain
+
+    @property
+    def tag_bits(self):
+        """
+        Raw per-tile tag bitmasks in flat (x * height + y) order.
+
+        Bit ``tag_bit(tag)`` is set for every tag on the tile. The array is
+        live storage and must not be modified.
+
+        :rtype: array.array
+        """
+        return self._tag_bits
+
+    @staticmethod
+    def tag_bit(tag):
+        """
+        Get the bit used for `tag` in :attr:`tag_bits`.
+
+        :param tag: The tag.
+        :type tag: TileTag
+        :return: Bit value.
+        :rtype: int
+        """
+        return _TAG_BITS[tag]
+
+    def tag_mask(self, tag):
+        """
+        Get a per-tile flag array for `tag`, in flat (x * height + y) order.
+
+        :param tag: Tag to extract.
+        :type tag: TileTag
+        :return: Array of 0/1 bytes of length width * height.
+        :rtype: array.array
+        """
+        bit = _TAG_BITS[tag]
+        return array("B", (1 if b & bit else 0 for b in self._tag_bits))
+
+    # -- materialization -----------------------------------------------
+
+    def _on_tile_changed(self, tile, name, old, new):
+        """
+        Mirror a materialized tile's change into the arrays and forward it.
+
+        :param tile: The tile that changed.
+        :type tile: TileData
+        :param name: Name of the changed field.
+        :type name: str
+        :param old: Previous value.
+        :type old: Any
+        :param new: New value.
+        :type new: Any
+        """
+        if name in ("terrain", "tags", "overlay_color"):
+            self._store(self._index(tile.position), tile)
+        self._keep(tuple(tile.position), tile)
+        if self.listener is not None:
+            self.listener(tile, name, old, new)
+
+    def _keep(self, pos, tile):
+        """
+        Hold `tile` strongly if it has content beyond the arrays, weakly otherwise.
+
+        :param pos: (x, y) tuple of the tile.
+        :type pos: tuple
+        :param tile: Tile stored at `pos`.
+        :type tile: TileData
+        """
+        if self._is_plain(tile):
+            self._tiles.pop(pos, None)
+            self._views[pos] = tile
+        else:
+            self._views.pop(pos, None)
+            self._tiles[pos] = tile
+
+    @property
+    def materialized_count(self):
+        """
+        Number of tiles the grid keeps as full TileData objects.
+
+        Plain tiles that are only in use elsewhere are not counted.
+
+        :rtype: int
+        """
+        return len(self._tiles)
+
+    @staticmethod
+    def _is_plain(tile):
+        """
+        Check whether a tile holds nothing beyond its array-backed fields.
+
+        :param tile: Tile to check.
+        :type tile: TileData
+        :return: True if the tile can be dropped without losing data.
+        :rtype: bool
+        """
+        return not (
+            tile.entities or tile.triggers or tile.note or tile.user_label
+            or tile.last_updated or tile.background_image or tile.ambient_audio
+            or tile.tile_id != _DEFAULT_TILE_ID
+        )
@@ -0,0 +1,193 @@
+from collections import OrderedDict
+from fractions import Fraction
+from math import ceil, floor
+
+import numpy as np
+
+#: Number of fields of view (and boolean masks) a VisibilityCache keeps.
+FOV_CACHE_SIZE = 512
+
+
+def _round_ties_up(n):
+    return floor(n + Fraction(1, 2))
+
+
+def _round_ties_down(n):
+    return ceil(n - Fraction(1, 2))
+
+
+# (row, col) → (dx, dy) for the north, east, south and west quadrants
+_QUADRANTS = (
+    lambda row, col: (col, -row),
+    lambda row, col: (row, col),
+    lambda row, col: (col, row),
+    lambda row, col: (-row, col),
+)
+
+
+def compute_fov(origin, max_range, is_blocking, in_bounds):
+    """
+    Compute the tiles visible from `origin` with symmetric shadowcasting.
+
+    Blocking tiles are themselves visible but hide everything behind them.
+    Tiles further than `max_range` (Manhattan distance) are never visible,
+    matching the range rule used by :meth:`World.can_see`.
+
+    :param origin: (x, y) tuple of the viewpoint.
+    :type origin: tuple
+    :param max_range: Maximum vision range.
+    :type max_range: int
+    :param is_blocking: Callable (x, y) → bool, True if the tile blocks vision.
+    :type is_blocking: callable
+    :param in_bounds: Callable (x, y) → bool, True if the tile exists.
+    :type in_bounds: callable
+    :return: Set of visible (x, y) tuples, including the origin.
+    :rtype: set
+    """
+    ox, oy = origin
+    visible = {origin}
+    if max_range <= 0:
+        return visible
+
+    for transform in _QUADRANTS:
+        def blocked(row, col):
+            dx, dy = transform(row, col)
+            x, y = ox + dx, oy + dy
+            return not in_bounds(x, y) or is_blocking(x, y)
+
+        def reveal(row, col):
+            dx, dy = transform(row, col)
+            x, y = ox + dx, oy + dy
+            if abs(dx) + abs(dy) <= max_range and in_bounds(x, y):
+                visible.add((x, y))
+
+        # each pending row is (depth, start_slope, end_slope)
+        pending = [(1, Fraction(-1), Fraction(1))]
+        while pending:
+            depth, start, end = pending.pop()
+            if depth > max_range:
+                continue
+            prev_blocked = None
+            min_col = _round_ties_up(depth * start)
+            max_col = _round_ties_down(depth * end)
+            for col in range(min_col, max_col + 1):
+                is_wall = blocked(depth, col)
+                if is_wall or (depth * start <= col <= depth * end):
+                    reveal(depth, col)
+                if prev_blocked and not is_wall:
+                    start = Fraction(2 * col - 1, 2 * depth)
+                if prev_blocked is False and is_wall:
+                    pending.append((depth + 1, start, Fraction(2 * col - 1, 2 * depth)))
+                prev_blocked = is_wall
+            if prev_blocked is False:
+                pending.append((depth + 1, start, end))
+    return visible
+
+
+class VisibilityCache:
+    """
+    Caches field-of-view sets keyed by (origin, range).
+
+    Entries are dropped when a vision-blocking tile changes within their
+    range, or when they are the least recently used once the cache holds
+    `max_entries`, so repeated line-of-sight checks in a static area are a
+    set lookup instead of a fresh FOV computation.
+    """
+
+    def __init__(self, is_blocking, in_bounds, shape=None, max_entries=FOV_CACHE_SIZE):
+        """
+        Initialize an empty VisibilityCache.
+
+        :param is_blocking: Callable (x, y) → bool, True if the tile blocks vision.
+        :type is_blocking: callable
+        :param in_bounds: Callable (x, y) → bool, True if the tile exists.
+        :type in_bounds: callable
+        :param shape: (width, height) of the grid, needed for :meth:`visible_mask`.
+        :type shape: tuple, optional
+        :param max_entries: Number of fields of view kept, and separately of masks.
+        :type max_entries: int, optional
+        """
+        self._is_blocking = is_blocking
+        self._in_bounds = in_bounds
+        self.shape = shape
+        self.max_entries = max_entries
+        self._fov = OrderedDict()     # maps ((x, y), range) → set of visible (x, y)
+        self._masks = OrderedDict()   # same keys → read-only boolean array indexed [x, y]
+
+    def __len__(self):
+        return len(self._fov)
+
+    def visible_tiles(self, origin, max_range):
+        """
+        Return the set of tiles visible from `origin` within `max_range`.
+
+        The returned set is shared with the cache and must not be modified.
+
+        :param origin: (x, y) tuple of the viewpoint.
+        :type origin: tuple
+        :param max_range: Maximum vision range.
+        :type max_range: int
+        :return: Set of visible (x, y) tuples.
+        :rtype: set
+        """
+        key = (tuple(origin), max_range)
+        fov = self._fov.get(key)
+        if fov is not None:
+            self._fov.move_to_end(key)
+            return fov
+        fov = compute_fov(key[0], max_range, self._is_blocking, self._in_bounds)
+        self._store(self._fov, key, fov)
+        return fov
+
+    def visible_mask(self, origin, max_range):
+        """
+        Return the field of view of `origin` as a boolean array indexed [x, y].
+
+        :param origin: (x, y) tuple of the viewpoint.
+        :type origin: tuple
+        :param max_range: Maximum vision range.
+        :type max_range: int
+        :return: Read-only boolean array of shape ``self.shape``.
+        :rtype: numpy.ndarray
+        """
+        key = (tuple(origin), max_range)
+        mask = self._masks.get(key)
+        if mask is not None:
+            self._masks.move_to_end(key)
+            return mask
+        mask = np.zeros(self.shape, dtype=bool)
+        fov = [p for p in self.visible_tiles(origin, max_range) if self._in_bounds(*p)]
+        if fov:
+            xs, ys = zip(*fov)
+            mask[list(xs), list(ys)] = True
+        mask.flags.writeable = False
+        self._store(self._masks, key, mask)
+        return mask
+
+    def _store(self, entries, key, value):
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def invalidate_around(self, position):
+        """
+        Drop every cached field of view whose range reaches `position`.
+
+        :param position: (x, y) tuple of the tile whose blocking state changed.
+        :type position: tuple
+        """
+        x, y = position
+        for entries in (self._fov, self._masks):
+            stale = [
+                key for key in entries
+                if abs(key[0][0] - x) + abs(key[0][1] - y) <= key[1]
+            ]
+            for key in stale:
+                del entries[key]
+
+    def clear(self):
+        """
+        Drop every cached field of view.
+        """
+        self._fov.clear()
+        self._masks.clear()
@@ -1,5 +1,9 @@
+import numpy as np
+
 from .world_tile_manager import WorldTileManager
 from .world_lore import WorldLore
+from .visibility import VisibilityCache
+from .pathfinding import PathFinder
 from models.tiles.tile_data import TileData, TileTag
 from core.gameCreation.turn_manager import TurnManager
 
@@ -31,6 +35,14 @@ class World:
         :type weather_conditions: str
         """
         self.tile_manager = WorldTileManager(width, height, tile_type)
+        self.visibility = VisibilityCache(
+            self.tile_manager.blocks_vision,
+            self.tile_manager.is_valid_tile,
+            shape=(width, height),
+        )
+        self.tile_manager.add_tag_observer(self._on_tile_tags_changed)
+        self.pathfinder = PathFinder(self.tile_manager)
+        self.tile_manager.add_tile_observer(self.pathfinder.on_tile_changed)
         self.world_version = world_version
         self.lore = WorldLore(description, map_data, time_of_day, weather_conditions)
         self.turn_manager = TurnManager()
@@ -87,6 +99,37 @@ class World:
         """
         return self.tile_manager.get_adjacent_tiles(x, y)
 
+    def find_path(self, start, goal):
+        """
+        Find the cheapest walkable path between two tiles.
+
+        Respects TileTag.BLOCKS_MOVEMENT and terrain movement costs.
+
+        :param start: (x, y) tuple to start from.
+        :type start: tuple
+        :param goal: (x, y) tuple to reach.
+        :type goal: tuple
+        :return: List of (x, y) tuples from start to goal inclusive, or None if unreachable.
+        :rtype: list or None
+        """
+        return self.pathfinder.find_path(start, goal)
+
+    def movement_range(self, start, budget):
+        """
+        Get every tile reachable from `start` within a movement budget.
+
+        Results are cached per starting tile and reused across turns until
+        a tile within reach changes terrain or movement blocking.
+
+        :param start: (x, y) tuple to start from.
+        :type start: tuple
+        :param budget: Maximum total movement cost.
+        :type budget: int
+        :return: Mapping of reachable (x, y) tuples to their movement cost.
+        :rtype: dict
+        """
+        return self.pathfinder.movement_range(start, budget)
+
     def describe_world(self):
         """
         Get a description of the world.
@@ -123,13 +166,44 @@ class World:
         """
         self.lore.save_to_db(db_conn)
 
+    def _on_tile_tags_changed(self, position, old_tags, new_tags):
+        """
+        Invalidate cached fields of view near a tile whose vision blocking changed.
+
+        :param position: (x, y) tuple of the changed tile.
+        :type position: tuple
+        :param old_tags: Tags before the change.
+        :type old_tags: frozenset
+        :param new_tags: Tags after the change.
+        :type new_tags: frozenset
+        """
+        if (TileTag.BLOCKS_VISION in old_tags) != (TileTag.BLOCKS_VISION in new_tags):
+            self.visibility.invalidate_around(position)
+
+    def visible_tiles(self, from_pos, max_range):
+        """
+        Get every tile visible from `from_pos` within `max_range`.
+
+        The field of view is computed once with symmetric shadowcasting and
+        cached until a vision-blocking tile within range changes.
+
+        :param from_pos: (x, y) tuple of the observer's position.
+        :type from_pos: tuple
+        :param max_range: Maximum vision range.
+        :type max_range: int
+        :return: Set of visible (x, y) tuples. Do not modify it.
+        :rtype: set
+        """
+        return self.visibility.visible_tiles(from_pos, max_range)
+
     def can_see(self, from_pos, to_pos, max_range):
         """
         Determine if an entity at `from_pos` can see a tile at `to_pos`.
 
         Visibility is blocked if:
         - Manhattan distance > max_range
-        - Any intermediate tile has TileTag.BLOCKS_VISION
+        - A tile with TileTag.BLOCKS_VISION shadows `to_pos` in the
+          field of view of `from_pos` (see :meth:`visible_tiles`)
 
         :param from_pos: (x, y) tuple of the observer's position.
         :type from_pos: tuple
@@ -145,15 +219,117 @@ class World:
         dist = abs(dx) + abs(dy)
         if dist > max_range:
             return False
+        if dist <= 1:
+            return True
+
+        return tuple(to_pos) in self.visible_tiles(from_pos, max_range)
+
+
+    def vision_blocking_mask(self):
+        """
+        Get a boolean array of the tiles tagged TileTag.BLOCKS_VISION.
+
+        :return: Boolean array of shape (width, height), indexed [x, y].
+        :rtype: numpy.ndarray
+        """
+        grid = self.tile_manager.tiles
+        bits = np.frombuffer(grid.tag_bits, dtype=np.uint16)
+        bit = grid.tag_bit(TileTag.BLOCKS_VISION)
+        return (bits & bit).astype(bool).reshape(grid.width, grid.height)
+
+    def can_see_many(self, from_pos, targets, max_range):
+        """
+        Batch version of :meth:`can_see` for one viewpoint and many targets.
+
+        :param from_pos: (x, y) tuple of the observer's position.
+        :type from_pos: tuple
+        :param targets: Sequence of (x, y) target positions.
+        :type targets: sequence
+        :param max_range: Maximum vision range, or one range per target.
+        :type max_range: int or sequence
+        :return: Boolean array with one entry per target.
+        :rtype: numpy.ndarray
+        """
+        return self.visibility_matrix([from_pos], targets, max_range, per="target")[0]
+
+    def visibility_matrix(self, sources, targets, max_range, per="source"):
+        """
+        Compute a boolean visibility matrix between observers and targets.
+
+        Entry ``[i, j]`` equals ``can_see(sources[i], targets[j], range)``.
+        Each distinct viewpoint costs one cached field of view; the range
+        checks and lookups for all pairs are vectorized. When there are
+        fewer distinct targets than observers, the fields of view are taken
+        from the targets instead, which is exact because shadowcasting is
+        symmetric between tiles that do not block vision.
+
+        :param sources: Sequence of (x, y) observer positions.
+        :type sources: sequence
+        :param targets: Sequence of (x, y) target positions.
+        :type targets: sequence
+        :param max_range: Maximum vision range, or a sequence of ranges.
+        :type max_range: int or sequence
+        :param per: Whether a range sequence is given per "source" or per "target".
+        :type per: str
+        :return: Boolean array of shape (len(sources), len(targets)).
+        :rtype: numpy.ndarray
+        """
+        src = np.asarray(sources, dtype=np.intp).reshape(-1, 2)
+        tgt = np.asarray(targets, dtype=np.intp).reshape(-1, 2)
+        n, m = len(src), len(tgt)
+        result = np.zeros((n, m), dtype=bool)
+        if n == 0 or m == 0:
+            return result
+
+        ranges = np.asarray(max_range)
+        if ranges.ndim == 0:
+            ranges = np.full((n, m), ranges)
+        elif per == "source":
+            ranges = np.broadcast_to(ranges.reshape(n, 1), (n, m))
+        elif per == "target":
+            ranges = np.broadcast_to(ranges.reshape(1, m), (n, m))
+        else:
+            raise ValueError(f"per must be 'source' or 'target', not {per!r}")
+
+        dist = np.abs(src[:, None, :] - tgt[None, :, :]).sum(axis=2)
+        width, height = self.tile_manager.width, self.tile_manager.height
+        src_ok = (src[:, 0] >= 0) & (src[:, 0] < width) & (src[:, 1] >= 0) & (src[:, 1] < height)
+        tgt_ok = (tgt[:, 0] >= 0) & (tgt[:, 0] < width) & (tgt[:, 1] >= 0) & (tgt[:, 1] < height)
+        candidates = (dist <= ranges) & src_ok[:, None] & tgt_ok[None, :]
+        if not candidates.any():
+            return result
+
+        blocking = self.vision_blocking_mask()
+        src_blocked = np.zeros(n, dtype=bool)
+        src_blocked[src_ok] = blocking[src[src_ok, 0], src[src_ok, 1]]
+        tgt_blocked = np.zeros(m, dtype=bool)
+        tgt_blocked[tgt_ok] = blocking[tgt[tgt_ok, 0], tgt[tgt_ok, 1]]
+
+        unique_src = np.unique(src[src_ok], axis=0)
+        unique_tgt = np.unique(tgt[tgt_ok], axis=0)
+        reverse = len(unique_tgt) < len(unique_src) and not tgt_blocked.any()
+
+        if reverse:
+            # fields of view from the targets, read at the observers
+            forward_rows = src_blocked & candidates.any(axis=1)
+            for tx, ty in unique_tgt:
+                cols = np.flatnonzero((tgt[:, 0] == tx) & (tgt[:, 1] == ty))
+                sub = candidates[:, cols]
+                if not sub.any():
+                    continue
+                mask = self.visibility.visible_mask((int(tx), int(ty)), int(ranges[:, cols][sub].max()))
+                rows = np.flatnonzero(sub.any(axis=1) & ~forward_rows)
+                result[np.ix_(rows, cols)] = sub[rows] & mask[src[rows, 0], src[rows, 1]][:, None]
+        else:
+            forward_rows = candidates.any(axis=1)
 
-        # Bresenham‐style line check for blocking tiles
-        steps = max(abs(dx), abs(dy))
-        for step in range(1, steps):
-            # linear interpolation to find intermediate coords
-            xt = from_pos[0] + round(dx * step / steps)
-            yt = from_pos[1] + round(dy * step / steps)
-            tile = self.tile_manager.tiles[(xt, yt)]
-            if TileTag.BLOCKS_VISION in tile.tags:
-                return False
-
-        return True
+        for sx, sy in unique_src:
+            rows = np.flatnonzero(forward_rows & (src[:, 0] == sx) & (src[:, 1] == sy))
+            if len(rows) == 0:
+                continue
+            sub = candidates[rows]
+            mask = self.visibility.visible_mask((int(sx), int(sy)), int(ranges[rows][sub].max()))
+            hits = np.zeros(m, dtype=bool)
+            hits[tgt_ok] = mask[tgt[tgt_ok, 0], tgt[tgt_ok, 1]]
+            result[rows] = sub & hits[None, :]
+        return result
@@ -1,4 +1,6 @@
-from models.tiles.tile_data import TileData
+from models.tiles.tile_data import TileTag
+from models.world.tile_grid import TileGrid
+from models.world.spatial_index import SpatialIndex
 from core.logger import app_logger
 
 class WorldTileManager:
@@ -20,8 +22,11 @@ class WorldTileManager:
         self.width  = width
         self.height = height
         self.tile_type = tile_type
+        self._tag_observers = []
+        self._tile_observers = []
         self.tiles  = self.generate_tiles()
         self.entities = {}   # maps (x,y) → list of GameEntity
+        self.spatial_index = SpatialIndex(width, height)
 
     def place_entity(self, entity, x, y):
         """
@@ -37,10 +42,72 @@ class WorldTileManager:
         """
         if not self.is_valid_tile(x, y):
             raise ValueError(f"Cannot place {entity.name} at invalid tile ({x},{y})")
+        self._unlist_entity(entity)
         entity.position = (x, y)
         self.entities.setdefault((x, y), []).append(entity)
+        self.spatial_index.insert(entity, (x, y))
         app_logger.info(f"Placed {entity.name} at {entity.position}")
 
+    def _unlist_entity(self, entity):
+        """
+        Remove an entity from the tile it is currently listed on, if any.
+
+        :param entity: The entity to remove.
+        :type entity: GameEntity
+        :return: True if the entity was listed on a tile, False otherwise.
+        :rtype: bool
+        """
+        old_pos = self.spatial_index.position_of(entity)
+        if old_pos is None:
+            return False
+        ents = self.entities.get(old_pos, [])
+        for i, other in enumerate(ents):
+            if other is entity:
+                del ents[i]
+                break
+        if not ents:
+            self.entities.pop(old_pos, None)
+        self.spatial_index.remove(entity)
+        return True
+
+    def remove_entity(self, entity):
+        """
+        Remove an entity from the world grid.
+
+        :param entity: The entity to remove.
+        :type entity: GameEntity
+        """
+        if self._unlist_entity(entity):
+            app_logger.info(f"Removed {entity.name} from {entity.position}")
+
+    def refresh_entity(self, entity):
+        """
+        Re-index a placed entity, e.g. after its ``vision_range`` changed.
+
+        :param entity: The entity to re-index.
+        :type entity: GameEntity
+        """
+        pos = self.spatial_index.position_of(entity)
+        if pos is not None:
+            self.spatial_index.insert(entity, pos)
+
+    def get_observers_near(self, x, y):
+        """
+        Get placed entities whose vision range could cover the specified tile.
+
+        Entities without a ``vision_range`` are always included. The result
+        is a superset of the entities that can actually see the tile; use
+        line-of-sight checks to narrow it down.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: List of ((x, y), entity) pairs, keyed by the tile each entity is listed on.
+        :rtype: list
+        """
+        return self.spatial_index.observers_near((x, y))
+
     def get_entities_at(self, x, y):
         """
         Get a list of entities at the specified tile.
@@ -58,15 +125,67 @@ class WorldTileManager:
         """
         Generate the tiles for the world grid.
 
-        :return: Dictionary mapping (x, y) to TileData.
-        :rtype: dict
+        Tiles are stored compactly in a :class:`TileGrid`; full TileData
+        objects are only kept for tiles with content beyond terrain, tags
+        and overlay.
+
+        :return: Mapping of (x, y) to TileData.
+        :rtype: TileGrid
+        """
+        return TileGrid(self.width, self.height, listener=self._on_tile_changed)
+
+    def add_tag_observer(self, callback):
+        """
+        Register a callback for tile tag changes.
+
+        :param callback: Called as ``callback(position, old_tags, new_tags)`` with frozensets of tags.
+        :type callback: callable
+        """
+        if callback not in self._tag_observers:
+            self._tag_observers.append(callback)
+
+    def add_tile_observer(self, callback):
+        """
+        Register a callback for any field change on a tile.
+
+        :param callback: Called as ``callback(position, name, old, new)``; tag changes carry
+            frozensets, in-place entity and trigger edits tuples.
+        :type callback: callable
+        """
+        if callback not in self._tile_observers:
+            self._tile_observers.append(callback)
+
+    def _on_tile_changed(self, tile, name, old, new):
+        """
+        Listener attached to the tile grid; forwards changes to observers.
+
+        :param tile: The tile that changed.
+        :type tile: TileData
+        :param name: Name of the changed field.
+        :type name: str
+        :param old: Previous value.
+        :type old: Any
+        :param new: New value.
+        :type new: Any
+        """
+        if name == "tags":
+            for callback in self._tag_observers:
+                callback(tile.position, old, new)
+        for callback in self._tile_observers:
+            callback(tile.position, name, old, new)
+
+    def blocks_vision(self, x, y):
+        """
+        Check whether the tile at (x, y) blocks line of sight.
+
+        :param x: X-coordinate of the tile.
+        :type x: int
+        :param y: Y-coordinate of the tile.
+        :type y: int
+        :return: True if the tile has TileTag.BLOCKS_VISION.
+        :rtype: bool
         """
-        tiles = {}
-        for x in range(self.width):
-            for y in range(self.height):
-                td = TileData(position=(x, y))
-                tiles[(x, y)] = td
-        return tiles
+        return self.tiles.has_tag(x, y, TileTag.BLOCKS_VISION)
 
     def get_adjacent_tiles(self, x, y):
         """
@@ -115,6 +234,9 @@ class WorldTileManager:
         :type new_y: int
         """
         if self.is_valid_tile(new_x, new_y):
+            if self._unlist_entity(entity):
+                self.entities.setdefault((new_x, new_y), []).append(entity)
+                self.spatial_index.insert(entity, (new_x, new_y))
             entity.position = (new_x, new_y)
             app_logger.info(f"{entity.name} moved to tile ({new_x}, {new_y})")
         else:
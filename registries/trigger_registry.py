@@ -1,7 +1,11 @@
+import weakref
+
 from registries.condition_registry import ConditionRegistry
 from registries.reaction_registry import ReactionRegistry
 from core.logger import app_logger
 
+_NO_ENTITIES = weakref.WeakValueDictionary()
+
 class TriggerRegistry:
     """
     Registry for managing triggers, their associated functions, and their sources.
@@ -23,6 +27,7 @@ class TriggerRegistry:
         self.reaction_registry = ReactionRegistry()
         self._function_lookup = {}  # func_name → function
         self._source_map = {}  # Trigger → str (e.g., entity name or origin)
+        self._interest = {}  # event_type → {id(entity): entity} of entities with a trigger for it, held weakly
 
     def register_function(self, func, name=None):
         """
@@ -158,5 +163,55 @@ class TriggerRegistry:
         return [t for t in self._triggers if self._source_map.get(t) == source_name]
 
 
+    def add_interest(self, event_type, entity):
+        """
+        Record that an entity has at least one trigger for an event type.
+
+        Parameters
+        ----------
+        event_type : str
+            The event type.
+        entity : object
+            The interested entity. Held weakly and keyed by ``id()``, so
+            unhashable entities such as ``Character`` work too.
+        """
+        self._interest.setdefault(event_type, weakref.WeakValueDictionary())[id(entity)] = entity
+
+    def remove_interest(self, event_type, entity):
+        """
+        Forget that an entity has a trigger for an event type.
+
+        Parameters
+        ----------
+        event_type : str
+            The event type.
+        entity : object
+            The entity.
+        """
+        entities = self._interest.get(event_type)
+        if entities is not None:
+            entities.pop(id(entity), None)
+            if not entities:
+                del self._interest[event_type]
+
+    def interested_entities(self, event_type):
+        """
+        Get the live entities that have a trigger for an event type.
+
+        Parameters
+        ----------
+        event_type : str
+            The event type.
+
+        Returns
+        -------
+        weakref.WeakValueDictionary
+            Maps ``id(entity)`` to each interested entity; empty if there
+            are none. Test membership with ``id(entity) in ...``. Do not
+            modify it.
+        """
+        return self._interest.get(event_type, _NO_ENTITIES)
+
+
 # Create a global instance
 global_trigger_registry = TriggerRegistry()
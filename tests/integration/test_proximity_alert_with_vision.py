@@ -96,3 +96,33 @@ def test_proximity_alert_blocked_by_obstacle(caplog):
 
     assert '[GM ALERT] Trap sprung!' in caplog.text
     assert '[GM ALERT] Guard C alert!' not in caplog.text
+
+
+def test_proximity_alert_reaches_player_characters(caplog):
+    from models.entities.character import Character
+
+    world = World(
+        world_version=1,
+        width=3,
+        height=1,
+        tile_type='square',
+        description='',
+        map_data={},
+        time_of_day='day',
+        weather_conditions='clear'
+    )
+
+    # Character is an eq dataclass, so it is unhashable
+    hero = Character(name='Hero')
+    hero.vision_range = 2
+    hero.register_trigger(
+        Trigger('ON_ENTER', AlwaysTrue(), AlertGamemaster('Hero alert!'))
+    )
+    world.place_entity(hero, 2, 0)
+    bystander = Character(name='Bystander')
+    world.place_entity(bystander, 1, 0)
+
+    with caplog.at_level(logging.DEBUG):
+        EventBus.emit('ON_ENTER', {'position': (0, 0), 'world': world})
+
+    assert '[GM ALERT] Hero alert!' in caplog.text
@@ -174,3 +174,14 @@ def test_update_subclasses(window):
     print("[DEBUG - test_update_subclasses] subclasses:", items)
     assert items == expected
 
+
+
+def test_window_populates_from_preloader(qtbot):
+    from core.rulebook.preloader import RulebookPreloader
+    preloader = RulebookPreloader(api=DummyAPI())
+    wnd = CharacterCreationWindow(preloader=preloader)
+    qtbot.addWidget(wnd)
+    assert wnd.api_handler is preloader.api
+    qtbot.waitUntil(lambda: wnd.char_class_input.count() == 2 and wnd.race_input.count() == 1, timeout=5000)
+    qtbot.waitUntil(lambda: wnd.spells_input.count() == 2, timeout=5000)
+    preloader.shutdown(wait=True)
@@ -62,3 +62,36 @@ def test_reset_clears_all():
 
     inst = EventBus._get_instance()
     assert inst._subscribers == {}
+
+
+def test_spatial_emit_skips_entities_without_matching_trigger(monkeypatch):
+    from models.world.world import World
+    from models.entities.game_entity import GameEntity
+
+    world = World(1, 5, 1, "square", "", {}, "noon", "clear")
+    hits = []
+
+    class Listener:
+        event_type = "NOISE"
+        def check_and_react(self, data):
+            hits.append(data["position"])
+
+    deaf = GameEntity("Deaf", "npc")
+    deaf.vision_range = 4
+    deaf.triggers = [type("Other", (), {"event_type": "OTHER", "check_and_react": lambda s, d: None})()]
+    world.place_entity(deaf, 4, 0)
+    guard = GameEntity("Guard", "npc")
+    guard.vision_range = 4
+    guard.triggers = [Listener()]
+    world.place_entity(guard, 2, 0)
+
+    checked = []
+    real = world.can_see_many
+    def spy(pos, targets, ranges):
+        checked.append(list(targets))
+        return real(pos, targets, ranges)
+    monkeypatch.setattr(world, "can_see_many", spy)
+
+    EventBus.emit("NOISE", {"position": (0, 0), "world": world})
+    assert hits == [(0, 0)]
+    assert checked == [[(2, 0)]]
@@ -0,0 +1,95 @@
+import pytest
+from core.gameCreation.scheduler import TurnScheduler
+from core.gameCreation.turn_manager import TurnManager
+from core.gameCreation import turn_system
+
+
+def test_pop_due_orders_by_turn_then_insertion():
+    s = TurnScheduler()
+    a = s.schedule_at(3, "a")
+    b = s.schedule_at(1, "b")
+    c = s.schedule_at(1, "c")
+    assert s.pop_due(0) == []
+    assert s.pop_due(2) == [b, c]
+    assert s.pop_due(3) == [a]
+    assert len(s) == 0
+    assert s.next_turn_due() is None
+
+def test_cancel_skips_entry_and_purges_heap():
+    s = TurnScheduler()
+    handles = [s.schedule_at(5, i) for i in range(10)]
+    for h in handles[:8]:
+        h.cancel()
+    assert len(s) == 2
+    assert len(s._heap) < 10
+    assert [h.callback for h in s.pop_due(5)] == [8, 9]
+    handles[0].cancel()  # cancelling twice is harmless
+    assert not handles[0].active
+
+def test_recurring_entry_requeues_until_cancelled():
+    s = TurnScheduler()
+    h = s.schedule_at(2, "tick", every=3)
+    fired = [t for t in range(1, 12) if s.pop_due(t)]
+    assert fired == [2, 5, 8, 11]
+    h.cancel()
+    assert s.pop_due(100) == []
+    assert len(s) == 0
+
+def test_recurring_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        TurnScheduler().schedule_at(1, "x", every=0)
+
+def test_turn_manager_fires_on_target_turn():
+    tm = TurnManager()
+    called = []
+    tm.schedule_in(2, called.append, "later")
+    tm.schedule_in(1, called.append, "soon")
+    tm.next_turn()
+    assert called == ["soon"]
+    tm.next_turn()
+    assert called == ["soon", "later"]
+    assert tm.pending == 0
+
+def test_turn_manager_schedule_every_and_cancel_from_callback():
+    tm = TurnManager()
+    ticks = []
+
+    def regen(data):
+        ticks.append(tm.current_turn)
+        if len(ticks) == 3:
+            handle.cancel()
+
+    handle = tm.schedule_every(2, regen)
+    for _ in range(10):
+        tm.next_turn()
+    assert ticks == [2, 4, 6]
+    assert tm.pending == 0
+
+def test_callback_can_cancel_later_entry_due_same_turn():
+    tm = TurnManager()
+    called = []
+    second = None
+    tm.schedule_in(1, lambda d: second.cancel())
+    second = tm.schedule_in(1, called.append, "never")
+    tm.next_turn()
+    assert called == []
+
+def test_turn_system_manager_uses_scheduler():
+    tm = turn_system.TurnManager()
+    called = []
+    h = tm.schedule_in(1, called.append, "a")
+    tm.schedule_in(1, called.append, "b")
+    tm.cancel(h)
+    tm.next_turn()
+    assert called == ["b"]
+
+def test_turn_system_manager_schedule_every_and_pending():
+    tm = turn_system.TurnManager()
+    ticks = []
+    handle = tm.schedule_every(3, lambda data: ticks.append((tm.current_turn, data)), "regen")
+    assert tm.pending == 1
+    for _ in range(7):
+        tm.next_turn()
+    assert ticks == [(3, "regen"), (6, "regen")]
+    handle.cancel()
+    assert tm.pending == 0
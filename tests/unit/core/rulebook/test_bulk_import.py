@@ -0,0 +1,39 @@
+# tests/unit/core/rulebook/test_bulk_import.py
+import pytest
+from core.rulebook.bulk_import import ImportBatch, parse_count, parse_encounter_spec, singular_forms
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("4 goblins, 1 hobgoblin captain", [(4, "goblins"), (1, "hobgoblin captain")]),
+    ("goblin x4; 2x orc and an owlbear", [(4, "goblin"), (2, "orc"), (1, "owlbear")]),
+    ("Ogre (2)\nWolf", [(2, "Ogre"), (1, "Wolf")]),
+    ("", []),
+    (" , ,", []),
+])
+def test_parse_encounter_spec(spec, expected):
+    assert parse_encounter_spec(spec) == expected
+
+
+@pytest.mark.parametrize("entry, expected", [
+    ("2 Wereboar, Human Form", (2, "Wereboar, Human Form")),
+    ("Vampire, Bat Form x3", (3, "Vampire, Bat Form")),
+    ("an owlbear", (1, "owlbear")),
+    ("Goblin", (1, "Goblin")),
+])
+def test_parse_count_never_splits_the_name(entry, expected):
+    assert parse_count(entry) == expected
+
+
+def test_singular_forms():
+    assert singular_forms("goblins") == ["goblin"]
+    assert "wolf" in singular_forms("wolves")
+    assert singular_forms("giant spiders") == ["giant spider"]
+    assert "harpy" in singular_forms("harpies")
+    assert singular_forms("dire wolf") == []
+
+
+def test_import_batch_report():
+    batch = ImportBatch()
+    assert batch.ok and len(batch) == 0
+    batch.errors["nothing"] = "Unknown monster"
+    assert not batch.ok
@@ -1,6 +1,7 @@
 import pytest
 from core.rulebook.entity_importer import EntityImporter
 from core.rulebook.rulebook_entity import RulebookEntity
+from utils.copy_on_write import is_borrowed, own
 
 class DummyAPI:
     def __init__(self):
@@ -91,3 +92,25 @@ def test_get_by_name_returns_none_when_not_found(monkeypatch):
     monkeypatch.setattr(imp.api, "get_raw", lambda endpoint: None)
     entity = imp.get_by_name("Unknown")
     assert entity is None
+
+
+def test_get_by_name_is_memoized_per_data_version(importer):
+    versions = iter([1, 1, 2])
+    importer.api.data_version = lambda category: next(versions)
+    first = importer.get_by_name("Ogre")
+    assert importer.get_by_name("ogre") is first
+    assert importer.get_by_name("Ogre") is not first
+    assert (importer.parse_hits, importer.parse_misses) == (1, 2)
+
+
+def test_game_entities_share_abilities_until_changed(importer):
+    rbe = importer.get_by_name("Ogre")
+    a, b = rbe.to_game_entity(), rbe.to_game_entity()
+    assert a.stats["hp"] == 30 and is_borrowed(a, "stats")
+    own(a, "inventory").append("Roar")
+    own(a, "stats")["hp"] = 1
+    assert a.inventory == ["Charge: Rushes.", "Club: Melee attack.", "Roar"]
+    assert b.inventory == ["Charge: Rushes.", "Club: Melee attack."]
+    assert b.stats["hp"] == 30
+    assert rbe.abilities == ["Charge: Rushes.", "Club: Melee attack."]
+    assert rbe.stats["hp"] == 30
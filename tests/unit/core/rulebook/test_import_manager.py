@@ -1,8 +1,10 @@
 # tests/unit/core/rulebook/test_import_manager.py
 import pytest
+from unittest.mock import MagicMock
 from core.rulebook.import_manager import RulebookImporter
 from models.entities.game_entity import GameEntity
 from models.spell import Spell
+from utils.copy_on_write import own
 
 class DummyEntityWrapper:
     def to_game_entity(self):
@@ -78,3 +80,44 @@ def test_import_spell_success(importer):
 
 def test_import_spell_not_found(importer):
     assert importer.import_spell("Fireball") is None
+
+
+def test_import_encounter_uses_srd_and_reports_errors():
+    rbi = RulebookImporter()
+    batch = rbi.import_encounter("4 goblins, 2 wolves, 1 unknown thing")
+    assert [len(batch.groups[n]) for n in ("goblins", "wolves")] == [4, 2]
+    assert [e.name for e in batch.entities] == ["Goblin"] * 4 + ["Wolf"] * 2
+    assert all(isinstance(e, GameEntity) for e in batch)
+    assert list(batch.errors) == ["unknown thing"]
+    # the copies are independent
+    own(batch.entities[0], "stats")["hp"] = 0
+    assert batch.entities[1].stats["hp"] == 7
+
+
+def test_import_many_parses_each_monster_once():
+    rbi = RulebookImporter()
+    batch = rbi.import_many(["Goblin", "goblin x3", "Orc", "0 orcs"], workers=2)
+    assert len(batch) == 5
+    assert rbi.monsters.parse_misses == 2
+    assert "0 orcs" not in batch.errors and "orcs" in batch.errors
+
+
+def test_import_many_keeps_names_with_commas_whole():
+    rbi = RulebookImporter()
+    batch = rbi.import_many(["2 Wereboar, Human Form", "Vampire, Bat Form x3", (1, "goblin")])
+    assert batch.ok
+    assert [len(batch.groups[n]) for n in ("Wereboar, Human Form", "Vampire, Bat Form", "goblin")] == [2, 3, 1]
+
+
+def test_filter_monsters_uses_stat_table():
+    api = MagicMock()
+    api.streaming = False
+    api.get.return_value = [
+        {"index": "goblin", "name": "Goblin", "armor_class": [{"value": 15}], "hit_points": 7},
+        {"index": "ogre", "name": "Ogre", "armor_class": [{"value": 11}], "hit_points": 59},
+        {"index": "knight", "name": "Knight", "armor_class": [{"value": 18}], "hit_points": 52},
+    ]
+    importer = RulebookImporter(api=api)
+    assert importer.filter_monsters(min_ac=15, sort_by="hp", descending=True) == ["Knight", "Goblin"]
+    assert importer.stat_table is importer.stat_table
+    api.get.assert_called_once_with("monsters")
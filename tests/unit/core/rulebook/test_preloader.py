@@ -0,0 +1,80 @@
+# tests/unit/core/rulebook/test_preloader.py
+import threading
+
+import pytest
+from core.rulebook.preloader import PREFETCH_PROFILES, RulebookPreloader
+
+
+class SlowAPI:
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def get(self, category):
+        self.calls.append(category)
+        self.release.wait(5)
+        if category == "broken":
+            raise ValueError("bad file")
+        return [{"name": category}]
+
+
+@pytest.fixture
+def preloader(qtbot):
+    pre = RulebookPreloader(api=SlowAPI())
+    yield pre
+    pre.api.release.set()
+    pre.shutdown(wait=True)
+
+
+def test_when_loaded_waits_for_every_category(preloader, qtbot):
+    called = []
+    preloader.when_loaded(["monsters", "spells"], lambda: called.append(True))
+    assert not called and not preloader.is_loaded("monsters")
+    with qtbot.waitSignals([preloader.loaded, preloader.loaded], timeout=5000):
+        preloader.api.release.set()
+    qtbot.waitUntil(lambda: called == [True], timeout=5000)
+    assert preloader.is_loaded("spells")
+    # already loaded: runs immediately
+    preloader.when_loaded(["monsters"], lambda: called.append("again"))
+    assert called == [True, "again"]
+
+
+def test_prefetch_loads_each_category_once(preloader, qtbot):
+    first = preloader.prefetch_for("game")
+    again = preloader.prefetch(["monsters"])
+    assert first["monsters"] is again["monsters"]
+    preloader.api.release.set()
+    for future in first.values():
+        future.result(timeout=5)
+    assert sorted(preloader.api.calls) == sorted(PREFETCH_PROFILES["game"])
+
+
+def test_failures_are_reported_and_callbacks_still_run(preloader, qtbot):
+    called = []
+    preloader.when_loaded(["broken"], lambda: called.append(True))
+    with qtbot.waitSignal(preloader.failed, timeout=5000) as blocker:
+        preloader.api.release.set()
+    assert blocker.args == ["broken", "bad file"]
+    qtbot.waitUntil(lambda: called == [True], timeout=5000)
+
+
+def test_callback_errors_are_contained(preloader, qtbot):
+    preloader.api.release.set()
+    preloader.prefetch(["monsters"])["monsters"].result(timeout=5)
+    qtbot.waitUntil(lambda: preloader.is_loaded("monsters"), timeout=5000)
+    preloader.when_loaded(["monsters"], lambda: 1 / 0)  # logged, not raised
+
+
+def test_derived_tables_built_before_loaded(qtbot):
+    class API(SlowAPI):
+        def spell_damage(self):
+            self.calls.append("spell_damage")
+
+    pre = RulebookPreloader(api=API())
+    try:
+        with qtbot.waitSignal(pre.loaded, timeout=5000):
+            pre.prefetch(["spells"])
+            pre.api.release.set()
+        assert pre.api.calls == ["spells", "spell_damage"]
+    finally:
+        pre.shutdown(wait=True)
@@ -0,0 +1,97 @@
+# tests/unit/core/rulebook/test_search.py
+import pytest
+from core.rulebook.search import RulebookSearch, SearchPage
+
+MONSTERS = [
+    {"index": "goblin", "name": "Goblin", "type": "humanoid", "subtype": "goblinoid",
+     "challenge_rating": 0.25, "actions": [{"name": "Scimitar", "desc": "Melee Weapon Attack"}]},
+    {"index": "zombie", "name": "Zombie", "type": "undead", "challenge_rating": 0.25,
+     "special_abilities": [{"name": "Undead Fortitude", "desc": "Refuses to die."}]},
+    {"index": "ghoul", "name": "Ghoul", "type": "undead", "challenge_rating": 1},
+    {"index": "wraith", "name": "Wraith", "type": "undead", "challenge_rating": 5,
+     "actions": [{"name": "Create Specter", "desc": "Targets a humanoid, such as a slain wizard."}]},
+    {"index": "red-dragon-wyrmling", "name": "Red Dragon Wyrmling", "type": "dragon",
+     "challenge_rating": 4, "actions": [{"name": "Fire Breath", "desc": "exhales fire"}]},
+]
+
+SPELLS = [
+    {"index": "fireball", "name": "Fireball", "level": 3, "school": {"name": "Evocation"},
+     "classes": [{"name": "Sorcerer"}, {"name": "Wizard"}], "desc": ["A bright streak of fire."]},
+    {"index": "lightning-bolt", "name": "Lightning Bolt", "level": 3, "school": {"name": "Evocation"},
+     "classes": [{"name": "Sorcerer"}, {"name": "Wizard"}], "desc": ["A stroke of lightning."]},
+    {"index": "fire-bolt", "name": "Fire Bolt", "level": 0, "school": {"name": "Evocation"},
+     "classes": [{"name": "Sorcerer"}, {"name": "Wizard"}], "desc": ["You hurl a mote of fire."]},
+    {"index": "cure-wounds", "name": "Cure Wounds", "level": 1, "school": {"name": "Evocation"},
+     "classes": [{"name": "Cleric"}],
+     "desc": ["A creature you touch regains hit points. This spell has no effect on undead."]},
+]
+
+
+class FakeAPI:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, category):
+        self.calls.append(category)
+        return {"monsters": MONSTERS, "spells": SPELLS}[category]
+
+
+@pytest.fixture
+def engine():
+    return RulebookSearch(FakeAPI())
+
+
+def test_prefix_match_ranks_names_first(engine):
+    page = engine.search("fire", kind="spell")
+    assert isinstance(page, SearchPage)
+    assert set(page.names()) == {"Fireball", "Fire Bolt"}
+    assert engine.search("gob", kind="monster").names() == ["Goblin"]
+
+
+def test_body_text_is_searched(engine):
+    assert engine.search("breath", kind="monster").names() == ["Red Dragon Wyrmling"]
+
+
+def test_typos_are_corrected(engine):
+    assert engine.search("goblni", kind="monster").names() == ["Goblin"]
+
+
+def test_cr_and_type_filters(engine):
+    page = engine.search("CR <= 2 undead", kind="monster")
+    assert page.names() == ["Ghoul", "Zombie"]
+    assert ("cr", "<=", 2.0) in page.filters
+    assert engine.search("cr 1/4", kind="monster").names() == ["Goblin", "Zombie"]
+
+
+def test_school_level_and_class_filters(engine):
+    assert engine.search("evocation level 3 wizard", kind="spell").names() == ["Fireball", "Lightning Bolt"]
+    assert engine.search("cantrip", kind="spell").names() == ["Fire Bolt"]
+    assert engine.search("cleric", kind="spell").names() == ["Cure Wounds"]
+
+
+def test_filters_of_one_kind_do_not_apply_to_the_other(engine):
+    # each kind's filter words stay free text when only the other kind is searched
+    assert engine.search("undead", kind="spell").names() == ["Cure Wounds"]
+    assert engine.search("wizard", kind="monster").names() == ["Wraith"]
+    assert engine.search("undead", kind="monster").names() == ["Ghoul", "Wraith", "Zombie"]
+    assert engine.search("wizard", kind="spell").names() == ["Fire Bolt", "Fireball", "Lightning Bolt"]
+    assert engine.search("undead", kind="spell").names() == ["Cure Wounds"]
+    assert engine.search("wizard", kind="monster").names() == ["Wraith"]
+
+
+def test_paging(engine):
+    first = engine.search("", kind="monster", limit=2)
+    assert first.total == 5 and first.has_more
+    last = engine.search("", kind="monster", limit=2, offset=4)
+    assert len(last.hits) == 1 and not last.has_more
+
+
+def test_searches_both_kinds_and_indexes_once(engine):
+    assert engine.search("fire").total == 3
+    engine.search("fire")
+    assert engine.api.calls == ["monsters", "spells"]
+
+
+def test_unknown_kind(engine):
+    with pytest.raises(ValueError):
+        engine.search("x", kind="item")
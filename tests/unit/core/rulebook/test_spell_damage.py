@@ -0,0 +1,54 @@
+# tests/unit/core/rulebook/test_spell_damage.py
+import pytest
+from core.rulebook.spell_damage import DamageProfile, SpellDamageTable
+
+SPELLS = [
+    {"index": "fireball", "name": "Fireball", "level": 3,
+     "damage": {"damage_type": {"index": "fire"},
+                "damage_at_slot_level": {"3": "8d6", "4": "9d6", "5": "10d6"}}},
+    {"index": "magic-missile", "name": "Magic Missile", "level": 1,
+     "damage": {"damage_type": {"index": "force"},
+                "damage_at_slot_level": {"1": "3d4 + 3", "2": "4d4 + 4"}}},
+    {"index": "fire-bolt", "name": "Fire Bolt", "level": 0,
+     "damage": {"damage_type": {"index": "fire"},
+                "damage_at_character_level": {"1": "1d10", "5": "2d10", "11": "3d10", "17": "4d10"}}},
+    {"index": "cure-wounds", "name": "Cure Wounds", "level": 1},
+    {"index": "broken", "name": "Broken", "level": 1, "damage": {"damage_at_slot_level": {"1": "2d6 +"}}},
+]
+
+
+@pytest.fixture
+def table():
+    return SpellDamageTable(SPELLS)
+
+
+def test_profile_statistics():
+    profile = DamageProfile("2d6 + 1")
+    assert (profile.min, profile.max, profile.mean) == (3, 13, 8)
+    assert profile.probabilities.sum() == pytest.approx(1)
+    assert profile.distribution()[8] == pytest.approx(6 / 36)
+    assert profile.probability_at_least(13) == pytest.approx(1 / 36)
+    assert DamageProfile("1d8 + MOD").mean == 4.5
+
+
+def test_table_skips_spells_without_usable_damage(table):
+    assert len(table) == 3
+    assert "cure-wounds" not in table and "broken" not in table
+    assert table.get("FIREBALL").slug == "fireball"
+
+
+def test_slot_and_character_levels(table):
+    assert table.expected("fireball") == 28
+    assert table.expected("fireball", slot_level=5) == 35
+    assert table.expected("fireball", slot_level=9) == 35
+    assert table.expected("fireball", slot_level=2) is None
+    assert table.expected("fire-bolt", character_level=4) == 5.5
+    assert table.expected("fire-bolt", character_level=11) == 16.5
+
+
+def test_rank_sorts_and_filters(table):
+    names = [s.name for s, _ in table.rank()]
+    assert names == ["Fireball", "Magic Missile", "Fire Bolt"]
+    assert [s.name for s, _ in table.rank(slot_level=2, character_level=17)] == ["Fire Bolt", "Magic Missile"]
+    assert [s.name for s, _ in table.rank(damage_type="fire", max_mean=10)] == ["Fire Bolt"]
+    assert [s.name for s, _ in table.rank(min_mean=10, descending=False)] == ["Magic Missile", "Fireball"]
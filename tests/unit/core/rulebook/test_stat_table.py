@@ -0,0 +1,83 @@
+# tests/unit/core/rulebook/test_stat_table.py
+import numpy as np
+import pytest
+from core.rulebook.stat_table import MonsterStatTable
+
+MONSTERS = [
+    {"index": "goblin", "name": "Goblin", "type": "humanoid", "size": "Small",
+     "armor_class": [{"type": "armor", "value": 15}], "hit_points": 7,
+     "challenge_rating": 0.25, "xp": 50, "strength": 8, "dexterity": 14,
+     "speed": {"walk": "30 ft."}},
+    {"index": "fire-elemental", "name": "Fire Elemental", "type": "elemental", "size": "Large",
+     "armor_class": [{"type": "natural", "value": 13}], "hit_points": 102,
+     "challenge_rating": 5, "xp": 1800, "dexterity": 17,
+     "speed": {"walk": "50 ft."},
+     "damage_immunities": ["fire", "poison"],
+     "damage_resistances": ["bludgeoning, piercing, and slashing from nonmagical weapons"],
+     "condition_immunities": [{"index": "exhaustion"}, {"index": "poisoned"}]},
+    {"index": "red-dragon-wyrmling", "name": "Red Dragon Wyrmling", "type": "dragon", "size": "Medium",
+     "armor_class": [{"type": "natural", "value": 17}], "hit_points": 75,
+     "challenge_rating": 4, "xp": 1100, "strength": 19,
+     "speed": {"walk": "30 ft.", "fly": "60 ft.", "climb": "30 ft."},
+     "damage_immunities": ["fire"]},
+    {"index": "zombie", "name": "Zombie", "type": "undead", "size": "Medium",
+     "armor_class": [{"type": "natural", "value": 8}], "hit_points": 22,
+     "challenge_rating": 0.25, "xp": 50,
+     "damage_immunities": ["poison"], "damage_vulnerabilities": ["radiant"],
+     "condition_immunities": [{"index": "poisoned"}]},
+]
+
+
+@pytest.fixture
+def table():
+    return MonsterStatTable(MONSTERS)
+
+
+def test_columns(table):
+    assert len(table) == 4
+    assert table["ac"].tolist() == [15, 13, 17, 8]
+    assert table["hp"].dtype == np.int32
+    assert table["cr"].tolist() == [0.25, 5, 4, 0.25]
+    assert table["speed_fly"].tolist() == [0, 0, 60, 0]
+    assert table["str"].tolist() == [8, 0, 19, 0]
+
+
+def test_filter_combines_stats_and_bitsets(table):
+    rows = table.filter(min_ac=15, immune="fire")
+    assert table.names(rows) == ["Red Dragon Wyrmling"]
+    assert table.names(table.filter(immune=["fire", "poison"])) == ["Fire Elemental"]
+    assert table.names(table.filter(condition_immune="poisoned", max_cr=1)) == ["Zombie"]
+    assert table.names(table.filter(vulnerable="radiant")) == ["Zombie"]
+    assert table.names(table.filter(type="undead")) == ["Zombie"]
+
+
+def test_qualified_resistances_do_not_set_plain_types(table):
+    assert not table.resistant_to("slashing").any()
+    assert table.names(table.filter(resistant="nonmagical")) == ["Fire Elemental"]
+    # immunity implies resistance
+    assert table.names(table.filter(resistant="fire")) == ["Fire Elemental", "Red Dragon Wyrmling"]
+
+
+def test_sort(table):
+    assert table.names(table.sort("hp", descending=True)) == [
+        "Fire Elemental", "Red Dragon Wyrmling", "Zombie", "Goblin"]
+    rows = table.filter(max_cr=1)
+    assert table.slugs_of(table.sort("ac", rows)) == ["zombie", "goblin"]
+
+
+def test_unknown_criteria(table):
+    with pytest.raises(ValueError):
+        table.filter(min_armor=3)
+    with pytest.raises(ValueError):
+        table.filter(immune="cheese")
+
+
+def test_from_api_uses_full_entries_when_streaming():
+    class StreamingAPI:
+        streaming = True
+
+        def iter_entries(self, category):
+            assert category == "monsters"
+            return iter(MONSTERS)
+
+    assert len(MonsterStatTable.from_api(StreamingAPI())) == 4
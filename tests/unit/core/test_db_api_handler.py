@@ -76,3 +76,60 @@ def test_list_categories(tmp_path):
     cats = h.list_categories()
     assert "spells" in cats
     assert "monsters" in cats
+
+def test_get_raw_uses_index_and_aliases(monkeypatch):
+    sample_data = [
+        {"index": "adult-red-dragon", "name": "Adult Red Dragon"},
+        {"index": "goblin", "name": "Goblin"},
+    ]
+    monkeypatch.setattr(LocalAPIHandler, "_load_file", lambda self, cat: sample_data)
+    h = LocalAPIHandler()
+    assert h.get_raw("/api/monsters/goblin")["name"] == "Goblin"
+    assert h.get_raw("/api/monsters/GOBLIN")["name"] == "Goblin"
+    assert h.get_raw("/api/monsters/Adult Red Dragon")["index"] == "adult-red-dragon"
+    assert h.get_raw("/api/monsters/kobold") is None
+    assert h.index("monsters").resolve("adult red dragon") == "adult-red-dragon"
+
+def test_index_rebuilt_when_category_data_replaced(monkeypatch):
+    data = {"spells": [{"index": "fireball", "name": "Fireball"}]}
+    monkeypatch.setattr(LocalAPIHandler, "_load_file", lambda self, cat: data[cat])
+    h = LocalAPIHandler()
+    first = h.index("spells")
+    assert h.index("spells") is first
+    data["spells"] = [{"index": "shield", "name": "Shield"}]
+    assert h.get_raw("/api/spells/shield")["name"] == "Shield"
+    assert h.get_raw("/api/spells/fireball") is None
+
+def test_get_many_returns_all_requested_keys(monkeypatch):
+    sample_data = [{"index": "goblin", "name": "Goblin"}, {"index": "orc", "name": "Orc"}]
+    monkeypatch.setattr(LocalAPIHandler, "_load_file", lambda self, cat: sample_data)
+    h = LocalAPIHandler()
+    result = h.get_many("monsters", ["orc", "Goblin", "dragon"])
+    assert list(result) == ["orc", "Goblin", "dragon"]
+    assert result["orc"]["name"] == "Orc"
+    assert result["Goblin"]["index"] == "goblin"
+    assert result["dragon"] is None
+
+def test_data_version_tracks_file_changes(tmp_path):
+    path = tmp_path / "5e-SRD-Monsters.json"
+    path.write_text("[]", encoding="utf-8")
+    h = LocalAPIHandler(str(tmp_path))
+    first = h.data_version("monsters")
+    assert first == h.data_version("monsters")
+    path.write_text('[{"index": "goblin"}]', encoding="utf-8")
+    assert h.data_version("monsters") != first
+    assert h.data_version("spells") is None
+
+
+def test_spell_damage_is_cached_per_file_version(tmp_path):
+    path = tmp_path / "5e-SRD-Spells.json"
+    path.write_text(json.dumps([{"index": "fire-bolt", "name": "Fire Bolt", "level": 0,
+                                 "damage": {"damage_at_character_level": {"1": "1d10"}}}]), encoding="utf-8")
+    h = LocalAPIHandler(str(tmp_path))
+    table = h.spell_damage()
+    assert table.expected("Fire Bolt") == 5.5
+    assert h.spell_damage() is table
+    path.write_text("[]", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    h.cache.clear()
+    assert len(h.spell_damage()) == 0
@@ -0,0 +1,46 @@
+from core.map_format import (
+    DEFAULT_TILE, build_map, chunk_keys, chunk_tiles, map_version, put_tile, summarize,
+)
+
+
+def tile(row, col, **fields):
+    return {**DEFAULT_TILE, "tile_id": f"{row}_{col}", "position": (row, col), **fields}
+
+
+def test_only_non_default_tiles_are_stored():
+    data = build_map([tile(r, c) for r in range(20) for c in range(20)] + [tile(17, 3, note="x")], chunk_size=8)
+    assert data["meta"]["rows"] == 20 and data["meta"]["cols"] == 20
+    assert data["chunks"] == {"2,0": [{"position": [17, 3], "note": "x"}]}
+
+
+def test_chunks_load_independently():
+    data = build_map([tile(0, 0, terrain="WALL")], meta={"rows": 10, "cols": 5}, chunk_size=4)
+    assert chunk_keys(data) == ["0,0", "0,1", "1,0", "1,1", "2,0", "2,1"]
+    first = chunk_tiles(data, "0,0")
+    assert len(first) == 16 and first[0]["terrain"] == "WALL" and first[1]["terrain"] == "FLOOR"
+    # edge chunk is clipped to the grid
+    assert [t["position"] for t in chunk_tiles(data, "2,1")] == [[8, 4], [9, 4]]
+    # tiles do not share containers
+    first[1]["tags"].append("TRAP_ZONE")
+    assert chunk_tiles(data, "0,0")[1]["tags"] == []
+
+
+def test_put_tile_replaces_and_removes_defaults():
+    data = build_map([], meta={"rows": 2, "cols": 2})
+    put_tile(data, tile(1, 1, note="a"))
+    put_tile(data, tile(1, 1, note="b"))
+    assert data["chunks"] == {"0,0": [{"position": [1, 1], "note": "b"}]}
+    put_tile(data, tile(1, 1))
+    assert data["chunks"] == {}
+    put_tile(data, tile(4, 0, tile_id="custom"))
+    assert data["meta"]["rows"] == 5
+    assert data["chunks"]["0,0"] == [{"position": [4, 0], "tile_id": "custom"}]
+
+
+def test_versions_and_summary():
+    assert map_version({"version": "1.0"}) == 1 and map_version({}) == 0
+    data = build_map([tile(0, 0, triggers=[{}, {}]), tile(1, 2, entities=[{}])], meta={"rows": 3, "cols": 3})
+    data["entities"] = [{}]
+    assert summarize(data) == {"tiles": 9, "triggers": 2, "entities": 2}
+    v1 = {"version": "1.0", "tiles": [{"triggers": [1]}, {"entities": [{}]}]}
+    assert summarize(v1) == {"tiles": 2, "triggers": 1, "entities": 1}
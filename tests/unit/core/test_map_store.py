@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+import core.map_store
+from core.map_format import build_map, iter_tiles, stored_tiles
+from core.map_store import MapStore, journal_path, load_map
+
+
+def tile(row, col, note=None):
+    return {"tile_id": f"{row}_{col}", "position": [row, col], "terrain": "FLOOR", "note": note}
+
+
+def notes(data):
+    return {tuple(t["position"]): t["note"] for t in iter_tiles(data)}
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = MapStore(tmp_path / "map.json")
+    s.write_full(build_map([tile(0, 0), tile(0, 1)]))
+    return s
+
+
+def test_append_is_replayed_on_load(store):
+    store.append([tile(0, 1, "changed"), tile(2, 2, "new")])
+    store.append([tile(0, 1, "changed again")])
+    data = load_map(store.path)
+    assert notes(data)[(0, 1)] == "changed again"
+    assert notes(data)[(2, 2)] == "new"
+    assert notes(data)[(0, 0)] is None
+    # the base file itself is untouched
+    assert list(stored_tiles(json.loads(store.path.read_text()))) == []
+
+
+def test_full_write_drops_journal(store):
+    store.append([tile(0, 0, "x")])
+    store.write_full(build_map([tile(0, 0)]))
+    assert not journal_path(store.path).exists()
+    assert notes(load_map(store.path)) == {(0, 0): None}
+
+
+def test_journal_of_other_generation_and_torn_line_ignored(store):
+    store.append([tile(0, 0, "kept")])
+    with open(store.journal, "a", encoding="utf-8") as f:
+        f.write('{"position": [0, 0], "note": "tor')
+    assert notes(load_map(store.path))[(0, 0)] == "kept"
+    # a map replaced behind our back does not pick up the old journal
+    replaced = build_map([tile(0, 0)], meta={"generation": "other"})
+    store.path.write_text(json.dumps(replaced))
+    assert notes(load_map(store.path))[(0, 0)] is None
+
+
+def test_version_1_file_is_migrated_on_load(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"version": "1.0", "meta": {"author": "A"},
+                                "tiles": [tile(0, 0), tile(1, 1, "hi")]}))
+    store = MapStore(path)
+    data = store.load()
+    assert data["version"] == 2 and data["meta"]["author"] == "A"
+    assert notes(data) == {(0, 0): None, (0, 1): None, (1, 0): None, (1, 1): "hi"}
+    # not written by a MapStore: the next save must be a full one
+    assert not store.can_append
+
+
+def test_compaction_folds_journal_and_keeps_later_appends(store, monkeypatch):
+    store.append([tile(0, 0, "a")])
+    assert not store.needs_compaction()
+    monkeypatch.setattr(core.map_store, "MIN_COMPACT_RECORDS", 0)
+    assert store.needs_compaction()
+
+    # an append landing while the merged map is being serialized
+    real_dumps = json.dumps
+
+    def dumps(obj, *args, **kwargs):
+        if kwargs.get("indent"):
+            monkeypatch.setattr(core.map_store.json, "dumps", real_dumps)
+            store.append([tile(0, 1, "late")])
+        return real_dumps(obj, *args, **kwargs)
+
+    monkeypatch.setattr(core.map_store.json, "dumps", dumps)
+    store.compact_async().join(5)
+    assert notes(json.loads(store.path.read_text()))[(0, 0)] == "a"
+    assert store.journal_records == 1
+    assert notes(load_map(store.path)) == {(0, 0): "a", (0, 1): "late"}
+
+
+def test_crash_before_journal_rewrite_keeps_every_record(store, monkeypatch):
+    store.append([tile(0, 0, "a"), tile(0, 1, "b")])
+    real_dumps = json.dumps
+
+    def dumps(obj, *args, **kwargs):
+        if kwargs.get("indent"):
+            monkeypatch.setattr(core.map_store.json, "dumps", real_dumps)
+            store.append([tile(0, 0, "late")])
+        return real_dumps(obj, *args, **kwargs)
+
+    real_write = core.map_store._write_atomic
+
+    def write(path, text):
+        if path == store.journal:
+            raise OSError("crash")
+        real_write(path, text)
+
+    monkeypatch.setattr(core.map_store.json, "dumps", dumps)
+    monkeypatch.setattr(core.map_store, "_write_atomic", write)
+    with pytest.raises(OSError):
+        store.compact()
+    monkeypatch.setattr(core.map_store, "_write_atomic", real_write)
+    # the base moved on but the old journal still applies on top of it
+    assert notes(json.loads(store.path.read_text()))[(0, 0)] == "a"
+    reopened = MapStore(store.path)
+    assert notes(reopened.load()) == {(0, 0): "late", (0, 1): "b"}
+    reopened.append([tile(0, 1, "after")])
+    reopened.compact()
+    assert notes(load_map(store.path)) == {(0, 0): "late", (0, 1): "after"}
+    assert not journal_path(store.path).exists()
+
+
+def test_append_needs_a_base(tmp_path):
+    with pytest.raises(RuntimeError):
+        MapStore(tmp_path / "missing.json").append([tile(0, 0)])
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from core.map_format import build_map, iter_tiles
+from core.map_store import MapStore, journal_path, load_map
+from core.save_worker import MapSaveWorker, MapSnapshot
+
+
+def tile(row, col, note=None):
+    return {"tile_id": f"{row}_{col}", "position": [row, col], "terrain": "FLOOR", "note": note}
+
+
+def notes(path):
+    return {tuple(t["position"]): t["note"] for t in iter_tiles(load_map(path))}
+
+
+class GateBackups:
+    """Backup manager that holds the writer thread until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def backup_map(self, path):
+        self.calls.append(path)
+        self.started.set()
+        assert self.release.wait(5)
+
+
+@pytest.fixture
+def worker(qapp):
+    w = MapSaveWorker()
+    yield w
+    w.shutdown()
+
+
+def test_full_save_is_written_and_reported(qtbot, worker, tmp_path):
+    path = tmp_path / "map.json"
+    store = MapStore(path)
+    with qtbot.waitSignal(worker.saved, timeout=5000) as blocker:
+        worker.submit(MapSnapshot(path, store, [tile(0, 0, "a"), tile(1, 1)], meta={"author": "A"}))
+    assert blocker.args == [str(path)]
+    assert notes(path) == {(0, 0): "a", (0, 1): None, (1, 0): None, (1, 1): None}
+    assert store.can_append
+    assert worker.flush(5)
+    assert not worker.busy
+    # no temp files are left next to the map
+    assert [p.name for p in tmp_path.iterdir()] == ["map.json"]
+
+
+def test_saves_waiting_for_the_same_file_are_merged(qapp, tmp_path):
+    path = tmp_path / "map.json"
+    store = MapStore(path)
+    store.write_full(build_map([tile(0, 0), tile(0, 1)]))
+    backups = GateBackups()
+    worker = MapSaveWorker(backups)
+    saved = []
+    worker.saved.connect(saved.append)
+
+    assert worker.submit(MapSnapshot(path, store, [tile(0, 0, "first")], full=False)) is False
+    assert backups.started.wait(5)      # the first one is being written
+    assert worker.submit(MapSnapshot(path, store, [tile(0, 1, "second")], full=False)) is False
+    assert worker.submit(MapSnapshot(path, store, [tile(0, 1, "third")], full=False)) is True
+    assert worker.submit(MapSnapshot(path, store, [tile(0, 0, "fourth")], full=False)) is True
+    backups.release.set()
+    assert worker.flush(5)
+    worker.shutdown()
+
+    assert len(backups.calls) == 2
+    assert notes(path) == {(0, 0): "fourth", (0, 1): "third"}
+    # one journal header plus the first save's line and the merged save's two
+    assert len(journal_path(path).read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_full_snapshot_replaces_a_waiting_append(qapp, tmp_path):
+    waiting = MapSnapshot("m.json", None, [tile(0, 0, "old")], full=False)
+    waiting.merge(MapSnapshot("m.json", "store", [tile(0, 1, "full")], meta={"author": "A"}))
+    assert waiting.full and waiting.store == "store" and waiting.meta == {"author": "A"}
+    assert list(waiting.tiles) == [(0, 1)]
+    waiting.merge(MapSnapshot("m.json", None, [tile(0, 0, "later")], full=False))
+    assert waiting.full and waiting.tiles[(0, 0)]["note"] == "later"
+
+
+def test_failure_is_reported(qtbot, worker, tmp_path):
+    path = tmp_path / "missing.json"
+    with qtbot.waitSignal(worker.failed, timeout=5000) as blocker:
+        worker.submit(MapSnapshot(path, MapStore(path), [tile(0, 0)], full=False))
+    assert blocker.args[0] == str(path)
+    assert "No base map" in blocker.args[1]
+
+
+def test_journaled_saves_are_refused_after_a_failure(qapp, tmp_path, monkeypatch):
+    path = tmp_path / "map.json"
+    store = MapStore(path)
+    store.write_full(build_map([tile(0, 0)]))
+    worker = MapSaveWorker()
+
+    def broken_append(tiles):
+        raise OSError("disk full")
+    monkeypatch.setattr(store, "append", broken_append)
+    worker.submit(MapSnapshot(path, store, [tile(0, 0, "lost")], full=False))
+    assert worker.flush(5)
+    assert worker.needs_full_save(path)
+    monkeypatch.undo()
+
+    # a later journaled save cannot leave the failed tile out silently
+    worker.submit(MapSnapshot(path, store, [tile(0, 1, "later")], full=False))
+    assert worker.flush(5)
+    assert worker.needs_full_save(str(path))
+    worker.submit(MapSnapshot(path, store, [tile(0, 0, "lost"), tile(0, 1, "later")]))
+    assert worker.flush(5)
+    worker.shutdown()
+    assert not worker.needs_full_save(path)
+    assert notes(path) == {(0, 0): "lost", (0, 1): "later"}
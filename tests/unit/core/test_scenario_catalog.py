@@ -0,0 +1,140 @@
+import json
+import os
+
+import pytest
+from PyQt5.QtGui import QImage
+
+import core.scenario_catalog
+from core.map_format import build_map
+from core.map_store import MapStore
+from core.scenario_catalog import ScenarioCatalog, make_thumbnail
+
+
+def write_scenario(workspace, name, tiles=(), **meta):
+    folder = workspace / name
+    folder.mkdir(parents=True, exist_ok=True)
+    meta.setdefault("author", "Ann")
+    data = build_map(list(tiles), meta=meta)
+    data["entities"] = [{"name": "chest"}]
+    (folder / "map.json").write_text(json.dumps(data), encoding="utf-8")
+    return folder / "map.json"
+
+
+def age(path, seconds=10):
+    # push modification times out of the window the catalog does not trust
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    c = ScenarioCatalog(tmp_path / "workspace")
+    yield c
+    c.close()
+
+
+def test_indexes_new_scenarios(catalog):
+    write_scenario(catalog.workspace, "Keep", [{"position": [1, 1], "triggers": [{}], "overlay_color": "#FF0000"}],
+                   rows=4, cols=5, created="today", grid_type="hex")
+    (catalog.workspace / "not_a_scenario").mkdir()
+    assert catalog.names() == ["Keep"]
+    entry = catalog.get("Keep")
+    assert entry["author"] == "Ann" and entry["created"] == "today" and entry["grid_type"] == "hex"
+    assert (entry["rows"], entry["cols"]) == (4, 5)
+    assert (entry["tiles"], entry["triggers"], entry["entities"]) == (20, 1, 1)
+    image = QImage.fromData(entry["thumbnail"], "PNG")
+    assert (image.width(), image.height()) == (5, 4)
+    assert image.pixelColor(1, 1).name() == "#ff0000"
+
+
+def test_unchanged_maps_are_not_parsed_again(catalog, monkeypatch):
+    map_path = write_scenario(catalog.workspace, "A", rows=2, cols=2)
+    age(map_path)
+    age(catalog.workspace)
+    catalog.names()
+    catalog.get("A")
+    catalog.record(map_path, {"tiles": 4, "triggers": 0, "entities": 0, "rows": 2, "cols": 2})
+    age(map_path)
+    age(catalog.workspace)
+    catalog.names()
+    monkeypatch.setattr(catalog, "index", lambda name: pytest.fail("parsed again"))
+    monkeypatch.setattr(catalog, "_rescan", lambda stamp: pytest.fail("scanned again"))
+    assert catalog.names() == ["A"]
+    assert catalog.get("A")["tiles"] == 4
+
+
+def test_changed_map_is_indexed_again(catalog):
+    map_path = write_scenario(catalog.workspace, "A", rows=2, cols=2)
+    assert catalog.get("A")["tiles"] == 4
+    write_scenario(catalog.workspace, "A", rows=3, cols=3)
+    assert catalog.get("A")["tiles"] == 9
+
+
+def test_journal_changes_are_seen(catalog):
+    map_path = write_scenario(catalog.workspace, "A", rows=2, cols=2)
+    store = MapStore(map_path)
+    store.load()
+    store.write_full(store.load())
+    assert catalog.get("A")["triggers"] == 0
+    store.append([{"position": [0, 0], "triggers": [{}, {}]}])
+    assert catalog.get("A")["triggers"] == 2
+
+
+def test_removed_scenarios_are_dropped(catalog):
+    import shutil
+    write_scenario(catalog.workspace, "A")
+    write_scenario(catalog.workspace, "B")
+    assert catalog.names() == ["A", "B"]
+    shutil.rmtree(catalog.workspace / "A")
+    assert catalog.names() == ["B"]
+    assert catalog.get("A") is None
+
+
+def test_broken_map_is_listed_and_get_raises(catalog):
+    folder = catalog.workspace / "Bad"
+    folder.mkdir()
+    (folder / "map.json").write_text("{not json", encoding="utf-8")
+    assert catalog.names() == ["Bad"]
+    with pytest.raises(json.JSONDecodeError):
+        catalog.get("Bad")
+
+
+def test_record_updates_counts_and_keeps_meta(catalog):
+    map_path = write_scenario(catalog.workspace, "A", rows=2, cols=2, created="then")
+    catalog.get("A")
+    catalog.record(map_path, {"tiles": 4, "triggers": 3, "entities": 0, "rows": 2, "cols": 2},
+                   thumbnail=b"png")
+    entry = catalog.get("A")
+    assert entry["triggers"] == 3 and entry["thumbnail"] == b"png"
+    assert entry["author"] == "Ann" and entry["created"] == "then"
+
+
+def test_for_map_needs_a_workspace_catalog(catalog, tmp_path):
+    map_path = write_scenario(catalog.workspace, "A")
+    other = tmp_path / "elsewhere" / "A" / "map.json"
+    other.parent.mkdir(parents=True)
+    other.write_text("{}", encoding="utf-8")
+    found = ScenarioCatalog.for_map(map_path)
+    assert found is not None and found.workspace == catalog.workspace
+    found.close()
+    assert ScenarioCatalog.for_map(other) is None
+    assert ScenarioCatalog.for_map(catalog.workspace / "A" / "temp.json") is None
+
+
+def test_old_catalog_format_is_rebuilt(tmp_path, monkeypatch):
+    workspace = tmp_path / "workspace"
+    write_scenario(workspace, "A")
+    ScenarioCatalog(workspace).names()
+    monkeypatch.setattr(core.scenario_catalog, "CATALOG_FORMAT_VERSION", 99)
+    c = ScenarioCatalog(workspace)
+    assert c._conn.execute("SELECT COUNT(*) FROM scenarios").fetchone()[0] == 0
+    assert c.names() == ["A"]
+    c.close()
+
+
+def test_thumbnail_is_sampled_down():
+    image = QImage.fromData(make_thumbnail({(0, 0): "#00FF00"}, 500, 250), "PNG")
+    assert (image.width(), image.height()) == (64, 128)
+    assert image.pixelColor(0, 0).name() == "#00ff00"
+    assert image.pixelColor(10, 10).name() == "#cccccc"
+    assert make_thumbnail({}, 0, 0) is None
@@ -0,0 +1,84 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from core.db_api_handler import APIError, LocalAPIHandler
+from core.srd_cache import CACHE_FORMAT_VERSION, SRDCache, build_cache
+
+MONSTERS = [
+    {"index": "goblin", "name": "Goblin", "hit_points": 7},
+    {"index": "adult-red-dragon", "name": "Adult Red Dragon", "hit_points": 256},
+]
+
+
+@pytest.fixture
+def srd(tmp_path):
+    base = tmp_path / "rulebook_json"
+    base.mkdir()
+    (base / "5e-SRD-Monsters.json").write_text(json.dumps(MONSTERS), encoding="utf-8")
+    (base / "5e-SRD-Rules.json").write_text(json.dumps({"name": "Rules"}), encoding="utf-8")
+    return base, tmp_path / "cache" / "srd.sqlite"
+
+def test_build_and_lookup(srd):
+    base, cache_path = srd
+    assert build_cache(str(base), str(cache_path)) == ["monsters", "rules"]
+    assert build_cache(str(base), str(cache_path)) == []
+    cache = SRDCache(str(cache_path))
+    path = base / "5e-SRD-Monsters.json"
+    assert cache.lookup("monsters", path, "goblin")["hit_points"] == 7
+    assert cache.lookup("monsters", path, "Adult Red Dragon")["index"] == "adult-red-dragon"
+    assert cache.lookup("monsters", path, "kobold") is None
+    assert cache.load_category("monsters", path) == MONSTERS
+    assert cache.load_category("rules", base / "5e-SRD-Rules.json") == {"name": "Rules"}
+    cache.close()
+
+def test_touched_file_with_same_content_is_not_recompiled(srd):
+    base, cache_path = srd
+    build_cache(str(base), str(cache_path))
+    path = base / "5e-SRD-Monsters.json"
+    os.utime(path, ns=(1, 1))
+    assert build_cache(str(base), str(cache_path)) == []
+
+def test_changed_file_is_recompiled(srd):
+    base, cache_path = srd
+    build_cache(str(base), str(cache_path))
+    path = base / "5e-SRD-Monsters.json"
+    path.write_text(json.dumps(MONSTERS[:1]), encoding="utf-8")
+    cache = SRDCache(str(cache_path))
+    assert cache.ensure_fresh("monsters", path) is True
+    assert cache.lookup("monsters", path, "adult-red-dragon") is None
+    cache.close()
+
+def test_other_format_version_is_discarded(srd):
+    base, cache_path = srd
+    build_cache(str(base), str(cache_path))
+    conn = sqlite3.connect(str(cache_path))
+    with conn:
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'format_version'", (str(CACHE_FORMAT_VERSION + 1),))
+    conn.close()
+    cache = SRDCache(str(cache_path))
+    assert cache.categories() == []
+    cache.close()
+
+def test_invalid_json_raises_api_error(srd):
+    base, cache_path = srd
+    (base / "5e-SRD-Monsters.json").write_text("{not json", encoding="utf-8")
+    cache = SRDCache(str(cache_path))
+    with pytest.raises(APIError):
+        cache.ensure_fresh("monsters", base / "5e-SRD-Monsters.json")
+    cache.close()
+
+def test_handler_reads_through_cache(srd):
+    base, cache_path = srd
+    h = LocalAPIHandler(str(base), cache_path=str(cache_path))
+    assert h.store is not None
+    assert h.get_raw("/api/monsters/goblin")["name"] == "Goblin"
+    assert "monsters" not in h.cache      # single lookup did not load the category
+    assert h.get("monsters") == MONSTERS
+    assert h.get_many("monsters", ["goblin"])["goblin"]["hit_points"] == 7
+
+def test_handler_without_cache_by_default(srd):
+    base, _ = srd
+    assert LocalAPIHandler(str(base)).store is None
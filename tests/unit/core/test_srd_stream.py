@@ -0,0 +1,109 @@
+import codecs
+import json
+import os
+
+import pytest
+
+from core.db_api_handler import LocalAPIHandler
+from core.srd_stream import EntryLRU, NotAnArrayError, StreamedCategory, iter_json_array
+
+MONSTERS = [
+    {"index": "goblin", "name": "Goblin", "type": "humanoid", "hit_points": 7,
+     "actions": [{"name": "Scimitar", "desc": "Melee Weapon Attack: +4 to hit"}]},
+    {"index": "nothic", "name": "Nöthic", "type": "aberration", "hit_points": 45,
+     "desc": "Ünïcode " * 50},
+    {"index": "adult-red-dragon", "name": "Adult Red Dragon", "type": "dragon", "hit_points": 256,
+     "challenge_rating": 17.5e0},
+]
+
+
+@pytest.fixture
+def srd(tmp_path):
+    base = tmp_path / "rulebook_json"
+    base.mkdir()
+    (base / "5e-SRD-Monsters.json").write_text(json.dumps(MONSTERS, indent=2, ensure_ascii=False), encoding="utf-8")
+    (base / "5e-SRD-Rules.json").write_text(json.dumps({"name": "Rules"}), encoding="utf-8")
+    return base
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 16])
+def test_iter_json_array_offsets(srd, chunk_size):
+    path = srd / "5e-SRD-Monsters.json"
+    raw = path.read_bytes()
+    items = list(iter_json_array(path, chunk_size=chunk_size))
+    assert [e for _, _, e in items] == MONSTERS
+    for offset, length, entry in items:
+        assert json.loads(raw[offset:offset + length]) == entry
+
+
+def test_iter_json_array_bom_numbers_and_empty(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_bytes(codecs.BOM_UTF8 + b"[12345678, {\"a\": \"\xc3\xa9\"}, 3]")
+    items = list(iter_json_array(path, chunk_size=3))
+    assert [e for _, _, e in items] == [12345678, {"a": "é"}, 3]
+    assert json.loads(path.read_bytes()[items[1][0]:items[1][0] + items[1][1]]) == {"a": "é"}
+    path.write_text(" [ ] ")
+    assert list(iter_json_array(path)) == []
+    path.write_text("{}")
+    with pytest.raises(NotAnArrayError):
+        list(iter_json_array(path))
+    path.write_text("[1, 2")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(path))
+
+
+def test_entry_lru_evicts_by_size():
+    lru = EntryLRU(max_bytes=10)
+    lru.put("a", 1, 4)
+    lru.put("b", 2, 4)
+    assert lru.get("a") == 1
+    lru.put("c", 3, 4)          # evicts "b", the least recently used
+    assert lru.get("b") is None
+    assert lru.get("c") == 3
+    stats = lru.stats()
+    assert (stats["entries"], stats["bytes"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 8, 2, 1, 1)
+    lru.put("huge", 4, 100)     # the newest entry always stays
+    assert len(lru) == 1 and lru.get("huge") == 4
+
+
+def test_streamed_category_keeps_summaries(srd):
+    stream = StreamedCategory(srd / "5e-SRD-Monsters.json", EntryLRU())
+    assert len(stream) == 3
+    assert stream.summaries[0] == {"index": "goblin", "name": "Goblin", "type": "humanoid"}
+    assert stream.lookup("Nöthic") == MONSTERS[1]
+    assert stream.lookup("kobold") is None
+    assert list(stream.iter_entries()) == MONSTERS
+
+
+def test_streamed_category_rescans_changed_file(srd):
+    path = srd / "5e-SRD-Monsters.json"
+    stream = StreamedCategory(path, EntryLRU())
+    assert stream.lookup("goblin")["hit_points"] == 7
+    path.write_text(json.dumps([dict(MONSTERS[0], hit_points=12)]), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert stream.lookup("goblin")["hit_points"] == 12
+    assert stream.lookup("adult-red-dragon") is None
+
+
+def test_handler_streaming_mode(srd):
+    handler = LocalAPIHandler(str(srd), streaming=True, entry_cache_bytes=1)
+    names = [m["name"] for m in handler.get("monsters")]
+    assert names == ["Goblin", "Nöthic", "Adult Red Dragon"]
+    assert "hit_points" not in handler.get("monsters")[0]
+    assert handler.get_monster("Goblin") == MONSTERS[0]
+    assert handler.get_raw("/api/monsters/adult-red-dragon") == MONSTERS[2]
+    assert handler.get_many("monsters", ["goblin", "kobold"]) == {"goblin": MONSTERS[0], "kobold": None}
+    assert list(handler.iter_entries("monsters")) == MONSTERS
+    assert handler.index("monsters").resolve("Adult Red Dragon") == "adult-red-dragon"
+    stats = handler.entry_cache_stats()
+    assert stats["entries"] == 1 and stats["evictions"] >= 1
+    assert "monsters" not in handler.cache
+    # non-array files are loaded as usual
+    assert handler.get("rules") == {"name": "Rules"}
+
+
+def test_handler_without_streaming_has_no_stats(srd):
+    handler = LocalAPIHandler(str(srd))
+    assert handler.entry_cache_stats() is None
+    assert list(handler.iter_entries("monsters")) == MONSTERS
+    assert list(handler.iter_entries("rules")) == [{"name": "Rules"}]
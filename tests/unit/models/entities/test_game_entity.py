@@ -123,3 +123,69 @@ def test_from_dict(monkeypatch):
     assert isinstance(trig, DummyTrigger)
     assert trig.event_type == "ev"
     assert trig.label == "lbl"
+
+def test_dispatch_table_follows_trigger_list_changes():
+    ge = GameEntity("Sentinel", "npc")
+    t1 = DummyTrigger("ON_ENTER", "t1")
+    t2 = DummyTrigger("ON_DAMAGE", "t2")
+    ge.triggers.append(t1)
+    assert ge.has_trigger_for("ON_ENTER")
+    assert not ge.has_trigger_for("ON_DAMAGE")
+    ge.triggers[0] = t2
+    assert not ge.has_trigger_for("ON_ENTER")
+    ge.handle_event("ON_DAMAGE", {"hp": 3})
+    assert t2.checked == [{"hp": 3}]
+    ge.triggers.clear()
+    assert not ge.has_trigger_for("ON_DAMAGE")
+
+def test_trigger_list_edits_update_the_dispatch_table_incrementally(monkeypatch):
+    ge = GameEntity("Sentinel", "npc")
+    rebuilds = []
+    monkeypatch.setattr(ge, "reindex_triggers", lambda: rebuilds.append(1))
+    triggers = [DummyTrigger("EVT_%d" % (i % 3), "t%d" % i) for i in range(9)]
+    for t in triggers:
+        ge.triggers.append(t)
+    ge.triggers.extend([DummyTrigger("EVT_0", "extra")])
+    ge.triggers.remove(triggers[0])
+    del ge.triggers[0]
+    ge.triggers.pop()
+    assert rebuilds == []
+    assert [t.label for t in ge._triggers_by_event["EVT_0"]] == ["t3", "t6"]
+    assert [t.label for t in ge._triggers_by_event["EVT_1"]] == ["t4", "t7"]
+    ge.triggers.insert(0, triggers[0])
+    assert rebuilds == [1]
+
+
+def test_global_interest_index():
+    reg = ge_mod.global_trigger_registry
+    ge = GameEntity("Watcher", "npc")
+    ge.triggers = [DummyTrigger("WATCH_EVT", "w")]
+    assert reg.interested_entities("WATCH_EVT")[id(ge)] is ge
+    ge.triggers = []
+    assert id(ge) not in reg.interested_entities("WATCH_EVT")
+
+def test_unregister_trigger(monkeypatch):
+    ge = GameEntity("Hero", "player")
+    trig = DummyTrigger("hit", "h")
+    removed, unsubscribed = [], []
+    monkeypatch.setattr(ge_mod.global_trigger_registry, "remove_trigger", removed.append)
+    monkeypatch.setattr(ge_mod.EventBus, "unsubscribe",
+                        classmethod(lambda cls, et, cb: unsubscribed.append(et)))
+    ge.triggers = [trig]
+    ge.unregister_trigger(trig)
+    assert ge.triggers == []
+    assert not ge.has_trigger_for("hit")
+    assert removed == [trig] and unsubscribed == ["hit"]
+    ge.unregister_trigger(trig)  # unknown triggers are ignored
+    assert removed == [trig]
+
+def test_deepcopy_keeps_dispatch_table():
+    import copy
+    ge = GameEntity("Gob", "enemy")
+    ge.triggers = [DummyTrigger("a", "t1")]
+    clone = copy.deepcopy(ge)
+    assert clone.has_trigger_for("a")
+    assert clone.triggers[0] is not ge.triggers[0]
+    clone.handle_event("a", {})
+    assert clone.triggers[0].checked == [{}]
+    assert ge.triggers[0].checked == []
@@ -2,7 +2,7 @@ import re
 import logging
 import pytest
 
-import models.flow.action.action as action_mod
+import models.flow.dice as dice_mod
 from models.flow.action.action import Action
 from core.logger import app_logger
 
@@ -23,7 +23,7 @@ def test_interrupt_marks_blocked_and_logs():
 
 def test_roll_valid_expression(monkeypatch, caplog):
     # stub out random.randint to always return 1
-    monkeypatch.setattr(action_mod.random, "randint", lambda a, b: 1)
+    monkeypatch.setattr(dice_mod.random, "randint", lambda a, b: 1)
 
     with caplog.at_level(logging.DEBUG, logger=app_logger.name):
         # 2d6+3 → rolls [1,1] + 3 = 5
@@ -34,7 +34,7 @@ def test_roll_valid_expression(monkeypatch, caplog):
 
     caplog.clear()
     # implicit 1d8 (no leading number) and negative modifier
-    monkeypatch.setattr(action_mod.random, "randint", lambda a, b: 4)
+    monkeypatch.setattr(dice_mod.random, "randint", lambda a, b: 4)
     with caplog.at_level(logging.DEBUG, logger=app_logger.name):
         total2 = Action.roll("d8-2")
     # 4 + (-2) = 2
@@ -76,3 +76,64 @@ def test_resolve_handles_exceptions_and_continues(caplog):
     assert "[ReactionQueue] All reactions resolved." in caplog.text
     # Good reaction must have been resolved despite the earlier error
     assert good.resolved is True
+
+class RankedReaction(DummyReaction):
+    def __init__(self, name, log, cast_priority=None, reaction_mode=None):
+        super().__init__()
+        self.name = name
+        self.log = log
+        self.cast_priority = cast_priority
+        self.reaction_mode = reaction_mode
+    def resolve(self):
+        self.log.append(self.name)
+
+def test_resolve_orders_by_mode_then_priority_then_fifo():
+    log = []
+    ReactionQueue.add(RankedReaction("after-low", log, "low", "after"))
+    ReactionQueue.add(RankedReaction("after-high", log, "high", "after"))
+    ReactionQueue.add(RankedReaction("parallel", log, reaction_mode="parallel"))
+    ReactionQueue.add(RankedReaction("interrupt", log, "low", "interrupt"))
+    ReactionQueue.add(RankedReaction("default-1", log))
+    ReactionQueue.add(RankedReaction("default-2", log))
+    ReactionQueue.resolve()
+    assert log == ["interrupt", "parallel", "after-high", "default-1", "default-2", "after-low"]
+
+def test_priority_read_from_spell_and_overridable():
+    log = []
+    fast = RankedReaction("spell", log)
+    fast.spell = type("S", (), {"cast_priority": "high", "reaction_mode": "after"})()
+    ReactionQueue.add(RankedReaction("plain", log))
+    ReactionQueue.add(fast)
+    ReactionQueue.add(RankedReaction("forced", log), mode="interrupt")
+    ReactionQueue.resolve()
+    assert log == ["forced", "spell", "plain"]
+
+def test_interrupt_added_during_resolution_jumps_ahead():
+    log = []
+    class Spawner(RankedReaction):
+        def resolve(self):
+            super().resolve()
+            ReactionQueue.add(RankedReaction("counter", log, reaction_mode="interrupt"))
+    ReactionQueue.add(Spawner("first", log))
+    ReactionQueue.add(RankedReaction("second", log))
+    ReactionQueue.resolve()
+    assert log == ["first", "counter", "second"]
+
+def test_resolve_limit_and_add_many():
+    log = []
+    ReactionQueue.add_many(RankedReaction(str(i), log) for i in range(5))
+    assert ReactionQueue.resolve(limit=2) == 2
+    assert log == ["0", "1"]
+    assert ReactionQueue.blocked()
+    assert ReactionQueue.resolve() == 3
+
+def test_instances_are_independent_of_default_queue():
+    encounter_a, encounter_b = ReactionQueue(), ReactionQueue()
+    r = DummyReaction()
+    encounter_a.add(r)
+    assert encounter_a.blocked()
+    assert not encounter_b.blocked()
+    assert not ReactionQueue.blocked()
+    assert len(encounter_a) == 1
+    encounter_a.resolve()
+    assert r.resolved and not encounter_a.blocked()
@@ -0,0 +1,54 @@
+import pytest
+from models.flow.combat_simulator import Combatant, SimulationReport, simulate_encounter, simulate_encounters
+from models.entities.game_entity import GameEntity
+
+
+def goblin():
+    return GameEntity("Goblin", "enemy", stats={"hp": 7, "ac": 15, "dex": 14, "proficiency_bonus": 2}, inventory=[
+        "Nimble Escape: The goblin can take the Disengage or Hide action as a bonus action on each of its turns.",
+        "Scimitar: Melee Weapon Attack: +4 to hit, reach 5 ft., one target. Hit: 5 (1d6 + 2) slashing damage.",
+    ])
+
+def test_from_entity_parses_srd_action_text():
+    c = Combatant.from_entity(goblin())
+    assert (c.name, c.hp, c.ac, c.attack_bonus, c.damage, c.initiative_bonus) == ("Goblin", 7, 15, 4, "1d6+2", 2)
+
+def test_from_entity_falls_back_to_ability_scores():
+    e = GameEntity("Brute", "enemy", stats={"hp": 20, "ac": 12, "str": 16})
+    c = Combatant.from_entity(e)
+    assert c.attack_bonus == 5 and c.damage == "1d4+3"
+
+def test_from_entity_rejects_entities_without_hp():
+    with pytest.raises(ValueError):
+        Combatant.from_entity(GameEntity("Ghost", "enemy"))
+
+def test_overwhelming_party_always_wins():
+    party = [Combatant("Titan", 500, 30, 20, "10d10")]
+    monsters = [Combatant.from_entity(goblin()) for _ in range(3)]
+    winner, rounds, taken = simulate_encounter(party, monsters)
+    assert winner == "party"
+    assert rounds == 3  # one kill per round
+    assert taken == 0
+
+def test_simulate_encounters_is_reproducible_and_aggregates():
+    party = [Combatant("Fighter", 20, 16, 5, "1d8+3")]
+    monsters = [goblin(), goblin()]
+    a = simulate_encounters(party, monsters, n=200, workers=1, seed=7)
+    b = simulate_encounters(party, monsters, n=200, workers=1, seed=7)
+    assert a.summary() == b.summary()
+    assert a.encounters == 200
+    assert a.win_rate("party") + a.win_rate("monsters") + a.win_rate("draw") == pytest.approx(1.0)
+    assert sum(a.damage_distribution().values()) == pytest.approx(1.0)
+    assert a.expected_rounds >= 1
+
+def test_simulate_encounters_with_process_pool():
+    party = [Combatant("Fighter", 20, 16, 5, "1d8+3")]
+    report = simulate_encounters(party, [goblin()], n=40, workers=2, seed=1)
+    assert report.encounters == 40
+
+def test_simulate_encounters_requires_both_sides():
+    with pytest.raises(ValueError):
+        simulate_encounters([], [goblin()], n=1)
+
+def test_empty_report():
+    assert SimulationReport().summary()["party_win_rate"] == 0.0
@@ -0,0 +1,70 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from models.flow.dice import DiceError, compile_dice, distribution, roll, roll_many
+
+
+def test_compile_is_cached():
+    assert compile_dice("2d6+3") is compile_dice("2d6+3")
+
+@pytest.mark.parametrize("expr, bounds", [
+    ("2d6+3", (5, 15)),
+    ("d8-2", (-1, 6)),
+    ("4d6kh3", (3, 18)),
+    ("d20adv+5", (6, 25)),
+    ("2d8 + 4d6", (6, 40)),
+    ("20", (20, 20)),
+    ("-1d4+10", (6, 9)),
+    ("d%", (1, 100)),
+])
+def test_bounds_and_distribution_sum_to_one(expr, bounds):
+    plan = compile_dice(expr)
+    assert plan.bounds() == bounds
+    dist = plan.distribution()
+    assert sum(dist.values()) == 1
+    assert (min(dist), max(dist)) == bounds
+
+def test_exact_distributions():
+    assert distribution("2d6")[7] == Fraction(1, 6)
+    assert distribution("d20adv")[20] == Fraction(39, 400)
+    assert distribution("d20dis")[1] == Fraction(39, 400)
+    assert compile_dice("4d6kh3").mean() == Fraction(15869, 1296)
+    assert compile_dice("2d20kl1").probability_at_least(20) == Fraction(1, 400)
+
+def test_named_modifier_defaults_to_zero():
+    plan = compile_dice("1d8 + MOD")
+    assert plan.bounds() == (1, 8)
+    assert plan.bounds(MOD=3) == (4, 11)
+    assert plan.mean(MOD=3) == Fraction(15, 2)
+
+def test_damage_type_tags(monkeypatch):
+    monkeypatch.setattr("random.randint", lambda a, b: 1)
+    plan = compile_dice("1d6+2 slashing + 1d4 fire")
+    assert plan.damage_types == ["slashing", "fire"]
+    result = plan.roll_detailed()
+    assert result.total == 4
+    assert result.by_type == {"slashing": 3, "fire": 1}
+    assert result.rolls == [1, 1] and result.modifier == 2
+
+def test_keep_highest_roll(monkeypatch):
+    rolls = iter([1, 6, 3, 5])
+    monkeypatch.setattr("random.randint", lambda a, b: next(rolls))
+    assert roll("4d6kh3") == 14
+
+def test_roll_many_matches_bounds_and_mean():
+    rng = np.random.default_rng(0)
+    totals = roll_many("4d6kh3", 20000, rng=rng)
+    assert totals.shape == (20000,)
+    assert totals.min() >= 3 and totals.max() <= 18
+    assert abs(totals.mean() - 15869 / 1296) < 0.1
+    assert (roll_many("2d6-1 + 3", 5, rng=rng) >= 4).all()
+
+@pytest.mark.parametrize("expr", ["no dice here", "2d6 3", "2d6++3", "4d6kh5", "", "d0", "2d20adv", "2d6 (fire)"])
+def test_invalid_expressions_raise(expr):
+    with pytest.raises(DiceError, match="Invalid dice expression"):
+        compile_dice(expr)
+
+def test_dice_error_is_value_error():
+    assert issubclass(DiceError, ValueError)
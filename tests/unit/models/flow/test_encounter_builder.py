@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+from models.entities.game_entity import GameEntity
+from models.flow.encounter_builder import (
+    EncounterBuilder, MonsterTable, adjusted_xp, encounter_multiplier, entity_xp,
+    party_thresholds, rate_encounter, xp_for_cr,
+)
+
+MONSTERS = [
+    {"index": "goblin", "name": "Goblin", "type": "humanoid", "challenge_rating": 0.25, "xp": 50},
+    {"index": "hobgoblin", "name": "Hobgoblin", "type": "humanoid", "challenge_rating": 0.5, "xp": 100},
+    {"index": "bugbear", "name": "Bugbear", "type": "humanoid", "challenge_rating": 1, "xp": 200},
+    {"index": "zombie", "name": "Zombie", "type": "undead", "challenge_rating": 0.25, "xp": 50},
+    {"index": "ghoul", "name": "Ghoul", "type": "undead", "challenge_rating": 1},
+    {"index": "wight", "name": "Wight", "type": "undead", "challenge_rating": 3, "xp": 700},
+    {"index": "rats", "name": "Swarm of Rats", "type": "swarm of Tiny beasts", "challenge_rating": 0.25, "xp": 50},
+    {"name": "Broken entry"},
+]
+
+
+def test_tables():
+    assert party_thresholds([5, 5, 5, 5]) == {"easy": 1000, "medium": 2000, "hard": 3000, "deadly": 4400}
+    assert xp_for_cr("1/4") == 50 and xp_for_cr(30) == 155000 and xp_for_cr("x") == 0
+    with pytest.raises(ValueError):
+        party_thresholds([21])
+    with pytest.raises(ValueError):
+        party_thresholds([])
+
+
+@pytest.mark.parametrize("count, party, expected", [
+    (1, 4, 1), (2, 4, 1.5), (6, 4, 2), (7, 4, 2.5), (15, 4, 4),
+    (1, 2, 1.5), (15, 2, 5), (1, 6, 0.5), (2, 6, 1),
+])
+def test_encounter_multiplier(count, party, expected):
+    assert encounter_multiplier(count, party) == expected
+
+
+def test_rate_encounter():
+    assert adjusted_xp([50] * 4) == 400
+    assert rate_encounter([1, 1, 1, 1], [50] * 4) == "deadly"
+    assert rate_encounter([1, 1, 1, 1], [50]) == "trivial"
+    assert rate_encounter([3, 3, 3, 3], [200, 200]) == "medium"
+
+
+def test_entity_xp():
+    assert entity_xp(GameEntity("Goblin", "enemy", stats={"xp": 50, "cr": 0.25})) == 50
+    assert entity_xp(GameEntity("Ghoul", "enemy", stats={"cr": 1})) == 200
+
+
+def test_monster_table_filters():
+    table = MonsterTable(MONSTERS)
+    assert len(table) == 7
+    assert table.xps == sorted(table.xps)
+    assert [r.slug for r in table.select(types=["undead"])] == ["zombie", "ghoul", "wight"]
+    assert [r.slug for r in table.select(max_cr="1/4")] == ["goblin", "rats", "zombie"]
+    assert "swarm" in table.types
+
+
+@pytest.mark.parametrize("difficulty", ["easy", "medium", "hard", "deadly"])
+def test_build_hits_requested_band(difficulty):
+    builder = EncounterBuilder(table=MonsterTable(MONSTERS))
+    levels = [3, 3, 3, 3]
+    encounter = builder.build(levels, difficulty, rng=random.Random(0))
+    assert encounter.difficulty == difficulty
+    assert encounter.monster_count <= 8 and len(encounter.groups) <= 3
+
+
+def test_build_respects_type_filter_and_spec_round_trip():
+    builder = EncounterBuilder(table=MonsterTable(MONSTERS))
+    encounter = builder.build([2, 2, 2, 2], "hard", types=["undead"], rng=random.Random(0))
+    assert {record.type for _, record in encounter.groups} == {"undead"}
+    assert encounter.spec() == ", ".join(f"{n} {r.name}" for n, r in encounter.groups)
+    assert encounter.adjusted_xp == adjusted_xp(
+        [r.xp for n, r in encounter.groups for _ in range(n)], 4)
+
+
+def test_entries_round_trip_through_the_importer():
+    from core.rulebook.import_manager import RulebookImporter
+    importer = RulebookImporter()
+    builder = EncounterBuilder(importer.api)
+    encounter = builder.build([5] * 4, "hard", rng=random.Random(0),
+                              slugs=["wereboar-human", "werewolf-hybrid", "goblin"])
+    assert any("," in record.name for _, record in encounter.groups)
+    batch = importer.import_many(encounter.entries())
+    assert batch.ok
+    assert [e.name for e in batch] == [r.name for n, r in encounter.groups for _ in range(n)]
+
+
+def test_build_returns_none_without_candidates():
+    builder = EncounterBuilder(table=MonsterTable(MONSTERS))
+    assert builder.build([20] * 4, "deadly", types=["humanoid"], max_monsters=2) is None
+    assert builder.build([1], types=["dragon"]) is None
+    with pytest.raises(ValueError):
+        builder.build([1], "impossible")
+
+
+def test_builder_reads_monsters_from_api():
+    class API:
+        def get(self, category):
+            assert category == "monsters"
+            return MONSTERS
+    assert len(EncounterBuilder(API()).table) == 7
+
+
+def test_build_restricted_to_slugs():
+    builder = EncounterBuilder(table=MonsterTable(MONSTERS))
+    encounter = builder.build([1, 1, 1, 1], "medium", slugs={"goblin", "hobgoblin"}, rng=random.Random(0))
+    assert {record.slug for _, record in encounter.groups} <= {"goblin", "hobgoblin"}
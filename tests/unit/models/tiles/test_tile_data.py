@@ -1,3 +1,4 @@
+import copy
 import pytest
 
 import models.tiles.tile_data as td_mod
@@ -173,3 +174,62 @@ def test_from_dict_roundtrip(monkeypatch, clear_eventbus):
     ent = td.entities[0]
     assert isinstance(ent, DummyEntity)
     assert ent.entity_type == "enemy"
+
+def test_tag_changes_are_reported_to_listener():
+    td = TileData()
+    seen = []
+    td._listener = lambda tile, name, old, new: seen.append((name, old, new))
+    td.tags.append(TileTag.BLOCKS_VISION)
+    td.tags.append(TileTag.BLOCKS_VISION)  # duplicate: membership unchanged
+    td.tags = [TileTag.TRAP_ZONE]
+    td.note = "hidden lever"
+    assert seen == [
+        ("tags", frozenset(), frozenset({TileTag.BLOCKS_VISION})),
+        ("tags", frozenset({TileTag.BLOCKS_VISION}), frozenset({TileTag.TRAP_ZONE})),
+        ("note", None, "hidden lever"),
+    ]
+
+def test_tag_list_copies_are_plain_lists():
+    td = TileData(tags=[TileTag.START_ZONE])
+    td._listener = lambda *args: None
+    assert td.tags == [TileTag.START_ZONE]
+    assert type(td.tags.copy()) is list
+    assert type(copy.deepcopy(td.tags)) is list
+    clone = copy.deepcopy(td)
+    assert clone == td
+    assert clone._listener is None
+
+
+def test_dirty_flag_set_by_edits_and_cleared_after_save():
+    td = TileData(tags=[TileTag.TRAP_ZONE], entities=[DummyEntity("Rat", "enemy")])
+    assert not td.dirty
+    td.note = "assignments mark the tile"
+    assert td.dirty
+    td.mark_clean()
+    td.add_entity(DummyEntity("Goblin", "enemy"))
+    assert td.dirty
+    td.mark_clean()
+    assert not td.dirty
+    td.mark_dirty()
+    assert td.dirty
+    assert TileData.from_dict(TileData().to_dict()).dirty is False
+
+
+@pytest.mark.parametrize("edit", [
+    lambda td: td.entities.pop(0),
+    lambda td: td.entities.append(DummyEntity("Orc", "enemy")),
+    lambda td: td.triggers.append(object()),
+    lambda td: td.triggers.clear(),
+    lambda td: td.tags.remove(TileTag.TRAP_ZONE),
+])
+def test_in_place_list_edits_mark_the_tile_dirty(edit):
+    td = TileData(tags=[TileTag.TRAP_ZONE], entities=[DummyEntity("Rat", "enemy")])
+    seen = []
+    td._listener = lambda tile, name, old, new: seen.append(name)
+    edit(td)
+    assert td.dirty
+    assert len(seen) == 1
+    clone = copy.deepcopy(td)
+    clone.mark_clean()
+    clone.entities.append(DummyEntity("Bat", "enemy"))
+    assert clone.dirty
@@ -139,3 +139,9 @@ def test_deepcopy_of_preset_lists():
     # Preset should still hold its own copies
     assert len(preset.entities) == 1
     assert len(preset.triggers) == 1
+
+
+def test_apply_to_marks_tile_dirty():
+    td = TileData()
+    TilePreset(terrain=TerrainType.WALL).apply_to(td, logic=False)
+    assert td.dirty
@@ -0,0 +1,91 @@
+import pytest
+from models.world.world import World
+from models.world.world_tile_manager import WorldTileManager
+from models.world.pathfinding import PathFinder
+from models.tiles.tile_data import TileData, TileTag, TerrainType
+
+def make_world(width=5, height=5, tile_type="square"):
+    return World(
+        world_version=1, width=width, height=height, tile_type=tile_type,
+        description="", map_data={}, time_of_day="noon", weather_conditions="clear"
+    )
+
+def test_find_path_straight_line():
+    w = make_world()
+    assert w.find_path((0, 0), (0, 3)) == [(0, 0), (0, 1), (0, 2), (0, 3)]
+    assert w.find_path((2, 2), (2, 2)) == [(2, 2)]
+    assert w.find_path((0, 0), (9, 9)) is None
+
+def test_find_path_avoids_blocked_tiles_and_walls():
+    w = make_world()
+    for y in range(4):
+        w.tile_manager.tiles[(2, y)].tags.append(TileTag.BLOCKS_MOVEMENT)
+    path = w.find_path((0, 0), (4, 0))
+    assert (2, 4) in path
+    assert all(p[0] != 2 or p[1] == 4 for p in path)
+    w.tile_manager.tiles[(2, 4)].terrain = TerrainType.WALL
+    assert w.find_path((0, 0), (4, 0)) is None
+
+def test_find_path_prefers_cheap_terrain():
+    w = make_world(4, 2)
+    tiles = w.tile_manager.tiles
+    tiles[(1, 0)].terrain = TerrainType.MOUNTAIN
+    tiles[(2, 0)].terrain = TerrainType.MOUNTAIN
+    # going around the mountains (cost 5) beats climbing them (3 + 3 + 1)
+    assert w.find_path((0, 0), (3, 0)) == [(0, 0), (0, 1), (1, 1), (2, 1), (3, 1), (3, 0)]
+    tiles[(1, 0)].terrain = TerrainType.WATER
+    tiles[(2, 0)].terrain = TerrainType.FLOOR
+    # wading through the water (2 + 1 + 1) beats going around
+    assert w.find_path((0, 0), (3, 0)) == [(0, 0), (1, 0), (2, 0), (3, 0)]
+
+def test_replacing_a_tile_updates_costs_and_paths():
+    w = make_world(3, 3)
+    assert w.find_path((0, 0), (2, 0)) == [(0, 0), (1, 0), (2, 0)]
+    assert w.pathfinder.step_cost(1, 0) == 1
+    w.tile_manager.tiles[(1, 0)] = TileData(position=(1, 0), terrain=TerrainType.WALL)
+    assert w.pathfinder.step_cost(1, 0) is None
+    assert (1, 0) not in w.find_path((0, 0), (2, 0))
+
+def test_movement_range_costs_and_budget():
+    w = make_world()
+    w.tile_manager.tiles[(1, 0)].terrain = TerrainType.WATER
+    reach = w.movement_range((0, 0), 2)
+    assert reach == {(0, 0): 0, (0, 1): 1, (0, 2): 2, (1, 1): 2, (1, 0): 2}
+
+def test_movement_range_is_cached_and_reused():
+    w = make_world()
+    first = w.movement_range((2, 2), 3)
+    field = w.pathfinder.distance_field((2, 2), 3)
+    assert w.pathfinder.distance_field((2, 2), 2) is field
+    assert w.movement_range((2, 2), 2) == {p: c for p, c in first.items() if c <= 2}
+    assert w.find_path((2, 2), (2, 0)) == [(2, 2), (2, 1), (2, 0)]
+
+def test_tile_changes_invalidate_only_affected_fields():
+    w = make_world(20, 20)
+    w.movement_range((1, 1), 2)
+    w.movement_range((15, 15), 2)
+    assert len(w.pathfinder) == 2
+    w.tile_manager.tiles[(1, 2)].tags.append(TileTag.TRAP_ZONE)  # irrelevant tag
+    assert len(w.pathfinder) == 2
+    w.tile_manager.tiles[(1, 2)].tags.append(TileTag.BLOCKS_MOVEMENT)
+    assert len(w.pathfinder) == 1
+    assert (1, 2) not in w.movement_range((1, 1), 2)
+    w.tile_manager.tiles[(15, 16)].terrain = TerrainType.WATER
+    assert w.movement_range((15, 15), 2)[(15, 16)] == 2
+
+def test_hex_neighbours_and_custom_costs():
+    mgr = WorldTileManager(3, 3, tile_type="hex")
+    finder = PathFinder(mgr, terrain_costs={TerrainType.WATER: None})
+    assert finder.find_path((2, 0), (0, 2)) == [(2, 0), (1, 1), (0, 2)]
+    mgr.tiles[(1, 1)].terrain = TerrainType.WATER
+    finder.clear()
+    assert len(finder.find_path((2, 0), (0, 2))) == 4
+
+def test_distance_field_cache_evicts_least_recently_used():
+    finder = PathFinder(WorldTileManager(5, 5, tile_type="square"), max_fields=2)
+    first = finder.distance_field((0, 0))
+    finder.distance_field((4, 4))
+    assert finder.find_path((0, 0), (2, 2)) == first.path_to((2, 2))
+    finder.distance_field((2, 2))
+    assert len(finder) == 2
+    assert finder.distance_field((0, 0)) is first
@@ -0,0 +1,63 @@
+import pytest
+from models.world.spatial_index import SpatialIndex
+
+class DummyEntity:
+    def __init__(self, name, vision_range=None):
+        self.name = name
+        self.vision_range = vision_range
+        self.position = None
+
+def names(pairs):
+    return {e.name for _, e in pairs}
+
+def test_unbounded_observers_always_returned():
+    idx = SpatialIndex(100, 100, cell_size=4)
+    ent = DummyEntity("Oracle")
+    idx.insert(ent, (90, 90))
+    assert names(idx.observers_near((0, 0))) == {"Oracle"}
+    assert ent in idx
+    assert len(idx) == 1
+
+def test_bounded_observer_only_near_its_range():
+    idx = SpatialIndex(100, 100, cell_size=4)
+    guard = DummyEntity("Guard", vision_range=3)
+    idx.insert(guard, (10, 10))
+    assert names(idx.observers_near((12, 11))) == {"Guard"}
+    assert names(idx.observers_near((50, 50))) == set()
+
+def test_reinsert_moves_observer():
+    idx = SpatialIndex(100, 100, cell_size=4)
+    guard = DummyEntity("Guard", vision_range=2)
+    idx.insert(guard, (10, 10))
+    idx.insert(guard, (60, 60))
+    assert idx.position_of(guard) == (60, 60)
+    assert names(idx.observers_near((10, 10))) == set()
+    assert names(idx.observers_near((61, 60))) == {"Guard"}
+
+def test_remove_and_clear():
+    idx = SpatialIndex(20, 20)
+    a, b = DummyEntity("A", 1), DummyEntity("B")
+    idx.insert(a, (0, 0))
+    idx.insert(b, (5, 5))
+    idx.remove(a)
+    idx.remove(a)  # unknown entities are ignored
+    assert a not in idx
+    assert idx._buckets == {}
+    idx.clear()
+    assert len(idx) == 0
+
+@pytest.mark.parametrize("cell_size", [1, 3, 8])
+def test_no_observer_in_range_is_missed(cell_size):
+    idx = SpatialIndex(30, 30, cell_size=cell_size)
+    ents = []
+    for i in range(0, 30, 4):
+        e = DummyEntity(f"E{i}", vision_range=i % 7)
+        idx.insert(e, (i, 29 - i))
+        ents.append(e)
+    for tx in range(30):
+        for ty in range(30):
+            found = names(idx.observers_near((tx, ty)))
+            for e in ents:
+                x, y = idx.position_of(e)
+                if abs(tx - x) + abs(ty - y) <= e.vision_range:
+                    assert e.name in found
@@ -0,0 +1,78 @@
+import pytest
+from models.world.tile_grid import TileGrid
+from models.tiles.tile_data import TileData, TerrainType, TileTag
+
+def test_mapping_facade():
+    grid = TileGrid(3, 2)
+    assert len(grid) == 6
+    assert list(grid) == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert (2, 1) in grid
+    assert (3, 0) not in grid
+    assert "nope" not in grid
+    with pytest.raises(KeyError):
+        grid[(3, 0)]
+    tile = grid[(1, 1)]
+    assert isinstance(tile, TileData)
+    assert tile.position == (1, 1)
+    assert tile.terrain == TerrainType.FLOOR
+    assert grid[(1, 1)] is tile
+
+def test_tiles_are_built_lazily():
+    grid = TileGrid(500, 500)
+    assert grid.materialized_count == 0
+    assert grid.terrain_at(10, 10) == TerrainType.FLOOR
+    assert grid.has_tag(10, 10, TileTag.BLOCKS_VISION) is False
+    assert grid.materialized_count == 0
+
+def test_edits_through_tiles_reach_the_arrays():
+    seen = []
+    grid = TileGrid(4, 4, listener=lambda tile, name, old, new: seen.append(name))
+    tile = grid[(2, 3)]
+    tile.terrain = TerrainType.WALL
+    tile.tags.append(TileTag.BLOCKS_VISION)
+    tile.overlay_color = "#ff0000"
+    assert grid.terrain_at(2, 3) == TerrainType.WALL
+    assert grid.tags_at(2, 3) == [TileTag.BLOCKS_VISION]
+    assert grid.overlay_at(2, 3) == "#ff0000"
+    assert list(grid.tag_mask(TileTag.BLOCKS_VISION)).count(1) == 1
+    assert seen == ["terrain", "tags", "overlay_color"]
+
+def test_setitem_replaces_tile_and_reports_changed_fields():
+    seen = []
+    grid = TileGrid(2, 2, listener=lambda tile, name, old, new: seen.append((name, new)))
+    old = grid[(0, 0)]
+    new = TileData(position=(0, 0), terrain=TerrainType.WATER, tags=[TileTag.TRAP_ZONE])
+    grid[(0, 0)] = new
+    assert grid[(0, 0)] is new
+    assert grid.terrain_at(0, 0) == TerrainType.WATER
+    assert seen == [("terrain", TerrainType.WATER), ("tags", frozenset({TileTag.TRAP_ZONE}))]
+    old.terrain = TerrainType.WALL  # detached: no effect on the grid
+    assert grid.terrain_at(0, 0) == TerrainType.WATER
+
+def test_grid_keeps_only_tiles_with_content():
+    grid = TileGrid(3, 3)
+    grid[(0, 0)].tags.append(TileTag.START_ZONE)
+    grid[(1, 1)].note = "altar"
+    grid[(2, 2)].background_image = "media/altar.png"
+    assert grid.materialized_count == 2
+    assert grid.has_tag(0, 0, TileTag.START_ZONE)
+    assert grid[(0, 0)].tags == [TileTag.START_ZONE]
+    assert grid[(1, 1)].note == "altar"
+    grid[(1, 1)].note = None
+    assert grid.materialized_count == 1
+
+
+def test_full_iteration_does_not_keep_tiles():
+    import gc
+    import tracemalloc
+    grid = TileGrid(60, 60)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    assert all(tile.terrain == TerrainType.FLOOR for tile in grid.values())
+    assert sum(1 for _ in grid.items()) == 3600
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert grid.materialized_count == 0
+    assert len(grid._views) == 0
+    assert retained < 20_000
@@ -0,0 +1,78 @@
+import pytest
+from models.world.visibility import compute_fov, VisibilityCache
+
+def make_grid(width, height, walls=()):
+    walls = set(walls)
+    return (
+        lambda x, y: (x, y) in walls,
+        lambda x, y: 0 <= x < width and 0 <= y < height,
+    )
+
+def test_open_room_is_manhattan_diamond():
+    blocking, in_bounds = make_grid(11, 11)
+    fov = compute_fov((5, 5), 3, blocking, in_bounds)
+    expected = {
+        (x, y) for x in range(11) for y in range(11)
+        if abs(x - 5) + abs(y - 5) <= 3
+    }
+    assert fov == expected
+
+def test_wall_is_visible_but_hides_tiles_behind_it():
+    blocking, in_bounds = make_grid(5, 1, walls={(2, 0)})
+    fov = compute_fov((0, 0), 4, blocking, in_bounds)
+    assert (1, 0) in fov
+    assert (2, 0) in fov
+    assert (3, 0) not in fov
+    assert (4, 0) not in fov
+
+def test_fov_is_clipped_to_grid():
+    blocking, in_bounds = make_grid(3, 3)
+    fov = compute_fov((0, 0), 10, blocking, in_bounds)
+    assert fov == {(x, y) for x in range(3) for y in range(3)}
+
+def test_fov_is_symmetric():
+    walls = {(3, 2), (4, 4), (2, 5), (6, 3), (5, 6)}
+    blocking, in_bounds = make_grid(9, 9, walls)
+    floors = [(x, y) for x in range(9) for y in range(9) if (x, y) not in walls]
+    fovs = {p: compute_fov(p, 8, blocking, in_bounds) for p in floors}
+    for a in floors:
+        for b in floors:
+            assert (b in fovs[a]) == (a in fovs[b])
+
+def test_cache_reuses_and_invalidates_only_nearby_entries():
+    walls = set()
+    calls = []
+    def blocking(x, y):
+        calls.append((x, y))
+        return (x, y) in walls
+    cache = VisibilityCache(blocking, lambda x, y: 0 <= x < 20 and 0 <= y < 20)
+
+    near = cache.visible_tiles((2, 2), 3)
+    far = cache.visible_tiles((15, 15), 3)
+    calls.clear()
+    assert cache.visible_tiles((2, 2), 3) is near
+    assert calls == []
+    assert len(cache) == 2
+
+    walls.add((2, 3))
+    cache.invalidate_around((2, 3))
+    assert len(cache) == 1
+    assert cache.visible_tiles((15, 15), 3) is far
+    assert (2, 4) not in cache.visible_tiles((2, 2), 3)
+
+    cache.clear()
+    assert len(cache) == 0
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = VisibilityCache(lambda x, y: False, lambda x, y: 0 <= x < 20 and 0 <= y < 20,
+                            shape=(20, 20), max_entries=2)
+    first = cache.visible_tiles((0, 0), 2)
+    cache.visible_tiles((5, 5), 2)
+    assert cache.visible_tiles((0, 0), 2) is first
+    cache.visible_tiles((10, 10), 2)
+    assert len(cache) == 2
+    assert cache.visible_tiles((0, 0), 2) is first
+
+    for origin in [(0, 0), (5, 5), (10, 10)]:
+        cache.visible_mask(origin, 2)
+    assert len(cache._masks) == 2
@@ -107,3 +107,46 @@ def test_can_see_blocked_by_vision_tag(world_empty):
     # Tag that tile as blocking vision
     w.tile_manager.tiles[(0,1)].tags.append(TileTag.BLOCKS_VISION)
     assert w.can_see((0,0), (0,2), 2) is False
+
+def test_can_see_cache_follows_vision_tag_changes(world_empty):
+    w = world_empty
+    assert w.can_see((0, 0), (0, 2), 2) is True
+    tile = w.tile_manager.tiles[(0, 1)]
+    tile.tags.append(TileTag.BLOCKS_VISION)
+    assert w.can_see((0, 0), (0, 2), 2) is False
+    tile.tags = []
+    assert w.can_see((0, 0), (0, 2), 2) is True
+
+def test_unrelated_tag_change_keeps_cache(world_empty):
+    w = world_empty
+    fov = w.visible_tiles((0, 0), 2)
+    w.tile_manager.tiles[(0, 1)].tags.append(TileTag.TRAP_ZONE)
+    assert w.visible_tiles((0, 0), 2) is fov
+
+def test_vision_blocking_mask(world_empty):
+    w = world_empty
+    w.tile_manager.tiles[(2, 1)].tags.append(TileTag.BLOCKS_VISION)
+    mask = w.vision_blocking_mask()
+    assert mask.shape == (3, 3)
+    assert mask.sum() == 1 and mask[2, 1]
+
+def test_visibility_matrix_matches_can_see(world_empty):
+    w = world_empty
+    w.tile_manager.tiles[(1, 1)].tags.append(TileTag.BLOCKS_VISION)
+    tiles = [(x, y) for x in range(3) for y in range(3)]
+    observers = [(0, 0), (2, 2), (0, 2), (1, 1)]
+    matrix = w.visibility_matrix(observers, tiles, [2, 4, 1, 3])
+    assert matrix.shape == (4, 9)
+    for i, (src, r) in enumerate(zip(observers, [2, 4, 1, 3])):
+        for j, tgt in enumerate(tiles):
+            assert bool(matrix[i, j]) == w.can_see(src, tgt, r)
+    # many observers, one target: answered from the target's field of view
+    column = w.visibility_matrix(tiles, [(0, 0)], 4)[:, 0]
+    assert list(column) == [w.can_see(t, (0, 0), 4) for t in tiles]
+
+def test_can_see_many_with_per_target_ranges(world_empty):
+    w = world_empty
+    w.tile_manager.tiles[(0, 1)].tags.append(TileTag.BLOCKS_VISION)
+    result = w.can_see_many((0, 0), [(0, 2), (2, 0), (2, 2), (5, 5)], [2, 1, 4, 10])
+    assert list(result) == [False, False, True, False]
+    assert w.can_see_many((0, 0), [], 3).shape == (0,)
@@ -82,3 +82,34 @@ def test_display_world(caplog):
     assert len(lines) == 2
     for line in lines:
         assert "[ ][ ][ ][ ]" in line
+
+def test_move_entity_keeps_entities_and_index_in_sync():
+    mgr = WorldTileManager(40, 40, tile_type="square")
+    ent = DummyEntity("Scout")
+    ent.vision_range = 1
+    mgr.place_entity(ent, 0, 0)
+    mgr.move_entity(ent, 30, 30)
+    assert mgr.get_entities_at(0, 0) == []
+    assert mgr.get_entities_at(30, 30) == [ent]
+    assert [e for _, e in mgr.get_observers_near(30, 29)] == [ent]
+    assert mgr.get_observers_near(0, 0) == []
+
+def test_place_entity_twice_relocates():
+    mgr = WorldTileManager(3, 1, tile_type="square")
+    ent = DummyEntity("Guard")
+    mgr.place_entity(ent, 2, 0)
+    mgr.place_entity(ent, 1, 0)
+    assert mgr.entities == {(1, 0): [ent]}
+
+def test_remove_and_refresh_entity():
+    mgr = WorldTileManager(10, 10, tile_type="square")
+    ent = DummyEntity("Sentry")
+    ent.vision_range = 1
+    mgr.place_entity(ent, 0, 0)
+    assert mgr.get_observers_near(9, 9) == []
+    ent.vision_range = 20
+    mgr.refresh_entity(ent)
+    assert mgr.get_observers_near(9, 9) == [((0, 0), ent)]
+    mgr.remove_entity(ent)
+    assert mgr.entities == {}
+    assert mgr.get_observers_near(0, 0) == []
@@ -0,0 +1,26 @@
+# tests/unit/ui/dialogs/test_universal_search_dialog.py
+import threading
+
+from core.rulebook.preloader import RulebookPreloader
+from ui.dialogs.universal_search_dialog import UniversalSearchDialog
+
+
+def test_dialog_fills_in_when_preloaded_category_arrives(qtbot, mocker):
+    release = threading.Event()
+
+    class SlowAPI:
+        def get(self, category):
+            release.wait(5)
+            return [{"name": "Goblin"}]
+
+    preloader = RulebookPreloader(api=SlowAPI())
+    importer = mocker.patch("ui.dialogs.universal_search_dialog.RulebookImporter").return_value
+    importer.search_monsters.return_value = ["Goblin", "Orc"]
+    dlg = UniversalSearchDialog(mode="monster", preloader=preloader)
+    qtbot.addWidget(dlg)
+    assert [dlg.result_list.item(i).text() for i in range(dlg.result_list.count())] == ["Loading..."]
+    assert not dlg.result_list.isEnabled()
+    release.set()
+    qtbot.waitUntil(lambda: dlg.result_list.count() == 2, timeout=5000)
+    assert dlg.result_list.isEnabled()
+    preloader.shutdown(wait=True)
@@ -0,0 +1,59 @@
+import pytest
+
+from core.map_format import build_map, chunk_keys
+from ui.map_loader import MapLoader
+
+
+@pytest.fixture
+def map_data():
+    # 20x20 tiles in 4x4 chunks -> 25 chunks
+    tiles = [{"position": [3, 17], "terrain": "WALL"}]
+    return build_map(tiles, meta={"rows": 20, "cols": 20}, chunk_size=4)
+
+
+def test_eager_chunks_are_built_immediately(qapp, map_data):
+    built = []
+    keys = chunk_keys(map_data)
+    loader = MapLoader(map_data, keys, built.append)
+    loader.start(eager=2)
+    assert len(built) == 32
+    assert {tuple(t["position"]) for t in built} == {(r, c) for r in range(4) for c in range(8)}
+    assert loader.is_running
+    loader.cancel()
+
+
+def test_rest_is_built_in_background_batches(qtbot, map_data):
+    built = []
+    loader = MapLoader(map_data, chunk_keys(map_data), built.append)
+    progress = []
+    loader.progress.connect(lambda done, total: progress.append((done, total)))
+    with qtbot.waitSignal(loader.finished, timeout=5000) as blocker:
+        loader.start()
+    assert blocker.args == [400]
+    assert len(built) == 400
+    assert progress[-1] == (400, 400)
+    assert not loader.is_running
+    wall = next(t for t in built if t["position"] == [3, 17])
+    assert wall["terrain"] == "WALL"
+
+
+def test_finish_builds_the_rest_at_once(qapp, map_data):
+    built = []
+    finished = []
+    loader = MapLoader(map_data, chunk_keys(map_data), built.append)
+    loader.finished.connect(finished.append)
+    loader.start(eager=1)
+    loader.finish()
+    loader.finish()
+    assert len(built) == 400
+    assert finished == [400]
+
+
+def test_cancel_drops_pending_chunks(qtbot, map_data):
+    built = []
+    loader = MapLoader(map_data, chunk_keys(map_data), built.append)
+    loader.start(eager=1)
+    loader.cancel()
+    qtbot.wait(20)
+    assert len(built) == 16
+    assert not loader.is_running
@@ -138,3 +138,26 @@ def test_open_selected_scenario(widget, workspace):
     # map_loader is called with the (relative) Path("workspace/.../map.json")
     rel = Path("workspace") / "TestScn" / "map.json"
     assert getattr(widget_obj, "loaded_path") == rel
+
+
+def test_info_comes_from_the_catalog(widget, workspace, monkeypatch):
+    from core.map_format import build_map
+    d = workspace / "Cat"
+    d.mkdir(parents=True)
+    data = build_map([{"position": [0, 0], "overlay_color": "#123456", "entities": [{}]}],
+                     meta={"author": "Cy", "rows": 3, "cols": 4})
+    (d / "map.json").write_text(json.dumps(data), encoding="utf-8")
+    widget.refresh_scenario_list()
+    widget.scenario_list.setCurrentRow(0)
+    info = widget.info_panel.toPlainText().splitlines()
+    assert info[3] == "Tiles: 12"
+    assert "Entities: 1" in info and "Size: 3 x 4" in info
+    assert not widget.thumbnail_label.pixmap().isNull()
+
+    # a second look reads the stored entry without parsing the map
+    monkeypatch.setattr(so_mod.json, "load", lambda *a, **k: pytest.fail("map parsed"))
+    monkeypatch.setattr("core.scenario_catalog.json.load", lambda *a, **k: pytest.fail("map parsed"))
+    monkeypatch.setattr("core.scenario_catalog._racy", lambda mtime_ns: False)
+    widget.scenario_list.setCurrentRow(-1)
+    widget.scenario_list.setCurrentRow(0)
+    assert widget.info_panel.toPlainText().splitlines()[0] == "Name: Cat"
@@ -63,14 +63,76 @@ def test_save_map_triggers_backup(tmp_path):
     map_path = tmp_path / 'testmap.json'
 
     # First save: file does not exist yet => no backup
-    mw.save_map_to_file(str(map_path))
+    mw.save_map_to_file(str(map_path), wait=True)
     assert map_path.exists(), "Map file should be created on first save"
     assert calls == [], "No backup should be made on initial save"
 
     # Second save: file exists => should invoke backup
-    mw.save_map_to_file(str(map_path))
+    mw.save_map_to_file(str(map_path), wait=True)
     assert calls == [Path(str(map_path))], "BackupManager.backup_map should be called once on overwrite"
 
     # Verify the JSON structure was written correctly
     data = json.loads(map_path.read_text(encoding='utf-8'))
-    assert 'version' in data and 'tiles' in data
+    assert 'version' in data and 'chunks' in data
+
+
+def test_second_save_journals_only_dirty_tiles(tmp_path):
+    from ui.main_window import MainWindow
+    from core.map_format import iter_tiles
+    from core.map_store import load_map, journal_path
+    from models.tiles.square_tile_item import SquareTileItem
+
+    mw = MainWindow(settings={}, grid_type='square', rows=2, cols=2)
+    mw.backup_manager.backup_map = lambda p: None
+    map_path = tmp_path / 'testmap.json'
+    mw.save_map_to_file(str(map_path), wait=True)
+    base = map_path.read_text(encoding='utf-8')
+
+    td = next(i.tile_data for i in mw.scene.items() if isinstance(i, SquareTileItem))
+    td.note = "edited"
+    td.mark_dirty()
+    mw.save_map_to_file(str(map_path), wait=True)
+
+    assert map_path.read_text(encoding='utf-8') == base
+    assert len(journal_path(map_path).read_text(encoding='utf-8').splitlines()) == 2
+    assert not td.dirty
+    notes = {tuple(t["position"]): t["note"] for t in iter_tiles(load_map(map_path))}
+    assert notes[td.position] == "edited"
+
+    # reloading picks the change up and keeps journaling
+    mw.load_map_from_file(str(map_path))
+    assert mw.map_store is not None and mw.map_store.can_append
+
+
+def test_autosave_writes_in_the_background(qtbot, tmp_path):
+    from ui.main_window import MainWindow
+
+    mw = MainWindow(settings={}, grid_type='square', rows=2, cols=2)
+    map_path = tmp_path / 'testmap.json'
+    mw.current_map_path = str(map_path)
+    with qtbot.waitSignal(mw.save_worker.saved, timeout=5000) as blocker:
+        mw._auto_save()
+    assert blocker.args == [str(map_path)]
+    assert 'chunks' in json.loads(map_path.read_text(encoding='utf-8'))
+
+
+def test_failed_save_makes_the_next_one_full(qtbot, tmp_path):
+    from ui.main_window import MainWindow
+    from core.map_store import journal_path
+
+    mw = MainWindow(settings={}, grid_type='square', rows=2, cols=2)
+    mw.backup_manager.backup_map = lambda p: None
+    map_path = tmp_path / 'testmap.json'
+    mw.save_map_to_file(str(map_path), wait=True)
+
+    def disk_full(tiles):
+        raise OSError("No space left on device")
+    mw.map_store.append = disk_full
+    with qtbot.waitSignal(mw.save_worker.failed, timeout=5000) as blocker:
+        mw.save_map_to_file(str(map_path))
+    assert "No space left" in blocker.args[1]
+    assert mw.map_store is None
+
+    mw.save_map_to_file(str(map_path), wait=True)
+    assert map_path.exists() and not journal_path(map_path).exists()
+    assert mw.map_store.can_append
@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+import json
+
+import pytest
+
+from utils.copy_on_write import CopyOnWrite, borrow, is_borrowed, own
+
+
+class Holder:
+    items = CopyOnWrite()
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+
+
+def test_plain_assignment_behaves_like_an_attribute():
+    h = Holder([1])
+    h.items.append(2)
+    assert h.items == [1, 2]
+    assert not is_borrowed(h, "items")
+
+
+def test_reading_a_borrowed_value_does_not_copy_it():
+    template = {"hp": 7}
+    h = Holder()
+    borrow(h, "items", template)
+    assert h.items["hp"] == 7 and h.items == template
+    assert h.items is h.items
+    assert is_borrowed(h, "items")
+    with pytest.raises(TypeError):
+        h.items["hp"] = 1
+    h.items = {"hp": 1}
+    assert not is_borrowed(h, "items") and template == {"hp": 7}
+
+
+def test_borrowed_list_reads_as_a_read_only_sequence():
+    h = Holder()
+    borrow(h, "items", ["bite", "claw"])
+    assert h.items == ["bite", "claw"] and h.items == ("bite", "claw")
+    assert h.items != ["bite"]
+    assert json.loads(json.dumps(h.items)) == ["bite", "claw"]
+    with pytest.raises(AttributeError):
+        h.items.append("tail")
+
+
+def test_own_copies_a_borrowed_value_once():
+    template = ["bite", "claw"]
+    a, b = Holder(), Holder()
+    borrow(a, "items", template)
+    borrow(b, "items", template)
+    assert is_borrowed(a, "items")
+    own(a, "items").append("tail")
+    assert own(a, "items") is a.items
+    assert a.items == ["bite", "claw", "tail"]
+    assert not is_borrowed(a, "items")
+    assert is_borrowed(b, "items")
+    assert template == ["bite", "claw"]
+    assert b.items == ["bite", "claw"] and b.items is not template
+
+
+def test_borrowed_value_pickles_and_copies_as_a_private_copy():
+    template = {"hp": 7}
+    h = Holder()
+    borrow(h, "items", template)
+    for clone in (pickle.loads(pickle.dumps(h)), copy.deepcopy(h)):
+        assert clone.items == {"hp": 7}
+        clone.items["hp"] = 1
+    assert template == {"hp": 7}
@@ -0,0 +1,31 @@
+from core.map_format import MAP_VERSION, iter_tiles
+from versioning.migrations import map_data
+from versioning.update_registry import update_registry
+from versioning.updater import Updater
+
+
+def v1_map():
+    tiles = [
+        {"tile_id": f"{r}_{c}", "position": [r, c], "terrain": "FLOOR", "tags": [], "user_label": None,
+         "note": None, "overlay_color": None, "last_updated": None, "entities": [], "triggers": []}
+        for r in range(3) for c in range(2)
+    ]
+    tiles[3]["terrain"] = "WALL"
+    return {"version": "1.0", "meta": {"author": "A", "rows": 3, "cols": 2},
+            "tiles": tiles, "entities": []}
+
+
+def test_v1_to_v2_keeps_only_non_default_tiles():
+    migrated = map_data.migrate_v1_to_v2(v1_map())
+    assert migrated["version"] == MAP_VERSION
+    assert migrated["entities"] == [] and migrated["meta"]["author"] == "A"
+    assert migrated["chunks"] == {"0,0": [{"position": [1, 1], "terrain": "WALL"}]}
+    assert list(iter_tiles(migrated)) == v1_map()["tiles"]
+
+
+def test_updater_runs_the_whole_chain():
+    data = v1_map()
+    del data["version"]
+    migrated, version = Updater(update_registry).update("Map", data, 0)
+    assert version == MAP_VERSION
+    assert len(list(iter_tiles(migrated))) == 6
@@ -23,8 +23,9 @@ def test_settings_versions():
 
 def test_map_versions():
     map_map = update_registry["Map"]
-    assert set(map_map.keys()) == {0}
-    assert map_map[0] is None
+    assert set(map_map.keys()) == {0, 1}
+    assert map_map[0] == map_mod.migrate_v0_to_v1
+    assert map_map[1] == map_mod.migrate_v1_to_v2
 
 def test_all_non_none_are_callable():
     for category, versions in update_registry.items():
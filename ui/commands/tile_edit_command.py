@@ -78,6 +78,7 @@ class TileEditCommand(QUndoCommand):
         td.user_label    = self.old_state["user_label"]
         td.entities      = deepcopy(self.old_state["entities"])
         td.triggers      = deepcopy(self.old_state["triggers"])
+        td.mark_dirty()
         self._refresh_tile_visual()
 
     def _refresh_tile_visual(self):
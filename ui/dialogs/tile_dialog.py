@@ -221,6 +221,7 @@ class TileDialog(QDialog):
 
         from datetime import datetime
         td.last_updated = datetime.now().isoformat()
+        td.mark_dirty()
 
         new_state = td.to_dict()
         
@@ -62,5 +62,6 @@ class TileEditCommand(QUndoCommand):
         self.tile_data.note = state["note"]
         self.tile_data.overlay_color = state["overlay_color"]
         self.tile_data.last_updated = state.get("last_updated")
+        self.tile_data.mark_dirty()
         if self.tile_item:
             self.tile_item.set_overlay_color(self.tile_data.overlay_color)
@@ -5,6 +5,9 @@ from PyQt5.QtWidgets import (
     QLineEdit, QListWidget, QPushButton, QLabel, QMessageBox
 )
 from core.rulebook.import_manager import RulebookImporter
+from core.rulebook.preloader import RulebookPreloader
+from core.rulebook.search import CATEGORIES, SearchPage
+from core.logger import app_logger
 from .entity_preview_dialog import EntityPreviewDialog
 
 class UniversalSearchDialog(QDialog):
@@ -16,6 +19,10 @@ class UniversalSearchDialog(QDialog):
 
     :param mode: The initial category to search in ("monster" or "spell"). Defaults to "monster".
     :type mode: str, optional
+    :param preloader: Background loader whose handler the dialog reads from; defaults to
+        ``RulebookPreloader.default``. With one, the dialog opens immediately and fills
+        its list when the category has loaded.
+    :type preloader: RulebookPreloader, optional
     :param args: Additional positional arguments passed to QDialog.
     :param kwargs: Additional keyword arguments passed to QDialog.
 
@@ -37,19 +44,28 @@ class UniversalSearchDialog(QDialog):
     :vartype selected_object: object
     """
 
-    def __init__(self, mode="monster", *args, **kwargs):
+    #: Largest number of ranked results shown for a query.
+    MAX_RESULTS = 200
+
+    def __init__(self, mode="monster", *args, preloader=None, **kwargs):
         """
         Initialize the UniversalSearchDialog.
 
         :param mode: The initial category to search in ("monster" or "spell"). Defaults to "monster".
         :type mode: str, optional
+        :param preloader: Background loader to read the rulebook through.
+        :type preloader: RulebookPreloader, optional
         :param args: Additional positional arguments passed to QDialog.
         :param kwargs: Additional keyword arguments passed to QDialog.
         """
         super().__init__(*args, **kwargs)
         self.setWindowTitle("Search Rulebook")
         self.resize(400, 300)
-        self.importer = RulebookImporter()
+        self.preloader = preloader or RulebookPreloader.default
+        if self.preloader is not None:
+            self.importer = RulebookImporter(api=self.preloader.api)
+        else:
+            self.importer = RulebookImporter()
         self.mode = mode  # default "monster", can be "spell" etc.
 
         self.layout = QVBoxLayout()
@@ -95,7 +111,15 @@ class UniversalSearchDialog(QDialog):
         :type mode: str
         """
         self.mode = mode.lower()
-        self.result_list.clear()
+        category = CATEGORIES.get(self.mode)
+        if self.preloader is not None and category and not self.preloader.is_loaded(category):
+            # show the dialog now and fill it in once the category has loaded
+            self._all_names = []
+            self._show_names(["Loading..."])
+            self.result_list.setEnabled(False)
+            self.preloader.when_loaded([category], lambda: self._on_category_loaded(mode))
+            return
+        self.result_list.setEnabled(True)
 
         if self.mode == "monster":
             results = self.importer.search_monsters()
@@ -104,19 +128,60 @@ class UniversalSearchDialog(QDialog):
         else:
             results = []
 
-        for name in sorted(results):
-            self.result_list.addItem(name)
+        self._all_names = sorted(results)
+        self._show_names(self._all_names)
+        query = self.search_input.text() if hasattr(self, "search_input") else ""
+        if query.strip():
+            self.filter_list(query)
+
+    def _on_category_loaded(self, mode):
+        """
+        Fill the list once a category requested from the preloader has arrived.
+
+        :param mode: The category that was requested.
+        :type mode: str
+        """
+        if mode.lower() == self.mode:
+            self.load_suggestions(mode)
+
+    def _show_names(self, names):
+        """
+        Replace the result list with the given names.
+
+        :param names: Names to display, in order.
+        :type names: list[str]
+        """
+        self.result_list.clear()
+        self.result_list.addItems(names)
 
     def filter_list(self, text):
         """
-        Filter the displayed list of entities based on the search input.
+        Show the entities matching the search input, best match first.
 
-        :param text: The text to filter the list by.
+        The query goes through the rulebook's full-text index, so it matches
+        descriptions and abilities as well as names, tolerates typos, and
+        understands filters such as "CR <= 2 undead". An empty query shows
+        every entity again.
+
+        :param text: The search query.
         :type text: str
         """
-        for i in range(self.result_list.count()):
-            item = self.result_list.item(i)
-            item.setHidden(text.lower() not in item.text().lower())
+        if not text.strip():
+            self._show_names(getattr(self, "_all_names", []))
+            return
+        if self.mode not in ("monster", "spell"):
+            return
+        try:
+            page = self.importer.search(text, kind=self.mode, limit=self.MAX_RESULTS)
+        except Exception as e:
+            app_logger.warning(f"[UniversalSearch] Search failed for {text!r}: {e}")
+            page = None
+        if isinstance(page, SearchPage):
+            self._show_names(page.names())
+        else:
+            # fall back to a plain substring filter if the index is unavailable
+            needle = text.lower()
+            self._show_names([n for n in getattr(self, "_all_names", []) if needle in n.lower()])
 
     def import_selected(self):
         """
@@ -2,8 +2,7 @@ from PyQt5.QtWidgets import (
     QMainWindow, QGraphicsScene, QVBoxLayout, QPushButton, QWidget,
     QMenuBar, QAction, QFileDialog
 )
-from PyQt5.QtCore import Qt, QPointF, QTimer
-import json
+from PyQt5.QtCore import Qt, QPointF, QRectF, QTimer, pyqtSignal
 import math
 from models.tiles.tile_data import TileData
 from models.tiles.square_tile_item import SquareTileItem
@@ -11,8 +10,12 @@ from models.tiles.hex_tile_item import HexTileItem
 from PyQt5.QtWidgets import QUndoStack
 from datetime import datetime
 from core.backup_manager import BackupManager
+from core import map_format
+from core.map_store import MapStore
+from core.save_worker import MapSaveWorker, MapSnapshot
 from core.logger import app_logger
 from pathlib import Path
+from ui.map_loader import MapLoader
 from ui.map_view import MapView
 
 
@@ -45,7 +48,18 @@ class MainWindow(QMainWindow):
     :param grid_type: Type of grid to use ('square' or 'hex').
     :param rows: Number of rows for the grid.
     :param cols: Number of columns for the grid.
+
+    Signals:
+        ``map_load_progress(int, int)`` is emitted with the tiles built so far and the total while a map loads.
+        ``map_loaded(int)`` is emitted with the number of tiles once a map is fully loaded.
     """
+
+    map_load_progress = pyqtSignal(int, int)
+    map_loaded = pyqtSignal(int)
+
+    #: Maps with more tiles than this are built in the background, viewport first.
+    STREAM_MIN_TILES = 4096
+
     def __init__(self, settings, grid_type='square', rows=None, cols=None, *args, **kwargs):
         """
         Initialize the main window.
@@ -66,6 +80,10 @@ class MainWindow(QMainWindow):
         self.backup_manager = BackupManager()
         self.undo_stack = QUndoStack(self)
         self.current_map_path = None
+        self.map_store = None  # MapStore of the file the scene was last loaded from or saved to
+        self.map_loader = None  # MapLoader still filling the scene in, if any
+        self.save_worker = MapSaveWorker(self.backup_manager, self)
+        self.save_worker.failed.connect(self._on_save_failed)
 
         self._auto_save_timer = QTimer(self)
         self._auto_save_timer.timeout.connect(self._auto_save)
@@ -208,38 +226,87 @@ class MainWindow(QMainWindow):
             self.current_map_path = path
             self.save_map_to_file(path)
 
-    def save_map_to_file(self, filename="map.json"):
+    def save_map_to_file(self, filename="map.json", wait=False):
         """
         Save the current map to a JSON file.
 
+        The tiles are copied on the calling (GUI) thread; backing up the old
+        file, encoding and writing happen on :attr:`save_worker`, which
+        reports the outcome with its ``saved`` and ``failed`` signals. Saves
+        requested while an earlier one is still waiting are merged into it.
+
+        When the scene was loaded from or last saved to the same file, only
+        the tiles marked dirty since then are appended to the file's journal
+        (see :class:`core.map_store.MapStore`); otherwise, or when an earlier
+        write of the file failed, the whole map is written.
+
         :param filename: Path to the file where the map will be saved.
+        :param wait: Block until the file is written.
         """
-        map_path = Path(filename)
-        should_backup = map_path.exists()  # Check before overwriting
+        # a save must see every tile, not just those built so far
+        self.finish_loading()
 
-        tile_data_list = [
-            item.tile_data.to_dict()
+        map_path = Path(filename)
+        tiles = [
+            item.tile_data
             for item in self.scene.items()
             if isinstance(item, (SquareTileItem, HexTileItem))
         ]
-
-        full_map_data = {
-            "version": "1.0",
-            "meta": {
-                "author": "Fabio",
-                "created": datetime.now().isoformat()
-            },
-            "tiles": tile_data_list
-        }
-
-        with open(map_path, "w", encoding="utf-8") as f:
-            json.dump(full_map_data, f, indent=2)
-
-        app_logger.info(f"[Saved] Map written to {map_path}")
-
-        # Only backup if this was overwriting a file
-        if should_backup:
-            self.backup_manager.backup_map(map_path)
+        # copies such as the export bundle's temp file leave the map's own file state alone
+        own_file = self.current_map_path is None or Path(self.current_map_path) == map_path
+
+        store = self.map_store
+        if (store is not None and store.path == map_path and store.can_append
+                and not self.save_worker.needs_full_save(map_path)):
+            changed = [td for td in tiles if td.dirty]
+            snapshot = MapSnapshot(map_path, store, [td.to_dict() for td in changed], full=False)
+        else:
+            changed = tiles
+            store = MapStore(map_path)
+            snapshot = MapSnapshot(
+                map_path, store, [td.to_dict() for td in tiles],
+                meta={
+                    "author": "Fabio",
+                    "created": datetime.now().isoformat(),
+                    "grid_type": self.grid_type,
+                },
+            )
+
+        if own_file:
+            # a failed write sends the next save back to a full one (see MapSaveWorker.needs_full_save)
+            self.map_store = store
+            for td in changed:
+                td.mark_clean()
+            snapshot.colors = {tuple(td.position): td.overlay_color for td in tiles}
+            snapshot.summary = {
+                "tiles": len(tiles),
+                "triggers": sum(len(td.triggers) for td in tiles),
+                "entities": sum(len(td.entities) for td in tiles),
+                "rows": max((r + 1 for r, _ in snapshot.colors), default=0),
+                "cols": max((c + 1 for _, c in snapshot.colors), default=0),
+            }
+
+        self.save_worker.submit(snapshot)
+        if wait:
+            self.save_worker.flush()
+
+    def _on_save_failed(self, path, message):
+        """
+        Report a failed save and make the next save of that file a full one.
+
+        :param path: Path of the map file.
+        :param message: Error message.
+        """
+        if self.map_store is not None and self.map_store.path == Path(path):
+            self.map_store = None
+        self.statusBar().showMessage(f"Saving {path} failed: {message}")
+
+    def closeEvent(self, event):
+        """
+        Finish writing queued saves before the window closes.
+        """
+        self.save_worker.flush()
+        super().closeEvent(event)
 
     def select_tile(self, tile_item):
         """
@@ -256,7 +323,7 @@ class MainWindow(QMainWindow):
         """
         Open the trigger editor dialog for the selected tile.
         """
-        from dialogs.trigger_editor.editor_dialog import TriggerEditorDialog
+        from ui.dialogs.trigger_editor.editor_dialog import TriggerEditorDialog
         if self.selected_tile:
             dlg = TriggerEditorDialog(self.selected_tile.tile_data)
             dlg.exec_()
@@ -277,7 +344,7 @@ class MainWindow(QMainWindow):
         should_backup = final_path.exists()
 
         temp_map_path = Path("temp_map.json")
-        self.save_map_to_file(temp_map_path)
+        self.save_map_to_file(temp_map_path, wait=True)
 
         profile_dir = Path("profiles") if Path("profiles").exists() else None
         media_dir = Path("media") if Path("media").exists() else None
@@ -301,7 +368,10 @@ class MainWindow(QMainWindow):
         """
         from models.tiles.tile_data import TileData
 
+        self._cancel_loading()
         self.scene.clear()
+        self.scene.setSceneRect(QRectF())
+        self.map_store = None
         self.grid_type = "square"  # Or use self.settings.get("grid_type", "square")
 
         rows, cols = 15, 15
@@ -335,16 +405,24 @@ class MainWindow(QMainWindow):
         """
         Load a map from a JSON file.
 
+        Small maps are built at once. Maps of more than
+        :attr:`STREAM_MIN_TILES` tiles are built chunk by chunk: the chunks
+        in view right away, the rest in time-sliced batches (see
+        :class:`ui.map_loader.MapLoader`), so the map can be used while it
+        fills in. Progress is reported with :attr:`map_load_progress` and
+        :attr:`map_loaded`.
+
         :param filename: Path to the map file.
         """
-        from models.tiles.tile_data import TileData
-
+        self._cancel_loading()
         self.current_map_path = filename
         self.scene.clear()
+        self.scene.setSceneRect(QRectF())
+        self.map_store = None
 
+        store = MapStore(filename)
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
+            raw_data = store.load()
         except Exception as e:
             app_logger.error(f"[Load Error] Could not read file: {e}")
             return
@@ -354,38 +432,120 @@ class MainWindow(QMainWindow):
 
         meta = raw_data.get("meta", {})
         self.grid_type = meta.get("grid_type", "square")
+        if self.grid_type not in ("square", "hex"):
+            raise ValueError(f"Unsupported grid type: {self.grid_type}")
 
-        tiles = raw_data.get("tiles", [])
-        if not tiles:
-            rows = meta.get("rows", 25)
-            cols = meta.get("cols", 25)
+        total = map_format.tile_count(raw_data)
+        if not total:
+            rows = meta.get("rows") or 25
+            cols = meta.get("cols") or 25
             self.init_grid(rows, cols)
             app_logger.info(f"[Grid Initialized] Empty map loaded with {rows} rows x {cols} cols")
             return
 
-        for td_data in tiles:
+        # the file covers the whole grid, so later saves can journal just the changes
+        self.map_store = store
 
-            tile_data = TileData.from_dict(td_data)
-            row, col = tile_data.position
+        keys = map_format.chunk_keys(raw_data)
+        eager = len(keys)
+        if total > self.STREAM_MIN_TILES:
+            # fix the scene size up front so the view does not jump as tiles arrive
+            rows, cols = map_format.dimensions(raw_data)
+            self.scene.setSceneRect(self._area_rect(0, 0, rows, cols))
+            visible = self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+            keys, eager = self._order_chunks(raw_data, keys, visible)
 
-            if self.grid_type == "square":
-                size = 50
-                x, y = col * size, row * size
-                tile = SquareTileItem(x, y, size, tile_data, self)
+        loader = MapLoader(raw_data, keys, self._add_tile_from_dict, self)
+        loader.progress.connect(self.map_load_progress)
+        loader.finished.connect(lambda count: self._on_map_loaded(loader, filename, count))
+        self.map_loader = loader
+        loader.start(eager)
 
-            elif self.grid_type == "hex":
-                hex_size = 30
-                x, y = hex_tile_center(row, col, hex_size)
-                center = QPointF(x, y)
-                tile = HexTileItem(center, hex_size, tile_data, self)
+    def finish_loading(self):
+        """
+        Build whatever part of the map is still loading, at once.
+        """
+        if self.map_loader is not None:
+            self.map_loader.finish()
 
-            else:
-                raise ValueError(f"Unsupported grid type: {self.grid_type}")
+    def _cancel_loading(self):
+        if self.map_loader is not None:
+            self.map_loader.cancel()
+            self.map_loader.deleteLater()
+            self.map_loader = None
 
-            tile_data.tile_item = tile
-            self.scene.addItem(tile)
+    def _on_map_loaded(self, loader, filename, count):
+        if loader is not self.map_loader:
+            return
+        self.map_loader = None
+        loader.deleteLater()
+        app_logger.info(f"[Loaded] {count} tiles loaded from {filename}")
+        self.map_loaded.emit(count)
+
+    def _add_tile_from_dict(self, td_data):
+        """
+        Create a tile and its item from a serialized tile and add it to the scene.
 
-        app_logger.info(f"[Loaded] {len(tiles)} tiles loaded from {filename}")
+        :param td_data: Tile as from ``TileData.to_dict``.
+        :type td_data: dict
+        """
+        tile_data = TileData.from_dict(td_data)
+        row, col = tile_data.position
+
+        if self.grid_type == "square":
+            size = 50
+            x, y = col * size, row * size
+            tile = SquareTileItem(x, y, size, tile_data, self)
+
+        else:
+            hex_size = 30
+            x, y = hex_tile_center(row, col, hex_size)
+            center = QPointF(x, y)
+            tile = HexTileItem(center, hex_size, tile_data, self)
+
+        tile_data.tile_item = tile
+        self.scene.addItem(tile)
+
+    def _area_rect(self, row, col, end_row, end_col):
+        """
+        Scene rectangle covering the tiles of rows ``row..end_row-1`` and columns ``col..end_col-1``.
+
+        :rtype: QRectF
+        """
+        if self.grid_type == "square":
+            size = 50
+            return QRectF(col * size, row * size, (end_col - col) * size, (end_row - row) * size)
+        hex_size = 30
+        x0, y0 = hex_tile_center(row, col, hex_size)
+        x1, y1 = hex_tile_center(end_row - 1, end_col - 1, hex_size)
+        # odd columns sit half a row lower; pad by a whole tile either way
+        return QRectF(QPointF(x0 - hex_size, y0 - 2 * hex_size),
+                      QPointF(x1 + hex_size, y1 + 2 * hex_size))
+
+    def _order_chunks(self, map_data, keys, visible):
+        """
+        Sort chunks by distance from the visible area.
+
+        :param map_data: Map data in the current format.
+        :param keys: Chunk keys.
+        :param visible: Visible part of the scene.
+        :type visible: QRectF
+        :return: ``(keys, in_view)``: the sorted keys and how many of them intersect `visible`.
+        :rtype: tuple
+        """
+        rows, cols = map_format.dimensions(map_data)
+        size = map_data["chunk_size"]
+        center = visible.center()
+        placed = []
+        for key in keys:
+            chunk_row, chunk_col = (int(part) for part in key.split(","))
+            rect = self._area_rect(chunk_row * size, chunk_col * size,
+                                   min((chunk_row + 1) * size, rows), min((chunk_col + 1) * size, cols))
+            offset = rect.center() - center
+            in_view = rect.intersects(visible)
+            placed.append((not in_view, offset.x() ** 2 + offset.y() ** 2, key))
+        placed.sort()
+        return [key for _, _, key in placed], sum(1 for outside, _, _ in placed if not outside)
 
     def _init_auto_save(self):
         """
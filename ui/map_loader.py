@@ -0,0 +1,106 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from core.map_format import chunk_tiles, tile_count
+
+#: Time spent building tiles per event-loop turn, in milliseconds.
+BATCH_BUDGET_MS = 12
+
+
+class MapLoader(QObject):
+    """
+    Builds the tiles of a map into a scene a chunk at a time.
+
+    Chunks are built in the order given, in batches of about
+    :data:`BATCH_BUDGET_MS` per event-loop turn, so the window stays
+    responsive while a large map fills in. Put the chunks around the
+    viewport first and build them at once with ``start(eager=...)``; the
+    rest follows from a zero-interval ``QTimer``.
+
+    Signals:
+        ``progress(int, int)`` is emitted with the tiles built so far and the total after each batch.
+        ``finished(int)`` is emitted with the number of tiles once every chunk is built.
+
+    :param map_data: Map data in the current format (see :mod:`core.map_format`).
+    :type map_data: dict
+    :param keys: Chunk keys, in the order to build them.
+    :type keys: list[str]
+    :param add_tile: Called with each serialized tile to put it in the scene.
+    :type add_tile: callable
+    :param parent: Optional Qt parent.
+    :type parent: QObject, optional
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+
+    def __init__(self, map_data, keys, add_tile, parent=None):
+        super().__init__(parent)
+        self.map_data = map_data
+        self.add_tile = add_tile
+        self.total = tile_count(map_data)
+        self.loaded = 0
+        self._done = False
+        self._pending = list(reversed(keys))     # popped from the end
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_batch)
+
+    @property
+    def is_running(self):
+        """
+        Whether chunks are still waiting to be built.
+
+        :rtype: bool
+        """
+        return bool(self._pending)
+
+    def start(self, eager=0):
+        """
+        Build the first `eager` chunks now and schedule the rest.
+
+        :param eager: Number of chunks to build before returning.
+        :type eager: int
+        """
+        for _ in range(min(eager, len(self._pending))):
+            self._build_chunk(self._pending.pop())
+        self._report()
+        if self._pending:
+            self._timer.start()
+
+    def finish(self):
+        """
+        Build every remaining chunk now.
+        """
+        if self._done:
+            return
+        while self._pending:
+            self._build_chunk(self._pending.pop())
+        self._report()
+
+    def cancel(self):
+        """
+        Stop building; chunks not built yet are dropped.
+        """
+        self._timer.stop()
+        self._pending.clear()
+        self._done = True
+
+    def _build_chunk(self, key):
+        for tile in chunk_tiles(self.map_data, key):
+            self.add_tile(tile)
+            self.loaded += 1
+
+    def _run_batch(self):
+        deadline = time.perf_counter() + BATCH_BUDGET_MS / 1000
+        while self._pending and time.perf_counter() < deadline:
+            self._build_chunk(self._pending.pop())
+        self._report()
+
+    def _report(self):
+        self.progress.emit(self.loaded, self.total)
+        if not self._pending:
+            self._timer.stop()
+            self._done = True
+            self.finished.emit(self.loaded)
@@ -3,11 +3,14 @@ from PyQt5.QtWidgets import (
     QListWidget, QTextEdit, QFileDialog, QMessageBox, QLabel, QFormLayout, QLineEdit, QDialog, QInputDialog
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
 from pathlib import Path
 import json
 import shutil
 import zipfile
 from core.export_manager import ExportManager
+from core.map_format import build_map
+from core.scenario_catalog import ScenarioCatalog
 from datetime import datetime
 from core.settings_manager import SettingsManager
 from core.logger import AppLogger
@@ -20,6 +23,7 @@ class ScenarioOverviewWidget(QWidget):
         self.map_loader = map_loader
         self.settings_manager = settings_manager
         self.export_manager = ExportManager()
+        self.catalog = ScenarioCatalog(Path("workspace"))
 
         self.init_ui()
 
@@ -51,7 +55,10 @@ class ScenarioOverviewWidget(QWidget):
         # Scenario Info Panel
         self.info_panel = QTextEdit()
         self.info_panel.setReadOnly(True)
+        self.thumbnail_label = QLabel()
+        self.thumbnail_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(QLabel("Scenario Info:"))
+        layout.addWidget(self.thumbnail_label)
         layout.addWidget(self.info_panel)
 
         self.setLayout(layout)
@@ -59,12 +66,9 @@ class ScenarioOverviewWidget(QWidget):
 
     def refresh_scenario_list(self):
         self.scenario_list.clear()
-        workspace = Path("workspace")
-        workspace.mkdir(exist_ok=True)
-
-        for folder in workspace.iterdir():
-            if folder.is_dir() and (folder / "map.json").exists():
-                self.scenario_list.addItem(folder.name)
+        # the catalog only rescans the workspace when a folder was added or removed
+        for name in self.catalog.names():
+            self.scenario_list.addItem(name)
 
     def display_scenario_info(self):
         selected = self.scenario_list.currentItem()
@@ -72,28 +76,33 @@ class ScenarioOverviewWidget(QWidget):
             return
 
         scenario_name = selected.text()
-        path = Path("workspace") / scenario_name / "map.json"
-
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                meta = data.get("meta", {})
-                tiles = data.get("tiles", [])
-                triggers = sum(len(t.get("triggers", [])) for t in tiles)
-
-                info = (
-                    f"Name: {scenario_name}\n"
-                    f"Author: {meta.get('author', 'Unknown')}\n"
-                    f"Created: {meta.get('created', 'Unknown')}\n"
-                    f"Tiles: {len(tiles)}\n"
-                    f"Triggers: {triggers}\n"
-                )
-                self.info_panel.setText(info)
+        try:
+            # read from the catalog; the map is parsed only if it changed since
+            entry = self.catalog.get(scenario_name)
+        except Exception as e:
+            self.thumbnail_label.clear()
+            self.info_panel.setText(f"Failed to load scenario: {e}")
+            return
+        if entry is None:
+            return
 
-            except Exception as e:
-                self.info_panel.setText(f"Failed to load scenario: {e}")
+        size = f"{entry['rows']} x {entry['cols']}" if entry["rows"] and entry["cols"] else "Unknown"
+        info = (
+            f"Name: {scenario_name}\n"
+            f"Author: {entry['author'] or 'Unknown'}\n"
+            f"Created: {entry['created'] or 'Unknown'}\n"
+            f"Tiles: {entry['tiles']}\n"
+            f"Triggers: {entry['triggers']}\n"
+            f"Entities: {entry['entities']}\n"
+            f"Size: {size}\n"
+        )
+        self.info_panel.setText(info)
+
+        pixmap = QPixmap()
+        if entry["thumbnail"] and pixmap.loadFromData(entry["thumbnail"], "PNG"):
+            self.thumbnail_label.setPixmap(pixmap)
+        else:
+            self.thumbnail_label.clear()
 
     def import_scenario(self):
         file, _ = QFileDialog.getOpenFileName(self, "Import Scenario (.zip)", "", "Zip Bundles (*.zip)")
@@ -175,36 +184,16 @@ class ScenarioOverviewWidget(QWidget):
         rows = self.settings_manager.get("default_rows", 25)
         cols = self.settings_manager.get("default_cols", 25)
 
-        tiles = []
-        for row in range(rows):
-            for col in range(cols):
-                tile = {
-                    "tile_id": f"{row}_{col}",
-                    "position": [row, col],
-                    "terrain": "FLOOR",
-                    "tags": [],
-                    "user_label": None,
-                    "note": None,
-                    "overlay_color": None,
-                    "last_updated": None,
-                    "entities": [],
-                    "triggers": []
-                }
-                tiles.append(tile)
-
-        map_data = {
-            "version": "1.0",
-            "meta": {
-                "map_name": name,
-                "author": author,
-                "created": datetime.now().isoformat(),
-                "grid_type": self.settings_manager.get("grid_type", "square"),
-                "rows": rows,
-                "cols": cols
-            },
-            "tiles": tiles,
-            "entities": []
-        }
+        # every tile of a new map is the default tile, so none are stored
+        map_data = build_map([], meta={
+            "map_name": name,
+            "author": author,
+            "created": datetime.now().isoformat(),
+            "grid_type": self.settings_manager.get("grid_type", "square"),
+            "rows": rows,
+            "cols": cols
+        })
+        map_data["entities"] = []
 
         with open(scenario_path / "map.json", "w", encoding="utf-8") as f:
             json.dump(map_data, f, indent=2)
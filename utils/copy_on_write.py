@@ -0,0 +1,111 @@
+import copy
+from types import MappingProxyType
+
+
+class _ListView(tuple):
+    """Read-only stand-in for a shared list; compares equal to lists with the same items."""
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+
+class _Borrowed:
+    """A container still shared with its template; pickles and copies as a private copy."""
+    __slots__ = ("template", "view")
+
+    def __init__(self, template):
+        self.template = template
+        self.view = None
+
+    def __reduce__(self):
+        return (copy.copy, (self.template,))
+
+    def read_only(self):
+        """Get a read-only view of the template, built on first use."""
+        if self.view is None:
+            if isinstance(self.template, dict):
+                self.view = MappingProxyType(self.template)
+            else:
+                self.view = _ListView(self.template)
+        return self.view
+
+
+class CopyOnWrite:
+    """
+    Attribute descriptor for containers that instances may share until they change them.
+
+    The value lives in the instance ``__dict__`` under the attribute's own
+    name, so plain assignment and existing pickles keep working. A value
+    installed with :func:`borrow` is shared with other instances; reading
+    the attribute gives a read-only view of it (a ``MappingProxyType`` for
+    dicts, a tuple for lists), so reads never copy. Code that changes the
+    container in place gets the instance its own shallow copy first with
+    :func:`own`; assigning the attribute simply replaces the shared value.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if type(value) is _Borrowed:
+            return value.read_only()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+def borrow(obj, name, template):
+    """
+    Share `template` as the value of a :class:`CopyOnWrite` attribute of `obj`.
+
+    :param obj: The instance.
+    :type obj: object
+    :param name: Attribute name.
+    :type name: str
+    :param template: Container to share; it must not be changed afterwards.
+    :type template: list or dict
+    """
+    obj.__dict__[name] = _Borrowed(template)
+
+
+def own(obj, name):
+    """
+    Get a :class:`CopyOnWrite` attribute of `obj` for changing in place.
+
+    A shared value is replaced by a private shallow copy first.
+
+    :param obj: The instance.
+    :type obj: object
+    :param name: Attribute name.
+    :type name: str
+    :return: The instance's own container.
+    :rtype: list or dict
+    """
+    value = obj.__dict__[name]
+    if type(value) is _Borrowed:
+        value = obj.__dict__[name] = copy.copy(value.template)
+    return value
+
+
+def is_borrowed(obj, name):
+    """
+    Whether a :class:`CopyOnWrite` attribute of `obj` is still shared.
+
+    :rtype: bool
+    """
+    return type(obj.__dict__.get(name)) is _Borrowed
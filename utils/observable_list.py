@@ -0,0 +1,132 @@
+def _reports_change(method):
+    """Wrap a list mutator so the list's callback hears about the change."""
+    def wrapper(self, *args, **kwargs):
+        snapshot = self._snapshot
+        before = snapshot(self)
+        result = method(self, *args, **kwargs)
+        callback = self._callback
+        if callback is not None:
+            callback(before, snapshot(self))
+        return result
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class ObservableList(list):
+    """
+    A list that calls back after every in-place mutation.
+
+    The callback is called as ``callback(before, after)`` with snapshots of
+    the list's items before and after the change. Snapshots are frozensets
+    by default, so elements must be hashable; pass ``snapshot=tuple`` for
+    lists of unhashable items. Copies, pickles and deep copies are plain
+    lists again.
+
+    :param iterable: Initial items.
+    :type iterable: iterable
+    :param callback: Callable invoked after each mutation.
+    :type callback: callable, optional
+    :param snapshot: Callable turning the list into the value passed to the callback.
+    :type snapshot: callable, optional
+    """
+    __slots__ = ("_callback", "_snapshot")
+
+    def __init__(self, iterable=(), callback=None, snapshot=frozenset):
+        super().__init__(iterable)
+        self._callback = callback
+        self._snapshot = snapshot
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    append = _reports_change(list.append)
+    extend = _reports_change(list.extend)
+    insert = _reports_change(list.insert)
+    remove = _reports_change(list.remove)
+    pop = _reports_change(list.pop)
+    clear = _reports_change(list.clear)
+    sort = _reports_change(list.sort)
+    reverse = _reports_change(list.reverse)
+    __setitem__ = _reports_change(list.__setitem__)
+    __delitem__ = _reports_change(list.__delitem__)
+    __iadd__ = _reports_change(list.__iadd__)
+    __imul__ = _reports_change(list.__imul__)
+
+
+def _reports_delta(kind):
+    """Wrap a list mutator so the list's callback hears what it removed and added."""
+    def decorate(method):
+        def wrapper(self, *args, **kwargs):
+            if kind == "remove":
+                removed = _removed_by(self, method.__name__, args)
+            result = method(self, *args, **kwargs)
+            callback = self._callback
+            if callback is not None:
+                if kind == "append":
+                    added = (args[0],) if method.__name__ == "append" else tuple(self[self._size:])
+                    callback((), added)
+                elif kind == "remove":
+                    callback(removed, ())
+                else:
+                    callback(None, None)
+            self._size = len(self)
+            return result
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+    return decorate
+
+
+def _removed_by(items, name, args):
+    """Items a removing call (remove, pop, clear, del) is about to take out of `items`."""
+    if name == "remove":
+        return (items[items.index(args[0])],) if args[0] in items else ()
+    if name == "pop":
+        index = args[0] if args else -1
+        return (items[index],) if items else ()
+    if name == "clear":
+        return tuple(items)
+    removed = items[args[0]]
+    return tuple(removed) if isinstance(args[0], slice) else (removed,)
+
+
+class DeltaList(list):
+    """
+    A list that reports what each in-place mutation removed and added.
+
+    The callback is called as ``callback(removed, added)`` with tuples of
+    items. Appending calls (``append``, ``extend``, ``+=``) report only the
+    new items and removing calls (``remove``, ``pop``, ``clear``, ``del``)
+    only the removed ones, so both cost no more than the items involved.
+    Calls that reorder or replace items (``insert``, item assignment,
+    ``sort``, ``reverse``, ``*=``) report ``(None, None)``: rebuild from the
+    whole list. Copies, pickles and deep copies are plain lists again.
+
+    :param iterable: Initial items.
+    :type iterable: iterable
+    :param callback: Callable invoked after each mutation.
+    :type callback: callable, optional
+    """
+    __slots__ = ("_callback", "_size")
+
+    def __init__(self, iterable=(), callback=None):
+        super().__init__(iterable)
+        self._callback = callback
+        self._size = len(self)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    append = _reports_delta("append")(list.append)
+    extend = _reports_delta("append")(list.extend)
+    __iadd__ = _reports_delta("append")(list.__iadd__)
+    remove = _reports_delta("remove")(list.remove)
+    pop = _reports_delta("remove")(list.pop)
+    clear = _reports_delta("remove")(list.clear)
+    __delitem__ = _reports_delta("remove")(list.__delitem__)
+    insert = _reports_delta("reorder")(list.insert)
+    sort = _reports_delta("reorder")(list.sort)
+    reverse = _reports_delta("reorder")(list.reverse)
+    __setitem__ = _reports_delta("reorder")(list.__setitem__)
+    __imul__ = _reports_delta("reorder")(list.__imul__)
@@ -0,0 +1,40 @@
+"""
+Migration functions for map files.
+
+Version 1 maps store every tile in a flat ``tiles`` list; version 2 maps
+use the chunked sparse layout of :mod:`core.map_format`.
+"""
+from core.map_format import build_map
+
+
+def migrate_v0_to_v1(data):
+    """
+    Migrate map data from version 0 to version 1.
+
+    Unversioned maps already have the version 1 layout; only the version is set.
+
+    :param dict data: The map data to migrate.
+    :return: The map data with version set to 1.
+    :rtype: dict
+    """
+    data.setdefault("tiles", [])
+    data["version"] = 1
+    return data
+
+
+def migrate_v1_to_v2(data):
+    """
+    Migrate map data from version 1 to version 2.
+
+    Moves the tiles into chunks, keeping only those that differ from the
+    default tile. Grid size comes from ``meta`` when present, else from the
+    tile positions. Other top-level keys are kept.
+
+    :param dict data: The map data to migrate.
+    :return: The migrated map data with version set to 2.
+    :rtype: dict
+    """
+    rest = {k: v for k, v in data.items() if k not in ("version", "meta", "tiles")}
+    migrated = build_map(data.get("tiles", []), data.get("meta", {}))
+    migrated.update(rest)
+    return migrated
@@ -24,6 +24,7 @@ update_registry = {
         0: None,
     },
     "Map": {
-        0: None,
+        0: map_data.migrate_v0_to_v1,
+        1: map_data.migrate_v1_to_v2,
     }
 }